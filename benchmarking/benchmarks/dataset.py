@@ -7,6 +7,7 @@ import os
 import shutil
 import tempfile
 import time
+from contextlib import ExitStack
 from typing import Any, ClassVar
 
 import numpy as np
@@ -16,6 +17,11 @@ from qcodes import ManualParameter
 from qcodes.dataset.experiment_container import new_experiment
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.sqlite.database import initialise_database
+from qcodes.dataset.threading import (
+    InstrumentWorkersParamsCaller,
+    SequentialParamsCaller,
+    ThreadPoolParamsCaller,
+)
 
 
 class Adding5Params:
@@ -132,3 +138,187 @@ class Adding5Params:
         # force writing to database so that it is written before we exit
         # the datasaver context manager
         self.datasaver.flush_data_to_database()
+
+
+class TypedColumns:
+    """
+    This benchmark compares writing and reading numeric data stored in the
+    default ``numeric`` columns with data stored in typed REAL columns.
+    """
+
+    number = 1
+    repeat = 8
+
+    params: ClassVar[list[bool]] = [False, True]
+    param_names: ClassVar[list[str]] = ["typed_columns"]
+
+    timer = time.perf_counter
+
+    n_points = 100_000
+
+    def __init__(self):
+        self.experiment = None
+        self.dataset = None
+        self.tmpdir = None
+
+    def setup(self, typed_columns):
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir, "temp.db")
+        qcodes.config["core"]["db_debug"] = False
+        initialise_database()
+        self.experiment = new_experiment("test-experiment", sample_name="test-sample")
+
+        self.x = ManualParameter("x")
+        self.y = ManualParameter("y")
+        self.x_values = np.linspace(0, 1, self.n_points)
+        self.y_values = np.random.rand(self.n_points)
+        self.y_values[::10] = np.nan
+
+        self.dataset = self._run(typed_columns)
+
+    def _run(self, typed_columns):
+        meas = Measurement(self.experiment)
+        meas.register_parameter(self.x)
+        meas.register_parameter(self.y, setpoints=[self.x])
+        with meas.run(typed_columns=typed_columns) as datasaver:
+            for x, y in zip(self.x_values, self.y_values):
+                datasaver.add_result((self.x, x), (self.y, y))
+        return datasaver.dataset
+
+    def teardown(self, typed_columns):
+        if self.experiment:
+            self.experiment.conn.close()
+            self.experiment = None
+        self.dataset = None
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+    def time_create_run(self, typed_columns):
+        """Creating a run and adding numeric data to it"""
+        self._run(typed_columns)
+
+    def time_read(self, typed_columns):
+        """Reading numeric data back"""
+        assert self.dataset is not None
+        self.dataset.get_parameter_data()
+
+
+class ParamsCallers:
+    """
+    Overhead per point of calling parameters of several instruments.
+    """
+
+    timeout = 60
+    params: ClassVar[list[str]] = [
+        "SequentialParamsCaller",
+        "ThreadPoolParamsCaller",
+        "InstrumentWorkersParamsCaller",
+    ]
+    param_names: ClassVar[list[str]] = ["caller"]
+    n_instruments = 8
+
+    def setup(self, caller_name):
+        from qcodes.instrument import Instrument
+
+        self.instruments = []
+        params = []
+        for i in range(self.n_instruments):
+            instrument = Instrument(f"instrument_{i}")
+            instrument.add_parameter("x", get_cmd=lambda: 1.0)
+            self.instruments.append(instrument)
+            params.append(instrument.x)
+
+        callers = {
+            "SequentialParamsCaller": SequentialParamsCaller,
+            "ThreadPoolParamsCaller": ThreadPoolParamsCaller,
+            "InstrumentWorkersParamsCaller": InstrumentWorkersParamsCaller,
+        }
+        self.caller_cxt = callers[caller_name](*params)
+        self.caller = self.caller_cxt.__enter__()
+
+    def teardown(self, caller_name):
+        self.caller_cxt.__exit__(None, None, None)
+        for instrument in self.instruments:
+            instrument.close()
+
+    def time_call(self, caller_name):
+        """Calling the parameters of all instruments 1000 times"""
+        for _ in range(1000):
+            self.caller()
+
+
+class DondGroups:
+    """
+    Storing the results of a dond that are split into many measurement
+    groups, each of which is written to its own dataset.
+    """
+
+    number = 1
+    repeat = 8
+
+    params: ClassVar[list[int]] = [1, 12]
+    param_names: ClassVar[list[str]] = ["n_groups"]
+
+    timer = time.perf_counter
+
+    n_points = 1000
+
+    def setup(self, n_groups):
+        from qcodes.dataset.dond.do_nd import (
+            _Measurements,
+            _ResultsFanOut,
+            _Sweeper,
+        )
+        from qcodes.dataset.dond.sweeps import LinSweep
+
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir, "temp.db")
+        qcodes.config["core"]["db_debug"] = False
+        initialise_database()
+        self.experiment = new_experiment("test-experiment", sample_name="test-sample")
+
+        x = ManualParameter("x", initial_value=0.0)
+        y = ManualParameter("y", initial_value=0.0)
+        signals = [ManualParameter(f"signal_{i}", initial_value=i) for i in range(24)]
+        sweeper = _Sweeper([LinSweep(x, 0, 1, self.n_points), LinSweep(y, 0, 1, 1)], ())
+        n_per_group = len(signals) // n_groups
+        groups = [
+            signals[i * n_per_group : (i + 1) * n_per_group] for i in range(n_groups)
+        ]
+        measurements = _Measurements(
+            sweeper, "", groups, (), (), self.experiment, None, None
+        )
+        self.stack = ExitStack()
+        self.datasavers = [
+            self.stack.enter_context(group.measurement_cxt.run())
+            for group in measurements.groups
+        ]
+        self.groups = measurements.groups
+        self.fan_out = _ResultsFanOut(self.datasavers, self.groups, ())
+        self.results = [
+            {x: value, y: 0.0, **{signal: signal.cache() for signal in signals}}
+            for value in np.linspace(0, 1, self.n_points)
+        ]
+
+    def teardown(self, n_groups):
+        self.stack.close()
+        self.experiment.conn.close()
+        shutil.rmtree(self.tmpdir)
+
+    def time_fan_out(self, n_groups):
+        """Adding the results of all points with the shared fan-out"""
+        for results in self.results:
+            self.fan_out(results)
+
+    def time_add_result_per_group(self, n_groups):
+        """Filtering and adding the results of all points group by group"""
+        for results in self.results:
+            for datasaver, group in zip(self.datasavers, self.groups):
+                datasaver.add_result(
+                    *(
+                        (param, value)
+                        for param, value in results.items()
+                        if param in group.parameters
+                    )
+                )
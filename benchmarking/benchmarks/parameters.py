@@ -0,0 +1,169 @@
+"""
+This module contains code used for benchmarking the throughput of getting
+and setting parameters, i.e. the overhead that the parameter adds on top of
+the raw get and set functions.
+"""
+
+from typing import Any, ClassVar
+
+import numpy as np
+
+from qcodes.instrument_drivers.mock_instruments import DummyInstrument
+from qcodes.parameters import DelegateParameter, ManualParameter, Parameter
+from qcodes.station import Station
+from qcodes.utils.json_utils import dumps_snapshot
+from qcodes.validators import Numbers
+
+
+class ManualParameterGetSet:
+    """
+    Getting and setting a manual parameter without any transformation.
+    """
+
+    params: ClassVar[list[bool]] = [False, True]
+    param_names: ClassVar[list[str]] = ["with_validator"]
+
+    def setup(self, with_validator: bool) -> None:
+        self.parameter = ManualParameter(
+            "manual",
+            initial_value=0.0,
+            vals=Numbers(-10, 10) if with_validator else None,
+        )
+
+    def time_get(self, with_validator: bool) -> None:
+        self.parameter.get()
+
+    def time_set(self, with_validator: bool) -> None:
+        self.parameter.set(1.0)
+
+
+class ScaledParameterGetSet:
+    """
+    Getting and setting a parameter with a scale and an offset.
+    """
+
+    def setup(self) -> None:
+        self._raw_value = 0.0
+        self.parameter = Parameter(
+            "scaled",
+            get_cmd=self._get_raw,
+            set_cmd=self._set_raw,
+            scale=10,
+            offset=0.5,
+            vals=Numbers(-10, 10),
+        )
+
+    def _get_raw(self) -> float:
+        return self._raw_value
+
+    def _set_raw(self, value: float) -> None:
+        self._raw_value = value
+
+    def time_get(self) -> None:
+        self.parameter.get()
+
+    def time_set(self) -> None:
+        self.parameter.set(1.0)
+
+
+class DelegateParameterChain:
+    """
+    Getting and setting through a chain of delegate parameters, each of
+    which scales the value of its source.
+    """
+
+    params: ClassVar[list[int]] = [1, 3]
+    param_names: ClassVar[list[str]] = ["chain_length"]
+
+    def setup(self, chain_length: int) -> None:
+        source: Parameter = ManualParameter("source", initial_value=0.0)
+        for i in range(chain_length):
+            source = DelegateParameter(f"delegate_{i}", source=source, scale=2)
+        self.parameter = source
+
+    def time_get(self, chain_length: int) -> None:
+        self.parameter.get()
+
+    def time_set(self, chain_length: int) -> None:
+        self.parameter.set(1.0)
+
+
+class CachedParameterGet:
+    """
+    Getting the cached value of a parameter, with and without a maximum
+    age of the cached value.
+    """
+
+    params: ClassVar[list[float | None]] = [None, 3600.0]
+    param_names: ClassVar[list[str]] = ["max_val_age"]
+
+    def setup(self, max_val_age: float | None) -> None:
+        self.parameter = Parameter(
+            "cached", get_cmd=lambda: 0.0, set_cmd=None, max_val_age=max_val_age
+        )
+        self.parameter.get()
+
+    def time_cache_get(self, max_val_age: float | None) -> None:
+        self.parameter.cache.get()
+
+    def time_get(self, max_val_age: float | None) -> None:
+        self.parameter.get()
+
+
+class ArrayParameterTransforms:
+    """
+    Getting an array valued parameter with a scale and an offset or with a
+    value mapping.
+    """
+
+    params: ClassVar[list[list[str] | list[int]]] = [
+        ["scale_offset", "array_scale_offset", "val_mapping"],
+        [1000, 1_000_000],
+    ]
+    param_names: ClassVar[list[str]] = ["transform", "n_points"]
+
+    def setup(self, transform: str, n_points: int) -> None:
+        rng = np.random.default_rng(0)
+        raw: np.ndarray
+        kwargs: dict[str, Any]
+        if transform == "val_mapping":
+            raw = rng.integers(0, 3, n_points)
+            kwargs = {"val_mapping": {"off": 0, "on": 1, "auto": 2}}
+        elif transform == "array_scale_offset":
+            raw = rng.random(n_points)
+            kwargs = {"scale": list(range(1, n_points + 1)), "offset": 0.5}
+        else:
+            raw = rng.random(n_points)
+            kwargs = {"scale": 10, "offset": 0.5}
+        self.parameter = Parameter("array", get_cmd=lambda: raw, set_cmd=None, **kwargs)
+
+    def time_get(self, transform: str, n_points: int) -> None:
+        self.parameter.get()
+
+
+class StationSnapshot:
+    """
+    Snapshotting a station of instruments and encoding the snapshot as JSON
+    as is done when a measurement starts, with and without a changed
+    parameter between the snapshots.
+    """
+
+    params: ClassVar[list[bool]] = [False, True]
+    param_names: ClassVar[list[str]] = ["change_parameter"]
+
+    def setup(self, change_parameter: bool) -> None:
+        self.instruments = [
+            DummyInstrument(f"dummy_{i}", gates=[f"gate_{j}" for j in range(50)])
+            for i in range(20)
+        ]
+        self.station = Station(*self.instruments)
+        dumps_snapshot(self.station.snapshot())
+
+    def teardown(self, change_parameter: bool) -> None:
+        for instrument in self.instruments:
+            instrument.close()
+
+    def time_snapshot(self, change_parameter: bool) -> None:
+        if change_parameter:
+            self.instruments[0].gate_0.set(1.0)
+        dumps_snapshot(self.station.snapshot())
@@ -0,0 +1,51 @@
+"""
+This module contains code used for benchmarking the validation of large
+arrays and sequences of numbers, such as traces that are validated on every
+set and on every get with ``validate_on_get``.
+"""
+
+from typing import Any, ClassVar
+
+import numpy as np
+
+from qcodes.validators import Arrays, Ints, Lists, Numbers
+
+
+class ArraysValidation:
+    """
+    Validating a trace of random floats with an Arrays validator.
+    """
+
+    params: ClassVar[list[Any]] = [[1_000, 10_000_000], [False, True]]
+    param_names: ClassVar[list[str]] = ["n_points", "with_limits"]
+
+    def setup(self, n_points: int, with_limits: bool) -> None:
+        self.trace = np.random.default_rng(0).uniform(-1, 1, n_points)
+        if with_limits:
+            self.validator = Arrays(min_value=-1.0, max_value=1.0, shape=(n_points,))
+        else:
+            self.validator = Arrays(shape=(n_points,))
+
+    def time_validate(self, n_points: int, with_limits: bool) -> None:
+        self.validator.validate(self.trace)
+
+
+class SequenceValidation:
+    """
+    Validating a list of numbers with a Lists validator.
+    """
+
+    params: ClassVar[list[int]] = [10, 100_000]
+    param_names: ClassVar[list[str]] = ["n_points"]
+
+    def setup(self, n_points: int) -> None:
+        self.floats = np.random.default_rng(0).uniform(-1, 1, n_points).tolist()
+        self.ints: list[int | np.integer[Any]] = list(range(n_points))
+        self.floats_validator = Lists(Numbers(-1, 1))
+        self.ints_validator = Lists(Ints(0, n_points))
+
+    def time_validate_floats(self, n_points: int) -> None:
+        self.floats_validator.validate(self.floats)
+
+    def time_validate_ints(self, n_points: int) -> None:
+        self.ints_validator.validate(self.ints)
@@ -22,8 +22,25 @@ from .dond.do_0d import do0d
 from .dond.do_1d import do1d
 from .dond.do_2d import do2d
 from .dond.do_nd import dond
+from .dond.do_nd_async import adond
 from .dond.do_nd_utils import BreakConditionInterrupt
-from .dond.sweeps import AbstractSweep, ArraySweep, LinSweep, LogSweep, TogetherSweep
+from .dond.estimate import (
+    MeasurementTimeEstimate,
+    estimate_do1d,
+    estimate_do2d,
+    estimate_dond,
+)
+from .dond.sweeps import (
+    AbstractSweep,
+    AdaptiveSweep,
+    ArraySweep,
+    BufferedSweep,
+    BufferedSweepBackend,
+    LinSweep,
+    LogSweep,
+    RetraceSweep,
+    TogetherSweep,
+)
 from .experiment_container import (
     experiments,
     load_experiment,
@@ -53,6 +70,7 @@ from .sqlite.database import (
 )
 from .sqlite.settings import SQLiteSettings
 from .threading import (
+    InstrumentWorkersParamsCaller,
     SequentialParamsCaller,
     ThreadPoolParamsCaller,
     call_params_threaded,
@@ -60,22 +78,29 @@ from .threading import (
 
 __all__ = [
     "AbstractSweep",
+    "AdaptiveSweep",
     "ArraySweep",
     "BreakConditionInterrupt",
+    "BufferedSweep",
+    "BufferedSweepBackend",
     "ConnectionPlus",
     "DataSetProtocol",
     "DataSetType",
+    "InstrumentWorkersParamsCaller",
     "InterDependencies_",
     "LinSweep",
     "LogSweep",
     "Measurement",
+    "MeasurementTimeEstimate",
     "ParamSpec",
     "ParamSpecTree",
+    "RetraceSweep",
     "RunDescriber",
     "SQLiteSettings",
     "SequentialParamsCaller",
     "ThreadPoolParamsCaller",
     "TogetherSweep",
+    "adond",
     "call_params_threaded",
     "connect",
     "datasaver_builder",
@@ -85,6 +110,9 @@ __all__ = [
     "do2d",
     "dond",
     "dond_into",
+    "estimate_do1d",
+    "estimate_do2d",
+    "estimate_dond",
     "experiments",
     "extract_runs_into_db",
     "get_data_export_path",
@@ -35,6 +35,7 @@ from qcodes.dataset.export_config import (
 )
 from qcodes.dataset.guids import filter_guids_by_parts, generate_guid, parse_guid
 from qcodes.dataset.linked_datasets.links import Link, links_to_str, str_to_links
+from qcodes.dataset.sqlite.compression import compress_values
 from qcodes.dataset.sqlite.connection import ConnectionPlus, atomic, atomic_transaction
 from qcodes.dataset.sqlite.database import (
     conn_from_dbpath_or_conn,
@@ -47,6 +48,7 @@ from qcodes.dataset.sqlite.queries import (
     _query_guids_from_run_spec,
     add_data_to_dynamic_columns,
     add_parameter,
+    add_snapshot_to_run,
     completed,
     create_run,
     get_completed_timestamp_from_run_id,
@@ -57,6 +59,7 @@ from qcodes.dataset.sqlite.queries import (
     get_metadata_from_run_id,
     get_parameter_data,
     get_parent_dataset_links,
+    get_raw_snapshot_from_run_id,
     get_run_description,
     get_run_timestamp_from_run_id,
     get_runid_from_guid,
@@ -76,9 +79,8 @@ from qcodes.dataset.sqlite.query_helpers import (
     one,
     select_one_where,
 )
-from qcodes.utils import (
-    NumpyJSONEncoder,
-)
+from qcodes.dataset.sqlite.typed_columns import is_typed, mask_nan_values
+from qcodes.utils.json_utils import dumps_snapshot
 
 from .data_set_cache import DataSetCacheWithDBBackend
 from .data_set_in_memory import DataSetInMem, load_from_file
@@ -94,7 +96,7 @@ from .exporters.export_to_xarray import (
     load_to_xarray_dataset,
     xarray_to_h5netcdf_with_complex_numbers,
 )
-from .subscriber import _Subscriber
+from .subscriber import _BatchSubscriber, _rows_to_columns, _Subscriber
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
@@ -103,7 +105,10 @@ if TYPE_CHECKING:
     import xarray as xr
 
     from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
-    from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
+    from qcodes.dataset.descriptions.versioning.rundescribertypes import (
+        Compression,
+        Shapes,
+    )
     from qcodes.parameters import ParameterBase
 
 
@@ -145,13 +150,27 @@ class _BackgroundWriter(Thread):
             elif item["keys"] == "finalize":
                 _WRITERS[self.path].active_datasets.remove(item["values"])
             else:
-                self.write_results(item["keys"], item["values"], item["table_name"])
+                self.write_results(
+                    item["keys"],
+                    item["values"],
+                    item["table_name"],
+                    item.get("compression"),
+                    item.get("typed_names", ()),
+                )
             self.queue.task_done()
 
     def write_results(
-        self, keys: Sequence[str], values: Sequence[list[Any]], table_name: str
+        self,
+        keys: Sequence[str],
+        values: Sequence[list[Any]],
+        table_name: str,
+        compression: Compression | None = None,
+        typed_names: Sequence[str] = (),
     ) -> None:
-        insert_many_values(self.conn, table_name, keys, values)
+        insert_keys, insert_values = _encode_results(
+            keys, values, compression, typed_names
+        )
+        insert_many_values(self.conn, table_name, insert_keys, insert_values)
 
     def shutdown(self) -> None:
         """
@@ -177,6 +196,24 @@ class _WriterStatus:
 _WRITERS: dict[str, _WriterStatus] = {}
 
 
+def _encode_results(
+    keys: Sequence[str],
+    values: Sequence[Sequence[Any]],
+    compression: Compression | None,
+    typed_names: Sequence[str],
+) -> tuple[list[str], Sequence[Sequence[Any]]]:
+    """
+    Convert rows of results into the form in which they are stored in the
+    results table, i.e. compress array values and mask NaN values of
+    parameters stored in typed columns.
+    """
+    if compression:
+        values = compress_values(keys, values, compression)
+    if typed_names:
+        return mask_nan_values(keys, values, typed_names)
+    return list(keys), values
+
+
 class DataSet(BaseDataSet):
     # the "persistent traits" are the attributes/properties of the DataSet
     # that are NOT tied to the representation of the DataSet in any particular
@@ -251,12 +288,13 @@ class DataSet(BaseDataSet):
         self.conn = conn_from_dbpath_or_conn(conn, path_to_db)
 
         self._debug = False
-        self.subscribers: dict[str, _Subscriber] = {}
+        self.subscribers: dict[str, _Subscriber | _BatchSubscriber] = {}
         self._parent_dataset_links: list[Link]
         #: In memory representation of the data in the dataset.
         self._cache: DataSetCacheWithDBBackend = DataSetCacheWithDBBackend(self)
         self._results: list[dict[str, VALUE]] = []
         self._in_memory_cache = in_memory_cache
+        self._table_name: str | None = None
 
         if run_id is not None:
             if not run_exists(self.conn, run_id):
@@ -283,7 +321,7 @@ class DataSet(BaseDataSet):
             if exp_id is None:
                 exp_id = get_default_experiment_id(self.conn)
             name = name or "dataset"
-            _, run_id, __ = create_run(
+            _, run_id, table_name = create_run(
                 self.conn,
                 exp_id,
                 name,
@@ -294,6 +332,7 @@ class DataSet(BaseDataSet):
             )
             # this is really the UUID (an ever increasing count in the db)
             self._run_id = run_id
+            self._table_name = table_name
             self._completed = False
             self._started = False
 
@@ -328,13 +367,15 @@ class DataSet(BaseDataSet):
         shapes: Shapes | None = None,
         parent_datasets: Sequence[Mapping[Any, Any]] = (),
         write_in_background: bool = False,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None:
-        self.add_snapshot(json.dumps(snapshot, cls=NumpyJSONEncoder))
+        self.add_snapshot(dumps_snapshot(snapshot))
 
         if interdeps == InterDependencies_():
             raise RuntimeError("No parameters supplied")
 
-        self.set_interdependencies(interdeps, shapes)
+        self.set_interdependencies(interdeps, shapes, compression, typed_columns)
         links = [Link(head=self.guid, **pdict) for pdict in parent_datasets]
         self.parent_dataset_links = links
         self.mark_started(start_bg_writer=write_in_background)
@@ -367,11 +408,14 @@ class DataSet(BaseDataSet):
 
     @property
     def table_name(self) -> str:
-        table_name = select_one_where(
-            self.conn, "runs", "result_table_name", "run_id", self.run_id
-        )
-        assert isinstance(table_name, str)
-        return table_name
+        # the results table of a run never changes so only look it up once
+        if self._table_name is None:
+            table_name = select_one_where(
+                self.conn, "runs", "result_table_name", "run_id", self.run_id
+            )
+            assert isinstance(table_name, str)
+            self._table_name = table_name
+        return self._table_name
 
     @property
     def guid(self) -> str:
@@ -391,11 +435,7 @@ class DataSet(BaseDataSet):
     @property
     def _snapshot_raw(self) -> str | None:
         """Snapshot of the run as a JSON-formatted string (or None)"""
-        snapshot_raw = select_one_where(
-            self.conn, "runs", "snapshot", "run_id", self.run_id
-        )
-        assert isinstance(snapshot_raw, (str, type(None)))
-        return snapshot_raw
+        return get_raw_snapshot_from_run_id(self.conn, self.run_id)
 
     @property
     def snapshot_raw(self) -> str | None:
@@ -549,13 +589,19 @@ class DataSet(BaseDataSet):
         self.conn = connect(path_to_db, self._debug)
 
     def set_interdependencies(
-        self, interdeps: InterDependencies_, shapes: Shapes | None = None
+        self,
+        interdeps: InterDependencies_,
+        shapes: Shapes | None = None,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None:
         """
         Set the interdependencies object (which holds all added
         parameters and their relationships) of this dataset and
         optionally the shapes object that holds information about
-        the shape of the data to be measured.
+        the shape of the data to be measured, the compression
+        to use for storing array parameters and whether numeric
+        parameters are stored in typed REAL columns.
         """
         if not isinstance(interdeps, InterDependencies_):
             raise TypeError(
@@ -565,7 +611,12 @@ class DataSet(BaseDataSet):
         if not self.pristine:
             mssg = "Can not set interdependencies on a DataSet that has been started."
             raise RuntimeError(mssg)
-        self._rundescriber = RunDescriber(interdeps, shapes=shapes)
+        self._rundescriber = RunDescriber(
+            interdeps,
+            shapes=shapes,
+            compression=compression,
+            typed_columns=typed_columns,
+        )
 
     def add_metadata(self, tag: str, metadata: Any) -> None:
         """
@@ -598,14 +649,21 @@ class DataSet(BaseDataSet):
 
         """
         if self.snapshot is None or overwrite:
-            with atomic(self.conn) as conn:
-                add_data_to_dynamic_columns(conn, self.run_id, {"snapshot": snapshot})
+            add_snapshot_to_run(self.conn, self.run_id, snapshot)
         elif self.snapshot is not None and not overwrite:
             log.warning(
                 "This dataset already has a snapshot. Use overwrite"
                 "=True to overwrite that"
             )
 
+    @property
+    def _typed_column_names(self) -> tuple[str, ...]:
+        return tuple(
+            ps.name
+            for ps in self._rundescriber.interdeps.paramspecs
+            if is_typed(ps, self._rundescriber.typed_columns)
+        )
+
     @property
     def pristine(self) -> bool:
         """
@@ -669,7 +727,11 @@ class DataSet(BaseDataSet):
 
         for spec in paramspecs:
             add_parameter(
-                spec, conn=self.conn, run_id=self.run_id, insert_into_results_table=True
+                spec,
+                conn=self.conn,
+                run_id=self.run_id,
+                insert_into_results_table=True,
+                typed_columns=self._rundescriber.typed_columns,
             )
 
         desc_str = serial.to_json_for_storage(self.description)
@@ -759,10 +821,34 @@ class DataSet(BaseDataSet):
                 "keys": list(expected_keys),
                 "values": values,
                 "table_name": self.table_name,
+                "compression": self._rundescriber.compression,
+                "typed_names": self._typed_column_names,
             }
             writer_status.data_write_queue.put(item)
         else:
-            insert_many_values(self.conn, self.table_name, list(expected_keys), values)
+            insert_keys, insert_values = _encode_results(
+                list(expected_keys),
+                values,
+                self._rundescriber.compression,
+                self._typed_column_names,
+            )
+            insert_many_values(self.conn, self.table_name, insert_keys, insert_values)
+
+        self._push_to_batch_subscribers(list(expected_keys), values)
+
+    def _push_to_batch_subscribers(
+        self, keys: Sequence[str], values: Sequence[Sequence[VALUE]]
+    ) -> None:
+        batch_subscribers = [
+            sub
+            for sub in self.subscribers.values()
+            if isinstance(sub, _BatchSubscriber)
+        ]
+        if not batch_subscribers:
+            return
+        columns = _rows_to_columns(keys, values)
+        for sub in batch_subscribers:
+            sub.put_batch(columns, len(values))
 
     def _raise_if_not_writable(self) -> None:
         if self.pristine:
@@ -1133,11 +1219,53 @@ class DataSet(BaseDataSet):
         min_count: int = 1,
         state: Any | None = None,
         callback_kwargs: Mapping[str, Any] | None = None,
+        batched: bool = False,
     ) -> str:
+        """
+        Subscribe a callback to the results added to this :class:`.DataSet`.
+
+        Args:
+            callback: A function taking three positional arguments: the new
+                results, the number of rows in the dataset and the state.
+            min_wait: Time in milliseconds to wait between calls to the
+                callback.
+            min_count: Minimal number of new rows before the callback is
+                called.
+            state: A mutable object holding the state of the subscriber.
+            callback_kwargs: Extra keyword arguments passed to the callback.
+            batched: If False (default), the subscriber is notified through
+                an SQLite trigger and the callback receives a list of row
+                tuples. If True, no trigger is installed. The dataset pushes
+                every batch of results it writes to the subscriber, and the
+                callback receives a dict mapping parameter names to numpy
+                column arrays of all rows since the last call.
+
+        Returns:
+            The id of the subscriber.
+
+        """
         subscriber_id = uuid.uuid4().hex
-        subscriber = _Subscriber(
-            self, subscriber_id, callback, state, min_wait, min_count, callback_kwargs
-        )
+        subscriber: _Subscriber | _BatchSubscriber
+        if batched:
+            subscriber = _BatchSubscriber(
+                self,
+                subscriber_id,
+                callback,
+                state,
+                min_wait,
+                min_count,
+                callback_kwargs,
+            )
+        else:
+            subscriber = _Subscriber(
+                self,
+                subscriber_id,
+                callback,
+                state,
+                min_wait,
+                min_count,
+                callback_kwargs,
+            )
         self.subscribers[subscriber_id] = subscriber
         subscriber.start()
         return subscriber_id
@@ -1182,7 +1310,8 @@ class DataSet(BaseDataSet):
         """
         with atomic(self.conn) as conn:
             sub = self.subscribers[uuid]
-            remove_trigger(conn, sub.trigger_id)
+            if isinstance(sub, _Subscriber):
+                remove_trigger(conn, sub.trigger_id)
             sub.schedule_stop()
             sub.join()
             del self.subscribers[uuid]
@@ -362,6 +362,9 @@ def _create_new_data_dict(
     new_values: np.ndarray, shape: tuple[int, ...] | None
 ) -> tuple[np.ndarray, int]:
     if shape is None:
+        if not new_values.flags.writeable:
+            # broadcast views must not end up as the cached data
+            new_values = new_values.copy()
         return new_values, new_values.size
     elif new_values.size > 0:
         n_values = new_values.size
@@ -439,8 +442,8 @@ def _expand_single_param_dict(
             expanded_param_dict[name] = array
         else:
             assert array.size == 1
-            expanded_param_dict[name] = np.full_like(
-                single_param_dict[max_names[0]], array.ravel()[0], dtype=array.dtype
+            expanded_param_dict[name] = np.broadcast_to(
+                array.ravel()[:1], single_param_dict[max_names[0]].shape
             )
 
     return expanded_param_dict
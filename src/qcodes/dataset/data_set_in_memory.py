@@ -29,6 +29,7 @@ from qcodes.dataset.sqlite.queries import (
     RUNS_TABLE_COLUMNS,
     add_data_to_dynamic_columns,
     add_parameter,
+    add_snapshot_to_run,
     create_run,
     get_experiment_name_from_experiment_id,
     get_raw_run_attributes,
@@ -39,7 +40,7 @@ from qcodes.dataset.sqlite.queries import (
     update_parent_datasets,
     update_run_description,
 )
-from qcodes.utils import NumpyJSONEncoder
+from qcodes.utils.json_utils import dumps_snapshot
 
 from .data_set_cache import DataSetCacheDeferred, DataSetCacheInMem
 from .dataset_helpers import _add_run_to_runs_table
@@ -55,7 +56,10 @@ if TYPE_CHECKING:
     import xarray as xr
 
     from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
-    from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
+    from qcodes.dataset.descriptions.versioning.rundescribertypes import (
+        Compression,
+        Shapes,
+    )
 
     from ..parameters import ParameterBase
 
@@ -417,16 +421,22 @@ class DataSetInMem(BaseDataSet):
         shapes: Shapes | None = None,
         parent_datasets: Sequence[Mapping[Any, Any]] = (),
         write_in_background: bool = False,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None:
         if not self.pristine:
             raise RuntimeError("Cannot prepare a dataset that is not pristine.")
+        if compression is not None:
+            raise ValueError(
+                "DataSetInMem does not support compression of array parameters."
+            )
 
-        self.add_snapshot(json.dumps(snapshot, cls=NumpyJSONEncoder))
+        self.add_snapshot(dumps_snapshot(snapshot))
 
         if interdeps == InterDependencies_():
             raise RuntimeError("No parameters supplied")
 
-        self._set_interdependencies(interdeps, shapes)
+        self._set_interdependencies(interdeps, shapes, compression, typed_columns)
         links = [Link(head=self.guid, **pdict) for pdict in parent_datasets]
         self._set_parent_dataset_links(links)
 
@@ -564,7 +574,11 @@ class DataSetInMem(BaseDataSet):
 
         """
         if self.snapshot is None or overwrite:
-            self._add_to_dyn_column_if_in_db("snapshot", snapshot)
+            if self._dataset_is_in_runs_table():
+                with contextlib.closing(
+                    conn_from_dbpath_or_conn(conn=None, path_to_db=self._path_to_db)
+                ) as conn:
+                    add_snapshot_to_run(conn, self.run_id, snapshot)
             self._snapshot_raw_data = snapshot
         elif self.snapshot is not None and not overwrite:
             log.warning(
@@ -719,13 +733,19 @@ class DataSetInMem(BaseDataSet):
         self._parent_dataset_links = links
 
     def _set_interdependencies(
-        self, interdeps: InterDependencies_, shapes: Shapes | None = None
+        self,
+        interdeps: InterDependencies_,
+        shapes: Shapes | None = None,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None:
         """
         Set the interdependencies object (which holds all added
         parameters and their relationships) of this dataset and
         optionally the shapes object that holds information about
-        the shape of the data to be measured.
+        the shape of the data to be measured, the compression
+        to use for storing array parameters and whether numeric
+        parameters are stored in typed REAL columns.
         """
         if not isinstance(interdeps, InterDependencies_):
             raise TypeError(
@@ -735,7 +755,12 @@ class DataSetInMem(BaseDataSet):
         if not self.pristine:
             mssg = "Can not set interdependencies on a DataSet that has been started."
             raise RuntimeError(mssg)
-        self._rundescriber = RunDescriber(interdeps, shapes=shapes)
+        self._rundescriber = RunDescriber(
+            interdeps,
+            shapes=shapes,
+            compression=compression,
+            typed_columns=typed_columns,
+        )
 
     def _get_paramspecs(self) -> SPECS:
         old_interdeps = new_to_old(self.description.interdeps)
@@ -30,6 +30,7 @@ from qcodes.dataset.export_config import (
 from .descriptions.versioning.converters import new_to_old
 from .exporters.export_to_csv import dataframe_to_csv
 from .exporters.export_to_xarray import xarray_to_h5netcdf_with_complex_numbers
+from .live_stream import LiveStream
 from .sqlite.queries import raw_time_to_str_time
 
 if TYPE_CHECKING:
@@ -39,7 +40,10 @@ if TYPE_CHECKING:
     import xarray as xr
 
     from qcodes.dataset.descriptions.rundescriber import RunDescriber
-    from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
+    from qcodes.dataset.descriptions.versioning.rundescribertypes import (
+        Compression,
+        Shapes,
+    )
     from qcodes.dataset.linked_datasets.links import Link
     from qcodes.parameters import ParameterBase
 
@@ -101,6 +105,8 @@ class DataSetProtocol(Protocol):
         shapes: Shapes | None = None,
         parent_datasets: Sequence[Mapping[Any, Any]] = (),
         write_in_background: bool = False,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None: ...
 
     @property
@@ -263,6 +269,8 @@ class DataSetProtocol(Protocol):
 
     def the_same_dataset_as(self, other: DataSetProtocol) -> bool: ...
 
+    def live_stream(self, timeout: float | None = None) -> LiveStream: ...
+
 
 class BaseDataSet(DataSetProtocol, Protocol):
     # shared methods between all implementations of the dataset
@@ -532,6 +540,23 @@ class BaseDataSet(DataSetProtocol, Protocol):
         """
         return tuple(self.description.interdeps.dependencies.keys())
 
+    def live_stream(self, timeout: float | None = None) -> LiveStream:
+        """
+        Connect to the live stream of this dataset. This requires the
+        measurement producing the dataset to run with ``live_stream=True``,
+        possibly in another process on the same machine.
+
+        Args:
+            timeout: Time in seconds to wait for new data before iteration
+                raises a ``TimeoutError``. None means wait forever.
+
+        Returns:
+            A :class:`.LiveStream` yielding the blocks of results as they
+            are flushed by the measurement.
+
+        """
+        return LiveStream(self.guid, timeout=timeout)
+
 
 class DataSetType(str, Enum):
     DataSet = "DataSet"
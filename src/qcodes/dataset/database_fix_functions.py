@@ -20,6 +20,7 @@ from qcodes.dataset.sqlite.db_upgrades.version import get_user_version
 from qcodes.dataset.sqlite.queries import (
     _get_parameters,
     _update_run_description,
+    add_snapshot_to_run,
     get_run_description,
     update_run_description,
 )
@@ -169,3 +170,51 @@ def fix_wrong_run_descriptions(conn: ConnectionPlus, run_ids: Sequence[int]) ->
             )
             update_run_description(conn, run_id, trusted_json)
             log.info(f"    Run id: {run_id} has been updated.")
+
+
+def deduplicate_snapshots(conn: ConnectionPlus, vacuum: bool = True) -> dict[str, int]:
+    """
+    Move the snapshots of all runs that are stored in the ``snapshot`` column
+    of the runs table to the content addressed snapshots table, such that
+    the parts of the snapshots that are the same for several runs are only
+    stored once. See :mod:`qcodes.dataset.sqlite.snapshot_store` for the
+    storage format. The snapshots of the runs are read as before. After the
+    first call, this function is idempotent.
+
+    To also store the snapshots of new runs this way, set
+    ``qcodes.config.dataset.deduplicate_snapshots`` to True.
+
+    Args:
+        conn: The connection to the database
+        vacuum: Rebuild the database file after moving the snapshots to
+            release the space that the moved snapshots took up.
+
+    Returns:
+        A dict with the results ('runs_inspected', 'runs_deduplicated')
+
+    """
+    cursor = atomic_transaction(
+        conn, "SELECT run_id FROM runs WHERE snapshot IS NOT NULL ORDER BY run_id"
+    )
+    run_ids = [row[0] for row in cursor.fetchall()]
+
+    runs_deduplicated = 0
+    with atomic(conn) as atomic_conn:
+        pbar = tqdm(run_ids)
+        pbar.set_description("Deduplicating snapshots")
+        for run_id in pbar:
+            snapshot_raw = select_one_where(
+                atomic_conn, "runs", "snapshot", "run_id", run_id
+            )
+            assert isinstance(snapshot_raw, str)
+            add_snapshot_to_run(atomic_conn, run_id, snapshot_raw, deduplicate=True)
+            if (
+                select_one_where(atomic_conn, "runs", "snapshot", "run_id", run_id)
+                is None
+            ):
+                runs_deduplicated += 1
+
+    if vacuum:
+        conn.execute("VACUUM")
+
+    return {"runs_inspected": len(run_ids), "runs_deduplicated": runs_deduplicated}
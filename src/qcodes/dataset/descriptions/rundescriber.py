@@ -6,6 +6,7 @@ from qcodes.dataset.descriptions.dependencies import InterDependencies_
 
 from .versioning.converters import new_to_old, old_to_new
 from .versioning.rundescribertypes import (
+    Compression,
     RunDescriberDicts,
     RunDescriberV0Dict,
     RunDescriberV1Dict,
@@ -30,7 +31,11 @@ class RunDescriber:
     """
 
     def __init__(
-        self, interdeps: InterDependencies_, shapes: Shapes | None = None
+        self,
+        interdeps: InterDependencies_,
+        shapes: Shapes | None = None,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None:
         if not isinstance(interdeps, InterDependencies_):
             raise ValueError(
@@ -42,6 +47,8 @@ class RunDescriber:
         self._interdeps = interdeps
 
         self._shapes = shapes
+        self._compression = compression
+        self._typed_columns = typed_columns
         self._version = 3
 
     @property
@@ -56,6 +63,22 @@ class RunDescriber:
     def interdeps(self) -> InterDependencies_:
         return self._interdeps
 
+    @property
+    def compression(self) -> Compression | None:
+        """
+        Mapping from parameter name to the codec used to compress the data
+        of that parameter in the database. None if no data is compressed.
+        """
+        return self._compression
+
+    @property
+    def typed_columns(self) -> bool:
+        """
+        True if numeric parameters are stored in typed REAL columns of the
+        results table with NaN stored as NULL.
+        """
+        return self._typed_columns
+
     def _to_dict(self) -> RunDescriberV3Dict:
         """
         Convert this object into a dictionary. This method is intended to
@@ -67,6 +90,10 @@ class RunDescriber:
             "interdependencies_": self.interdeps._to_dict(),
             "shapes": self.shapes,
         }
+        if self.compression is not None:
+            ser["compression"] = self.compression
+        if self.typed_columns:
+            ser["typed_columns"] = True
 
         return ser
 
@@ -92,6 +119,8 @@ class RunDescriber:
             rundesc = cls(
                 InterDependencies_._from_dict(ser["interdependencies_"]),
                 shapes=ser["shapes"],
+                compression=ser.get("compression"),
+                typed_columns=ser.get("typed_columns", False),
             )
         else:
             raise RuntimeError(
@@ -107,6 +136,10 @@ class RunDescriber:
             return False
         if self.shapes != other.shapes:
             return False
+        if self.compression != other.compression:
+            return False
+        if self.typed_columns != other.typed_columns:
+            return False
         return True
 
     def __repr__(self) -> str:
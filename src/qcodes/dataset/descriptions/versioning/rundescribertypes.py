@@ -12,13 +12,18 @@ instance of InterDependencies_ (which contains ParamSpecBases)
 instance of InterDependencies (which contains ParamSpecs) and
 interdependencies_, which is an instance of InterDependencies_
 (which contains ParamSpecBases)
+- 3: The run_describer has an additional attribute, shapes. Optionally the
+serialization contains compression, a mapping from parameter name to the
+codec used to compress its data. It is omitted if no data is compressed.
+Optionally the serialization contains typed_columns, which is True if numeric
+parameters are stored in typed REAL columns. It is omitted if False.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 if TYPE_CHECKING:
     from ..param_spec import ParamSpecBaseDict, ParamSpecDict
@@ -37,6 +42,9 @@ class InterDependencies_Dict(TypedDict):
 
 Shapes = dict[str, tuple[int, ...]]
 
+Compression = dict[str, str]
+# dict from parameter name to the name of the codec used to compress its data
+
 
 class RunDescriberV0Dict(TypedDict):
     version: int
@@ -55,6 +63,8 @@ class RunDescriberV2Dict(RunDescriberV0Dict):
 class RunDescriberV3Dict(RunDescriberV2Dict):
     shapes: Shapes | None
     # dict from dependent to dict from dependency to num points in grid
+    compression: NotRequired[Compression]
+    typed_columns: NotRequired[bool]
 
 
 RunDescriberDicts = (
@@ -21,8 +21,8 @@ from qcodes.dataset.dond.do_nd_utils import (
 )
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.threading import (
+    InstrumentWorkersParamsCaller,
     SequentialParamsCaller,
-    ThreadPoolParamsCaller,
     process_params_meas,
 )
 from qcodes.parameters import ParameterBase
@@ -143,7 +143,7 @@ def do1d(
         use_threads = config.dataset.use_threads
 
     param_meas_caller = (
-        ThreadPoolParamsCaller(*param_meas)
+        InstrumentWorkersParamsCaller(*param_meas)
         if use_threads
         else SequentialParamsCaller(*param_meas)
     )
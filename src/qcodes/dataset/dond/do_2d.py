@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import sys
 import time
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import numpy as np
 from opentelemetry import trace
@@ -19,10 +19,14 @@ from qcodes.dataset.dond.do_nd_utils import (
     _set_write_period,
     catch_interrupts,
 )
+from qcodes.dataset.dond.sweep_order import (
+    _choose_traversal,
+    _report_set_time_estimate,
+)
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.threading import (
+    InstrumentWorkersParamsCaller,
     SequentialParamsCaller,
-    ThreadPoolParamsCaller,
     process_params_meas,
 )
 from qcodes.parameters import ParameterBase
@@ -72,6 +76,7 @@ def do2d(
     show_progress: bool | None = None,
     log_info: str | None = None,
     break_condition: BreakConditionT | None = None,
+    order: Literal["row_major", "snake"] = "row_major",
 ) -> AxesTupleListWithDataSet:
     """
     Perform a 1D scan of ``param_set1`` from ``start1`` to ``stop1`` in
@@ -122,12 +127,24 @@ def do2d(
             message is used.
         break_condition: Callable that takes no arguments. If returned True,
             measurement is interrupted.
+        order: If ``"snake"``, every other run of the inner loop sweeps
+            ``param_set2`` from ``stop2`` to ``start2``, which avoids ramping
+            it back to ``start2`` for every run of the inner loop. With
+            ``set_before_sweep`` the inner parameter is then set to the first
+            setpoint of the next run. The estimated time saved is logged
+            before the measurement starts. The results of the backward runs
+            are stored in the order of the setpoints once the run is
+            complete.
 
     Returns:
         The QCoDeS dataset.
 
     """
 
+    if order not in ("row_major", "snake"):
+        raise ValueError(
+            f"Invalid sweep order {order!r}, expected 'row_major' or 'snake'."
+        )
     if do_plot is None:
         do_plot = cast(bool, config.dataset.dond_plot)
     if show_progress is None:
@@ -168,7 +185,7 @@ def do2d(
         use_threads = config.dataset.use_threads
 
     param_meas_caller = (
-        ThreadPoolParamsCaller(*param_meas)
+        InstrumentWorkersParamsCaller(*param_meas)
         if use_threads
         else SequentialParamsCaller(*param_meas)
     )
@@ -181,9 +198,23 @@ def do2d(
         dataset = datasaver.dataset
         additional_setpoints_data = process_params_meas(additional_setpoints)
         setpoints1 = np.linspace(start1, stop1, num_points1)
-        for set_point1 in tqdm(setpoints1, disable=not show_progress):
+        setpoints2 = np.linspace(start2, stop2, num_points2)
+        if order == "snake":
+            _report_set_time_estimate(
+                _choose_traversal(
+                    [
+                        [(param_set1, setpoints1, delay1)],
+                        [(param_set2, setpoints2, delay2)],
+                    ],
+                    order,
+                ),
+                (param_set1.full_name, param_set2.full_name),
+            )
+        for row, set_point1 in enumerate(tqdm(setpoints1, disable=not show_progress)):
+            backward = order == "snake" and row % 2 == 1
+            row_setpoints2 = setpoints2[::-1] if backward else setpoints2
             if set_before_sweep:
-                param_set2.set(start2)
+                param_set2.set(row_setpoints2[0])
 
             param_set1.set(set_point1)
 
@@ -192,30 +223,39 @@ def do2d(
 
             time.sleep(delay1)
 
-            setpoints2 = np.linspace(start2, stop2, num_points2)
-
             # flush to prevent unflushed print's to visually interrupt tqdm bar
             # updates
             sys.stdout.flush()
             sys.stderr.flush()
-            for set_point2 in tqdm(setpoints2, disable=not show_progress, leave=False):
-                # skip first inner set point if `set_before_sweep`
-                if set_point2 == start2 and set_before_sweep:
-                    pass
-                else:
-                    param_set2.set(set_point2)
-                    time.sleep(delay2)
-
-                datasaver.add_result(
-                    (param_set1, set_point1),
-                    (param_set2, set_point2),
-                    *call_param_meas(),
-                    *additional_setpoints_data,
-                )
-
-                if callable(break_condition):
-                    if break_condition():
-                        raise BreakConditionInterrupt("Break condition was met.")
+            backward_results: list[tuple[tuple[ParameterBase, Any], ...]] = []
+            try:
+                for set_point2 in tqdm(
+                    row_setpoints2, disable=not show_progress, leave=False
+                ):
+                    # skip first inner set point if `set_before_sweep`
+                    if set_point2 == row_setpoints2[0] and set_before_sweep:
+                        pass
+                    else:
+                        param_set2.set(set_point2)
+                        time.sleep(delay2)
+
+                    results = (
+                        (param_set1, set_point1),
+                        (param_set2, set_point2),
+                        *call_param_meas(),
+                        *additional_setpoints_data,
+                    )
+                    if backward:
+                        backward_results.append(results)
+                    else:
+                        datasaver.add_result(*results)
+
+                    if callable(break_condition):
+                        if break_condition():
+                            raise BreakConditionInterrupt("Break condition was met.")
+            finally:
+                for results in reversed(backward_results):
+                    datasaver.add_result(*results)
 
             for action in after_inner_actions:
                 action()
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import itertools
 import logging
+import threading
 import time
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import ExitStack
 from dataclasses import dataclass
+from queue import Full, Queue
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 import numpy as np
@@ -25,17 +27,36 @@ from qcodes.dataset.dond.do_nd_utils import (
 )
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.threading import (
+    InstrumentWorkersParamsCaller,
     SequentialParamsCaller,
-    ThreadPoolParamsCaller,
     process_params_meas,
 )
 from qcodes.parameters import ParameterBase
 
-from .sweeps import AbstractSweep, TogetherSweep
+from .sweep_order import (
+    SweepOrder,
+    _choose_traversal,
+    _GridOrderBuffer,
+    _report_set_time_estimate,
+    _Traversal,
+)
+from .sweeps import (
+    AbstractSweep,
+    AdaptiveSweep,
+    BufferedSweep,
+    RetraceSweep,
+    TogetherSweep,
+)
 
 LOG = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
+    from matplotlib.axes import Axes
+    from matplotlib.colorbar import Colorbar
+
+    from qcodes.dataset.data_set_protocol import DataSetProtocol
     from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
     from qcodes.dataset.dond.do_nd_utils import (
         ActionsT,
@@ -45,9 +66,12 @@ if TYPE_CHECKING:
         ParamMeasT,
     )
     from qcodes.dataset.experiment_container import Experiment
+    from qcodes.dataset.measurements import DataSaver
 
 SweepVarType = Any
 
+_PIPELINE_QUEUE_SIZE = 64
+
 TRACER = trace.get_tracer(__name__)
 
 
@@ -67,67 +91,216 @@ class ParameterSetEvent:
 
 
 class _Sweeper:
+    """
+    Iterate over the setpoints of a dond.
+
+    The setpoints of each step are computed from the step index using mixed
+    radix arithmetic over the setpoints of the individual sweeps, the last
+    sweep being the fastest. Only the setpoints of each sweep are kept in
+    memory, not the product of them.
+
+    If an ``order`` other than ``"row_major"`` is given, the steps traverse
+    the grid of setpoints in that order instead. :meth:`grid_index` maps a
+    step to the index of its point in row major order.
+
+    A ``RetraceSweep`` is expanded into an axis of the direction of the
+    trace followed by the axis of the retraced sweep, which is traversed
+    backwards when the direction is 1. The direction of a sweep that is
+    retraced into separate datasets is not a setpoint of the datasets.
+    """
+
     def __init__(
         self,
-        sweeps: Sequence[AbstractSweep | TogetherSweep],
+        sweeps: Sequence[AbstractSweep | TogetherSweep | RetraceSweep],
         additional_setpoints: Sequence[ParameterBase],
+        order: SweepOrder = "row_major",
     ):
         self._additional_setpoints = additional_setpoints
-        self._sweeps = sweeps
-        self._setpoints = self._make_setpoints_tuples()
-        self._setpoints_dict = self._make_setpoints_dict()
-        self._shape = self._make_shape(sweeps, additional_setpoints)
+        self._sweeps, retraced, self._hidden_axes, self._retrace_into_datasets = (
+            self._expand_retrace_sweeps(sweeps)
+        )
+        self._axes = self._make_axes()
+        self._axis_lengths = tuple(sweep.num_points for sweep in self._sweeps)
+        self._strides = self._make_strides()
+        if order == "row_major":
+            self._traversal = _Traversal.row_major(len(self._sweeps), retraced)
+            self.set_time_estimate = None
+        elif retraced:
+            raise ValueError(
+                f"A RetraceSweep can only be swept in row major order, got {order!r}."
+            )
+        else:
+            self.set_time_estimate = _choose_traversal(self.set_time_axes, order)
+            self._traversal = self.set_time_estimate.traversal
+        self._row_major = self._traversal.is_row_major()
+        # the backward traces of a sweep that is retraced into a dimension
+        # are stored in the order of the forward traces, those retraced
+        # into separate datasets are stored as measured
+        self._stored_in_step_order = self._row_major and all(
+            axis - 1 in self._hidden_axes for axis in retraced
+        )
+        self._shape = self._make_shape(self._stored_sweeps, additional_setpoints)
+        self._len = int(np.prod(self._axis_lengths))
         self._iter_index = 0
 
+    @staticmethod
+    def _expand_retrace_sweeps(
+        sweeps: Sequence[AbstractSweep | TogetherSweep | RetraceSweep],
+    ) -> tuple[
+        tuple[AbstractSweep | TogetherSweep, ...],
+        frozenset[int],
+        frozenset[int],
+        RetraceSweep | None,
+    ]:
+        expanded: list[AbstractSweep | TogetherSweep] = []
+        retraced = set()
+        hidden_axes = set()
+        retrace_into_datasets = None
+        for sweep in sweeps:
+            if not isinstance(sweep, RetraceSweep):
+                expanded.append(sweep)
+                continue
+            if sweep.store == "datasets":
+                if retrace_into_datasets is not None:
+                    raise ValueError(
+                        "Only one sweep of a dond can be retraced into "
+                        "separate datasets."
+                    )
+                retrace_into_datasets = sweep
+                hidden_axes.add(len(expanded))
+            expanded.append(sweep.direction_sweep)
+            retraced.add(len(expanded))
+            expanded.append(sweep.sweep)
+        return (
+            tuple(expanded),
+            frozenset(retraced),
+            frozenset(hidden_axes),
+            retrace_into_datasets,
+        )
+
     @property
-    def setpoints_dict(self) -> dict[str, list[Any]]:
-        return self._setpoints_dict
+    def retrace_into_datasets(self) -> RetraceSweep | None:
+        """
+        The sweep whose backward traces are stored in separate datasets.
+        """
+        return self._retrace_into_datasets
 
-    def _make_setpoints_tuples(
-        self,
-    ) -> tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...]:
-        sweeps = tuple(sweep.get_setpoints() for sweep in self._sweeps)
-        return cast(
-            tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...],
-            tuple(itertools.product(*sweeps)),
+    @property
+    def _stored_sweeps(self) -> tuple[AbstractSweep | TogetherSweep, ...]:
+        return tuple(
+            sweep
+            for axis, sweep in enumerate(self._sweeps)
+            if axis not in self._hidden_axes
         )
 
-    def _make_single_point_setpoints_dict(self, index: int) -> dict[str, SweepVarType]:
-        setpoint_dict = {}
-        values = self._setpoints[index]
-        for sweep, subvalues in zip(self._sweeps, values):
-            if isinstance(sweep, TogetherSweep):
-                for individual_sweep, value in zip(sweep.sweeps, subvalues):
-                    setpoint_dict[individual_sweep.param.full_name] = value
-            else:
-                setpoint_dict[sweep.param.full_name] = subvalues
+    @property
+    def setpoints_dict(self) -> dict[str, list[Any]]:
+        """
+        The setpoints of all steps for each parameter. Note that this
+        materializes the full sweep.
+        """
+        setpoint_dict: dict[str, list[Any]] = {}
+        if not self._row_major or self._traversal.retraced:
+            for sweep in self.all_sweeps:
+                setpoint_dict[sweep.param.full_name] = []
+            for index in range(self._len):
+                for name, value in self._make_single_point_setpoints_dict(
+                    index
+                ).items():
+                    setpoint_dict[name].append(value)
+            return setpoint_dict
+        for (sweeps, setpoints), length, stride in zip(
+            self._axes, self._axis_lengths, self._strides
+        ):
+            repeats = self._len // (stride * length) if stride * length else 0
+            for sweep, values in zip(sweeps, setpoints):
+                setpoint_dict[sweep.param.full_name] = list(
+                    np.tile(np.repeat(values, stride), repeats)
+                )
         return setpoint_dict
 
-    def _make_setpoints_dict(self) -> dict[str, list[Any]]:
-        setpoint_dict: dict[str, list[SweepVarType]] = {}
-
+    def _make_axes(
+        self,
+    ) -> tuple[tuple[tuple[AbstractSweep, ...], tuple[np.ndarray, ...]], ...]:
+        """
+        For each dimension the sweeps of that dimension and their setpoints.
+        """
+        axes = []
         for sweep in self._sweeps:
             if isinstance(sweep, TogetherSweep):
-                for individual_sweep in sweep.sweeps:
-                    setpoint_dict[individual_sweep.param.full_name] = []
+                individual_sweeps = tuple(sweep.sweeps)
             else:
-                setpoint_dict[sweep.param.full_name] = []
+                individual_sweeps = (sweep,)
+            setpoints = tuple(
+                individual_sweep.get_setpoints()
+                for individual_sweep in individual_sweeps
+            )
+            axes.append((individual_sweeps, setpoints))
+        return tuple(axes)
+
+    def _make_strides(self) -> tuple[int, ...]:
+        strides = []
+        stride = 1
+        for length in reversed(self._axis_lengths):
+            strides.append(stride)
+            stride *= length
+        return tuple(reversed(strides))
+
+    def _axis_indices(self, index: int) -> tuple[int, ...]:
+        if not self._row_major or self._traversal.retraced:
+            return self._traversal.axis_indices(index, self._axis_lengths)
+        return tuple(
+            (index // stride) % length
+            for length, stride in zip(self._axis_lengths, self._strides)
+        )
 
-        for setpoint_tuples in self._setpoints:
-            for sweep, values in zip(self._sweeps, setpoint_tuples):
-                if isinstance(sweep, TogetherSweep):
-                    for individual_sweep, individual_value in zip(sweep.sweeps, values):
-                        setpoint_dict[individual_sweep.param.full_name].append(
-                            individual_value
-                        )
-                else:
-                    setpoint_dict[sweep.param.full_name].append(values)
+    def grid_index(self, index: int) -> int:
+        """
+        The index in row major order of the point set in the given step.
+        """
+        if self._stored_in_step_order:
+            return index
+        return sum(
+            axis_index * stride
+            for axis_index, stride in zip(self._axis_indices(index), self._strides)
+        )
+
+    @property
+    def traversal(self) -> _Traversal:
+        return self._traversal
+
+    @property
+    def set_time_axes(self) -> list[list[tuple[ParameterBase, np.ndarray, float]]]:
+        """
+        The parameters, setpoints and delays of the sweeps of each axis.
+        """
+        return [
+            [(sweep.param, values, sweep.delay) for sweep, values in zip(*axis)]
+            for axis in self._axes
+        ]
+
+    @property
+    def axis_names(self) -> tuple[str, ...]:
+        return tuple(
+            "+".join(sweep.param.full_name for sweep in sweeps)
+            for sweeps, _ in self._axes
+        )
+
+    def _make_single_point_setpoints_dict(self, index: int) -> dict[str, SweepVarType]:
+        setpoint_dict = {}
+        for axis, ((sweeps, setpoints), axis_index) in enumerate(
+            zip(self._axes, self._axis_indices(index))
+        ):
+            if axis in self._hidden_axes:
+                continue
+            for sweep, values in zip(sweeps, setpoints):
+                setpoint_dict[sweep.param.full_name] = values[axis_index]
         return setpoint_dict
 
     @property
     def all_sweeps(self) -> tuple[AbstractSweep, ...]:
         sweeps: list[AbstractSweep] = []
-        for sweep in self._sweeps:
+        for sweep in self._stored_sweeps:
             if isinstance(sweep, TogetherSweep):
                 sweeps.extend(sweep.sweeps)
             else:
@@ -150,7 +323,7 @@ class _Sweeper:
         on one or more of the parameters of that sweep.
         """
         param_tuple_list: list[tuple[ParameterBase, ...]] = []
-        for sweep in self._sweeps:
+        for sweep in self._stored_sweeps:
             if isinstance(sweep, TogetherSweep):
                 param_tuple_list.append(
                     tuple(sub_sweep.param for sub_sweep in sweep.sweeps)
@@ -205,37 +378,42 @@ class _Sweeper:
         return self._shape
 
     def __getitem__(self, index: int) -> tuple[ParameterSetEvent, ...]:
-        setpoints = self._make_single_point_setpoints_dict(index)
-
-        if index == 0:
-            previous_setpoints: dict[str, SweepVarType | None] = {}
-            for key in setpoints.keys():
-                previous_setpoints[key] = None
-        else:
-            previous_setpoints = self._make_single_point_setpoints_dict(index - 1)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Sweeper index out of range")
+
+        axis_indices = self._axis_indices(index)
+        previous_axis_indices = (
+            self._axis_indices(index - 1) if index > 0 else (None,) * len(self._axes)
+        )
 
         parameter_set_events = []
 
-        for sweep in self.all_sweeps:
-            new_value = setpoints[sweep.param.full_name]
-            old_value = previous_setpoints[sweep.param.full_name]
-            if old_value is None or old_value != new_value:
-                should_set = True
-            else:
-                should_set = False
-            event = ParameterSetEvent(
-                new_value=new_value,
-                parameter=sweep.param,
-                should_set=should_set,
-                delay=sweep.delay,
-                actions=sweep.post_actions,
-                get_after_set=sweep.get_after_set,
-            )
-            parameter_set_events.append(event)
+        for (sweeps, setpoints), axis_index, previous_axis_index in zip(
+            self._axes, axis_indices, previous_axis_indices
+        ):
+            for sweep, values in zip(sweeps, setpoints):
+                new_value = values[axis_index]
+                if previous_axis_index is None:
+                    should_set = True
+                elif previous_axis_index == axis_index:
+                    should_set = False
+                else:
+                    should_set = bool(values[previous_axis_index] != new_value)
+                event = ParameterSetEvent(
+                    new_value=new_value,
+                    parameter=sweep.param,
+                    should_set=should_set,
+                    delay=sweep.delay,
+                    actions=sweep.post_actions,
+                    get_after_set=sweep.get_after_set,
+                )
+                parameter_set_events.append(event)
         return tuple(parameter_set_events)
 
     def __len__(self) -> int:
-        return int(np.prod(self.shape))
+        return self._len
 
     def __iter__(self) -> _Sweeper:
         return self
@@ -261,8 +439,11 @@ class _Measurements:
         write_period: float | None,
         log_info: str | None,
         dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
+        measurement_name_prefix: str = "",
+        shaped: bool = True,
     ):
         self._sweeper = sweeper
+        self._measurement_name_prefix = measurement_name_prefix
         self._enter_actions = enter_actions
         self._exit_actions = exit_actions
         self._write_period = write_period
@@ -278,7 +459,7 @@ class _Measurements:
             self._measured_parameters,
         ) = self._extract_parameters_by_type_and_group(params_meas)
 
-        self._shapes = self._get_shapes()
+        self._shapes = self._get_shapes() if shaped else None
 
         if dataset_dependencies and len(grouped_parameters) > 1:
             raise ValueError(
@@ -507,6 +688,10 @@ class _Measurements:
         sweep_parameters: Sequence[ParameterBase],
         measure_parameters: Sequence[ParamMeasT],
     ) -> Measurement:
+        if self._measurement_name_prefix:
+            measurement_name = (
+                f"{self._measurement_name_prefix} {measurement_name}".rstrip()
+            )
         meas = Measurement(name=measurement_name, exp=experiment)
         _register_parameters(meas, sweep_parameters)
         _register_parameters(
@@ -567,9 +752,401 @@ class _SweepMeasGroup:
         return self._parameters
 
 
+class _ResultsFanOut:
+    """
+    Add the results of each point of a dond to the datasavers of all groups.
+
+    The results of a group are selected with index maps into the results of
+    a point, which are computed when the parameters of the results change,
+    i.e. for the first point, and added with
+    ``DataSaver._add_packed_results``.
+    """
+
+    def __init__(
+        self,
+        datasavers: Sequence[DataSaver],
+        groups: Sequence[_SweepMeasGroup],
+        additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+    ):
+        self._datasavers = datasavers
+        self._groups = groups
+        self._additional_setpoints_data = additional_setpoints_data
+        self._keys: tuple[ParameterBase, ...] | None = None
+        self._index_maps: tuple[tuple[int, ...], ...] = ()
+
+    def __call__(self, results: Mapping[ParameterBase, Any]) -> None:
+        keys = tuple(results)
+        if keys != self._keys:
+            self._keys = keys
+            self._index_maps = tuple(
+                tuple(i for i, param in enumerate(keys) if param in group_parameters)
+                for group_parameters in (
+                    set(group.parameters) for group in self._groups
+                )
+            )
+        values = tuple(results.values())
+        for datasaver, index_map in zip(self._datasavers, self._index_maps):
+            datasaver._add_packed_results(
+                keys, values, index_map, self._additional_setpoints_data
+            )
+
+
+class _RetraceFanOut:
+    """
+    Add the results of a dond with a sweep that is retraced into separate
+    datasets to the datasets of the direction of the trace.
+    """
+
+    def __init__(
+        self,
+        direction: ParameterBase,
+        datasavers: Sequence[DataSaver],
+        groups: Sequence[_SweepMeasGroup],
+        retrace_groups: Sequence[_SweepMeasGroup],
+        additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+    ):
+        self._direction = direction
+        self._forward = _ResultsFanOut(
+            datasavers[: len(groups)], groups, additional_setpoints_data
+        )
+        self._backward = _ResultsFanOut(
+            datasavers[len(groups) :], retrace_groups, additional_setpoints_data
+        )
+
+    def __call__(self, results: Mapping[ParameterBase, Any]) -> None:
+        if results[self._direction] == 1:
+            self._backward(results)
+        else:
+            self._forward(results)
+
+
+def _make_fan_out(
+    retrace_sweep: RetraceSweep | None,
+    datasavers: Sequence[DataSaver],
+    groups: Sequence[_SweepMeasGroup],
+    retrace_groups: Sequence[_SweepMeasGroup],
+    additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+) -> Callable[[Mapping[ParameterBase, Any]], None]:
+    if retrace_sweep is None:
+        return _ResultsFanOut(datasavers, groups, additional_setpoints_data)
+    return _RetraceFanOut(
+        retrace_sweep.direction,
+        datasavers,
+        groups,
+        retrace_groups,
+        additional_setpoints_data,
+    )
+
+
+def _make_retrace_groups(
+    sweeper: _Sweeper,
+    measurement_name: str | Sequence[str],
+    params_meas: Sequence[ParamMeasT | Sequence[ParamMeasT]],
+    experiments: Experiment | Sequence[Experiment] | None,
+    write_period: float | None,
+    log_info: str | None,
+    dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None,
+) -> tuple[_SweepMeasGroup, ...]:
+    """
+    The groups of the datasets of the backward traces of a sweep that is
+    retraced into separate datasets, if there is one. The enter and exit
+    actions are only registered with the groups of the forward traces.
+    """
+    if sweeper.retrace_into_datasets is None:
+        return ()
+    return _Measurements(
+        sweeper,
+        measurement_name,
+        params_meas,
+        (),
+        (),
+        experiments,
+        write_period,
+        log_info,
+        dataset_dependencies,
+        measurement_name_prefix="retrace",
+    ).groups
+
+
+_STOP = object()
+
+
+class _StorePipeline:
+    """
+    Store the results of a dond on a worker thread, such that filtering the
+    results per group, adding them to the datasavers and updating the caches
+    of the datasets overlap with setting and measuring the next point.
+
+    Results are stored in the order in which they are put. The queue between
+    the measurement loop and the worker is bounded, so the measurement loop
+    waits if storing falls behind. When the pipeline is closed, also due to
+    an interrupt, all results that have been put are stored before
+    returning. An exception raised while storing is re-raised in the
+    measurement loop.
+    """
+
+    def __init__(
+        self,
+        store: Callable[[Mapping[ParameterBase, Any]], None],
+        maxsize: int = _PIPELINE_QUEUE_SIZE,
+    ):
+        self._store = store
+        self._queue: Queue[Any] = Queue(maxsize=maxsize)
+        self._exception: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="dond_store_pipeline", daemon=True
+        )
+
+    def _run(self) -> None:
+        while True:
+            results = self._queue.get()
+            if results is _STOP:
+                return
+            if self._exception is not None:
+                # keep draining the queue such that the measurement loop
+                # does not block, but store nothing after a failure
+                continue
+            try:
+                self._store(results)
+            except BaseException as e:
+                self._exception = e
+
+    def _raise_if_failed(self) -> None:
+        if self._exception is not None:
+            raise self._exception
+
+    def put(self, results: Mapping[ParameterBase, Any]) -> None:
+        """
+        Queue the results of one point to be stored. Blocks while the queue
+        is full.
+        """
+        while True:
+            self._raise_if_failed()
+            try:
+                self._queue.put(results, timeout=0.1)
+            except Full:
+                continue
+            return
+
+    def __enter__(self) -> _StorePipeline:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._queue.put(_STOP)
+        self._thread.join()
+        if exception_type is None:
+            self._raise_if_failed()
+        elif self._exception is not None:
+            LOG.error("Storing results of dond failed", exc_info=self._exception)
+
+
+class _DondRun:
+    """
+    The parts of a dond that do not depend on how the parameters are set and
+    measured, which are shared by :func:`dond` and :func:`adond`: the
+    sweepers, the grouping of the measured parameters into datasets,
+    storing the results of each point and plotting the datasets.
+
+    The steps of :attr:`loop_sweeper` are looped over. With a
+    ``BufferedSweep`` or an ``AdaptiveSweep`` it does not include the
+    innermost sweep, which is then swept at every step.
+    """
+
+    def __init__(
+        self,
+        params: Sequence[
+            AbstractSweep
+            | TogetherSweep
+            | RetraceSweep
+            | ParamMeasT
+            | Sequence[ParamMeasT]
+        ],
+        *,
+        write_period: float | None,
+        measurement_name: str | Sequence[str],
+        exp: Experiment | Sequence[Experiment] | None,
+        enter_actions: ActionsT,
+        exit_actions: ActionsT,
+        additional_setpoints: Sequence[ParameterBase],
+        log_info: str | None,
+        break_condition: BreakConditionT | None,
+        dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None,
+        order: SweepOrder,
+    ):
+        self._break_condition = break_condition
+        sweep_instances, params_meas = _parse_dond_arguments(*params)
+        self.buffered_sweep = _get_buffered_sweep(sweep_instances)
+        self.adaptive_sweep = _get_adaptive_sweep(sweep_instances)
+
+        self.sweeper = _Sweeper(sweep_instances, additional_setpoints)
+        if self.buffered_sweep is not None or self.adaptive_sweep is not None:
+            # the innermost axis is executed by the instrument or chosen from
+            # the measured data so only loop over the outer axes here
+            self.loop_sweeper = _Sweeper(
+                sweep_instances[:-1], additional_setpoints, order
+            )
+            # a snaked line of the outer axes would hold back whole lines of
+            # the innermost axis
+            traversal = self.loop_sweeper.traversal
+            in_grid_order = traversal.is_row_major() or len(traversal.nesting) <= 1
+        elif order != "row_major":
+            self.loop_sweeper = _Sweeper(sweep_instances, additional_setpoints, order)
+            in_grid_order = self.loop_sweeper.traversal.keeps_axis_order()
+        else:
+            self.loop_sweeper = self.sweeper
+            in_grid_order = True
+        if self.loop_sweeper.set_time_estimate is not None:
+            _report_set_time_estimate(
+                self.loop_sweeper.set_time_estimate, self.loop_sweeper.axis_names
+            )
+        # results are only held back to store them in row major order if at
+        # most one line of the fastest axis is traversed backwards, otherwise
+        # they are stored as measured into datasets without a shape
+        self._store_as_measured = not in_grid_order
+
+        self.measurements = _Measurements(
+            self.sweeper,
+            measurement_name,
+            params_meas,
+            enter_actions,
+            exit_actions,
+            exp,
+            write_period,
+            log_info,
+            dataset_dependencies,
+            shaped=in_grid_order,
+        )
+        self.retrace_groups = _make_retrace_groups(
+            self.sweeper,
+            measurement_name,
+            params_meas,
+            exp,
+            write_period,
+            log_info,
+            dataset_dependencies,
+        )
+        self.groups = self.measurements.groups + self.retrace_groups
+
+        self.datasavers: list[DataSaver] = []
+        self._grid_order_buffer: (
+            _GridOrderBuffer[Mapping[ParameterBase, Any]] | None
+        ) = None
+        self._datasets: list[DataSetProtocol] = []
+        self._plots_axes: list[tuple[Axes | None, ...]] = []
+        self._plots_colorbar: list[tuple[Colorbar | None, ...]] = []
+
+    def enter_datasavers(
+        self,
+        stack: ExitStack,
+        in_memory_cache: bool | None,
+        write_in_background: bool | None = None,
+    ) -> None:
+        self.datasavers = [
+            stack.enter_context(
+                group.measurement_cxt.run(
+                    in_memory_cache=in_memory_cache,
+                    write_in_background=write_in_background,
+                )
+            )
+            for group in self.groups
+        ]
+
+    def enter_store(
+        self,
+        stack: ExitStack,
+        additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+        pipelined: bool = False,
+    ) -> None:
+        """
+        Prepare storing the results of the points in the datasavers, which
+        must have been entered with :meth:`enter_datasavers`.
+        """
+        fan_out = _make_fan_out(
+            self.sweeper.retrace_into_datasets,
+            self.datasavers,
+            self.measurements.groups,
+            self.retrace_groups,
+            additional_setpoints_data,
+        )
+        store: Callable[[Mapping[ParameterBase, Any]], None] = (
+            stack.enter_context(_StorePipeline(fan_out)).put if pipelined else fan_out
+        )
+        self._grid_order_buffer = _GridOrderBuffer(store)
+        # store the points held back by an interruption before the
+        # pipeline and the datasavers are exited
+        stack.callback(self._grid_order_buffer.flush)
+
+    def add(self, step: int, results: Mapping[ParameterBase, Any]) -> None:
+        """
+        Store results measured in the given step of the loop sweeper.
+        """
+        assert self._grid_order_buffer is not None
+        self._grid_order_buffer.add(self._grid_index(step), results)
+
+    def complete(self, step: int) -> None:
+        """
+        Mark that all results of the given step have been added.
+        """
+        assert self._grid_order_buffer is not None
+        self._grid_order_buffer.complete(self._grid_index(step))
+
+    def _grid_index(self, step: int) -> int:
+        if self._store_as_measured:
+            return step
+        return self.loop_sweeper.grid_index(step)
+
+    def store_point(self, step: int, results: Mapping[ParameterBase, Any]) -> None:
+        """
+        Store the results of a step and check the break condition.
+        """
+        self.add(step, results)
+        self.complete(step)
+        self.check_break_condition()
+
+    def check_break_condition(self) -> None:
+        if callable(self._break_condition):
+            if self._break_condition():
+                raise BreakConditionInterrupt("Break condition was met.")
+
+    def handle_plotting(
+        self,
+        do_plot: bool,
+        interrupted: KeyboardInterrupt | BreakConditionInterrupt | None,
+    ) -> None:
+        for datasaver in self.datasavers:
+            ds, plot_axis, plot_color = _handle_plotting(
+                datasaver.dataset, do_plot, interrupted
+            )
+            self._datasets.append(ds)
+            self._plots_axes.append(plot_axis)
+            self._plots_colorbar.append(plot_color)
+
+    def output(
+        self, squeeze: bool
+    ) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet:
+        if len(self.groups) == 1 and squeeze is True:
+            return self._datasets[0], self._plots_axes[0], self._plots_colorbar[0]
+        else:
+            return (
+                tuple(self._datasets),
+                tuple(self._plots_axes),
+                tuple(self._plots_colorbar),
+            )
+
+
 @overload
 def dond(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
     write_period: float | None = None,
     measurement_name: str | Sequence[str] = "",
     exp: Experiment | Sequence[Experiment] | None = None,
@@ -583,13 +1160,19 @@ def dond(
     break_condition: BreakConditionT | None = None,
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
     in_memory_cache: bool | None = None,
+    pipelined: bool = False,
+    order: SweepOrder = "row_major",
     squeeze: Literal[False],
 ) -> MultiAxesTupleListWithDataSet: ...
 
 
 @overload
 def dond(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
     write_period: float | None = None,
     measurement_name: str | Sequence[str] = "",
     exp: Experiment | Sequence[Experiment] | None = None,
@@ -603,13 +1186,19 @@ def dond(
     break_condition: BreakConditionT | None = None,
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
     in_memory_cache: bool | None = None,
+    pipelined: bool = False,
+    order: SweepOrder = "row_major",
     squeeze: Literal[True],
 ) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet: ...
 
 
 @overload
 def dond(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
     write_period: float | None = None,
     measurement_name: str | Sequence[str] = "",
     exp: Experiment | Sequence[Experiment] | None = None,
@@ -623,13 +1212,19 @@ def dond(
     break_condition: BreakConditionT | None = None,
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
     in_memory_cache: bool | None = None,
+    pipelined: bool = False,
+    order: SweepOrder = "row_major",
     squeeze: bool = True,
 ) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet: ...
 
 
 @TRACER.start_as_current_span("qcodes.dataset.dond")
 def dond(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
     write_period: float | None = None,
     measurement_name: str | Sequence[str] = "",
     exp: Experiment | Sequence[Experiment] | None = None,
@@ -643,6 +1238,8 @@ def dond(
     break_condition: BreakConditionT | None = None,
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
     in_memory_cache: bool | None = None,
+    pipelined: bool = False,
+    order: SweepOrder = "row_major",
     squeeze: bool = True,
 ) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet:
     """
@@ -677,6 +1274,16 @@ def dond(
                               LinSweep(param_set_2, start_2, stop_2, num_points, delay_2))
                 param_meas_1, param_meas_2, ..., param_meas_m
 
+            If you want to sweep a parameter forward and backward, e.g. to
+            measure hysteresis, wrap its sweep in a ``RetraceSweep``. The
+            backward trace replaces the ramp back to the start of the sweep.
+
+            .. code-block::
+
+                LinSweep(param_set_1, start_1, stop_1, num_points_1, delay_1),
+                RetraceSweep(LinSweep(param_set_2, start_2, stop_2, num_points_2, delay_2)),
+                param_meas_1, param_meas_2, ..., param_meas_m
+
 
         write_period: The time after which the data is actually written to the
             database.
@@ -714,6 +1321,28 @@ def dond(
             plotting and exporting. Useful to disable if the data is very large
             in order to save on memory consumption.
             If ``None``, the value for this will be read from ``qcodesrc.json`` config file.
+        pipelined: If True, the results of each point are stored on a worker
+            thread while the next point is set and measured. The data is
+            written to the database in the background in this mode. The
+            results are stored in the order in which they were measured and
+            all points measured before an interruption are stored.
+        order: The order in which the setpoints are traversed. ``"row_major"``
+            sweeps the last sweep fastest and starts each of its lines from
+            the first setpoint. ``"snake"`` traverses every other line of
+            the last sweep backwards, which avoids ramping it back to the
+            start of every line. ``"min_cost"`` additionally chooses which
+            sweeps are swept fastest such that the estimated time spent
+            setting parameters, based on their ``step``, ``inter_delay``,
+            ``post_delay`` and the delay of the sweeps, is minimal. The
+            estimated time saved is logged before the measurement starts.
+            The results of a snaked line are stored in row major order once
+            the line is complete. If the sweeps are reordered, the results
+            are stored as they are measured and the shapes of the datasets
+            are not set. The innermost sweep is not reordered if it is a
+            ``BufferedSweep`` or an ``AdaptiveSweep``, in which case the
+            results are stored as measured in any order other than
+            ``"row_major"``. A dond with a ``RetraceSweep`` can only be
+            swept in ``"row_major"`` order.
         squeeze: If True, will return a tuple of QCoDeS DataSet, Matplotlib axis,
             Matplotlib colorbar if only one group of measurements was performed
             and a tuple of tuples of these if more than one group of measurements
@@ -728,7 +1357,9 @@ def dond(
         will be a tuple of tuple(QCoDeS DataSet), tuple(Matplotlib axis),
         tuple(Matplotlib colorbar), in which each element of each sub-tuple
         belongs to one group, and the order of elements is the order of
-        the supplied groups.
+        the supplied groups. If a sweep is retraced into separate datasets,
+        the datasets of the backward traces follow those of the forward
+        traces.
 
     """
     if do_plot is None:
@@ -736,45 +1367,51 @@ def dond(
     if show_progress is None:
         show_progress = config.dataset.dond_show_progress
 
-    sweep_instances, params_meas = _parse_dond_arguments(*params)
-
-    sweeper = _Sweeper(sweep_instances, additional_setpoints)
-
-    measurements = _Measurements(
-        sweeper,
-        measurement_name,
-        params_meas,
-        enter_actions,
-        exit_actions,
-        exp,
-        write_period,
-        log_info,
-        dataset_dependencies,
+    run = _DondRun(
+        params,
+        write_period=write_period,
+        measurement_name=measurement_name,
+        exp=exp,
+        enter_actions=enter_actions,
+        exit_actions=exit_actions,
+        additional_setpoints=additional_setpoints,
+        log_info=log_info,
+        break_condition=break_condition,
+        dataset_dependencies=dataset_dependencies,
+        order=order,
     )
+    measurements = run.measurements
+    buffered_sweep = run.buffered_sweep
+    adaptive_sweep = run.adaptive_sweep
 
     LOG.info(
         "Starting a doNd with scan with\n setpoints: %s,\n measuring: %s",
-        sweeper.all_setpoint_params,
+        run.sweeper.all_setpoint_params,
         measurements.measured_all,
     )
     LOG.debug(
         "dond has been grouped into the following datasets:\n%s",
-        measurements.groups,
+        run.groups,
     )
 
-    datasets = []
-    plots_axes = []
-    plots_colorbar = []
+    buffered_params: tuple[ParameterBase, ...] = ()
+    adaptive_target: ParameterBase | None = None
+    if buffered_sweep is not None:
+        buffered_params = _get_buffered_params(measurements.measured_all)
+    if adaptive_sweep is not None:
+        adaptive_target = _get_adaptive_target(
+            adaptive_sweep, measurements.measured_all
+        )
+
     if use_threads is None:
         use_threads = config.dataset.use_threads
 
     params_meas_caller = (
-        ThreadPoolParamsCaller(*measurements.measured_all)
+        InstrumentWorkersParamsCaller(*measurements.measured_all)
         if use_threads
         else SequentialParamsCaller(*measurements.measured_all)
     )
 
-    datasavers = []
     interrupted: Callable[  # noqa E731
         [], KeyboardInterrupt | BreakConditionInterrupt | None
     ] = lambda: None
@@ -784,59 +1421,146 @@ def dond(
             ExitStack() as stack,
             params_meas_caller as call_params_meas,
         ):
-            datasavers = [
-                stack.enter_context(
-                    group.measurement_cxt.run(in_memory_cache=in_memory_cache)
-                )
-                for group in measurements.groups
-            ]
-            additional_setpoints_data = process_params_meas(additional_setpoints)
-            for set_events in tqdm(sweeper, disable=not show_progress):
+            # the pipeline thread cannot use the database connection of
+            # this thread
+            run.enter_datasavers(
+                stack, in_memory_cache, write_in_background=True if pipelined else None
+            )
+            run.enter_store(
+                stack, process_params_meas(additional_setpoints), pipelined=pipelined
+            )
+
+            for step, set_events in enumerate(
+                tqdm(run.loop_sweeper, disable=not show_progress)
+            ):
                 LOG.debug("Processing set events: %s", set_events)
                 results: dict[ParameterBase, Any] = {}
                 for set_event in set_events:
-                    if set_event.should_set:
-                        set_event.parameter(set_event.new_value)
-                        for act in set_event.actions:
-                            act()
-                        time.sleep(set_event.delay)
-
-                    if set_event.get_after_set:
-                        results[set_event.parameter] = set_event.parameter()
-                    else:
-                        results[set_event.parameter] = set_event.new_value
-
-                meas_value_pair = call_params_meas()
-                for meas_param, value in meas_value_pair:
-                    results[meas_param] = value
-
-                for datasaver, group in zip(datasavers, measurements.groups):
-                    filtered_results_list = [
-                        (param, value)
-                        for param, value in results.items()
-                        if param in group.parameters
-                    ]
-                    datasaver.add_result(
-                        *filtered_results_list,
-                        *additional_setpoints_data,
-                    )
+                    _apply_set_event(set_event, results)
+
+                if adaptive_sweep is not None:
+                    assert adaptive_target is not None
+                    adaptive_sweep.reset()
+                    while (setpoint := adaptive_sweep.next_setpoint()) is not None:
+                        point_results = dict(results)
+                        _apply_set_event(
+                            ParameterSetEvent(
+                                parameter=adaptive_sweep.param,
+                                new_value=setpoint,
+                                should_set=True,
+                                delay=adaptive_sweep.delay,
+                                actions=adaptive_sweep.post_actions,
+                                get_after_set=False,
+                            ),
+                            point_results,
+                        )
+                        for meas_param, value in call_params_meas():
+                            point_results[meas_param] = value
+                        adaptive_sweep.tell(setpoint, point_results[adaptive_target])
+                        run.add(step, point_results)
+                        run.check_break_condition()
+                    run.complete(step)
+                    continue
+
+                if buffered_sweep is not None:
+                    results.update(buffered_sweep.run(buffered_params))
+                else:
+                    meas_value_pair = call_params_meas()
+                    for meas_param, value in meas_value_pair:
+                        results[meas_param] = value
 
-                if callable(break_condition):
-                    if break_condition():
-                        raise BreakConditionInterrupt("Break condition was met.")
+                run.store_point(step, results)
     finally:
-        for datasaver in datasavers:
-            ds, plot_axis, plot_color = _handle_plotting(
-                datasaver.dataset, do_plot, interrupted()
-            )
-            datasets.append(ds)
-            plots_axes.append(plot_axis)
-            plots_colorbar.append(plot_color)
+        run.handle_plotting(do_plot, interrupted())
 
-    if len(measurements.groups) == 1 and squeeze is True:
-        return datasets[0], plots_axes[0], plots_colorbar[0]
+    return run.output(squeeze)
+
+
+def _apply_set_event(
+    set_event: ParameterSetEvent, results: dict[ParameterBase, Any]
+) -> None:
+    if set_event.should_set:
+        set_event.parameter(set_event.new_value)
+        for act in set_event.actions:
+            act()
+        time.sleep(set_event.delay)
+
+    if set_event.get_after_set:
+        results[set_event.parameter] = set_event.parameter()
     else:
-        return tuple(datasets), tuple(plots_axes), tuple(plots_colorbar)
+        results[set_event.parameter] = set_event.new_value
+
+
+def _get_adaptive_sweep(
+    sweep_instances: Sequence[AbstractSweep | TogetherSweep | RetraceSweep],
+) -> AdaptiveSweep | None:
+    """
+    Return the adaptive sweep of a dond if there is one. Only the innermost
+    sweep may be an adaptive sweep.
+    """
+    for i, sweep in enumerate(sweep_instances):
+        if isinstance(sweep, TogetherSweep):
+            if any(isinstance(sub_sweep, AdaptiveSweep) for sub_sweep in sweep.sweeps):
+                raise ValueError("An AdaptiveSweep cannot be part of a TogetherSweep.")
+        elif isinstance(sweep, AdaptiveSweep) and i != len(sweep_instances) - 1:
+            raise ValueError(
+                "An AdaptiveSweep is only supported as the last (innermost) "
+                "sweep of a dond."
+            )
+    last_sweep = sweep_instances[-1] if sweep_instances else None
+    return last_sweep if isinstance(last_sweep, AdaptiveSweep) else None
+
+
+def _get_adaptive_target(
+    adaptive_sweep: AdaptiveSweep, measured_all: Sequence[ParamMeasT]
+) -> ParameterBase:
+    measured_params = [
+        param for param in measured_all if isinstance(param, ParameterBase)
+    ]
+    if adaptive_sweep.target is None:
+        if not measured_params:
+            raise ValueError("An AdaptiveSweep requires a measured parameter.")
+        return measured_params[0]
+    if adaptive_sweep.target not in measured_params:
+        raise ValueError(
+            f"The target {adaptive_sweep.target} of the AdaptiveSweep is not "
+            "measured in the dond."
+        )
+    return adaptive_sweep.target
+
+
+def _get_buffered_sweep(
+    sweep_instances: Sequence[AbstractSweep | TogetherSweep | RetraceSweep],
+) -> BufferedSweep | None:
+    """
+    Return the buffered sweep of a dond if there is one. Only the innermost
+    sweep may be a buffered sweep.
+    """
+    for i, sweep in enumerate(sweep_instances):
+        if isinstance(sweep, TogetherSweep):
+            if any(isinstance(sub_sweep, BufferedSweep) for sub_sweep in sweep.sweeps):
+                raise ValueError("A BufferedSweep cannot be part of a TogetherSweep.")
+        elif isinstance(sweep, BufferedSweep) and i != len(sweep_instances) - 1:
+            raise ValueError(
+                "A BufferedSweep is only supported as the last (innermost) "
+                "sweep of a dond."
+            )
+    last_sweep = sweep_instances[-1] if sweep_instances else None
+    return last_sweep if isinstance(last_sweep, BufferedSweep) else None
+
+
+def _get_buffered_params(
+    measured_all: Sequence[ParamMeasT],
+) -> tuple[ParameterBase, ...]:
+    buffered_params = []
+    for param in measured_all:
+        if not isinstance(param, ParameterBase):
+            raise ValueError(
+                "Only parameters acquired by the instrument can be measured "
+                f"in a dond with a BufferedSweep, got {param}."
+            )
+        buffered_params.append(param)
+    return tuple(buffered_params)
 
 
 def _validate_dataset_dependencies_and_names(
@@ -858,20 +1582,25 @@ def _validate_dataset_dependencies_and_names(
 
 
 def _parse_dond_arguments(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
 ) -> tuple[
-    list[AbstractSweep | TogetherSweep], list[ParamMeasT | Sequence[ParamMeasT]]
+    list[AbstractSweep | TogetherSweep | RetraceSweep],
+    list[ParamMeasT | Sequence[ParamMeasT]],
 ]:
     """
     Parse supplied arguments into sweep objects and measurement parameters
     and their callables.
     """
-    sweep_instances: list[AbstractSweep | TogetherSweep] = []
+    sweep_instances: list[AbstractSweep | TogetherSweep | RetraceSweep] = []
     params_meas: list[ParamMeasT | Sequence[ParamMeasT]] = []
     for par in params:
         if isinstance(par, AbstractSweep):
             sweep_instances.append(par)
-        elif isinstance(par, TogetherSweep):
+        elif isinstance(par, (TogetherSweep, RetraceSweep)):
             sweep_instances.append(par)
         else:
             params_meas.append(par)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any, cast
+
+from tqdm.auto import tqdm
+
+from qcodes import config
+from qcodes.dataset.dond.do_nd import _DondRun
+from qcodes.dataset.dond.do_nd_utils import BreakConditionInterrupt, catch_interrupts
+from qcodes.dataset.threading import _instrument_to_param
+from qcodes.parameters import ParameterBase
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from qcodes.dataset.dond.do_nd import ParameterSetEvent
+    from qcodes.dataset.dond.do_nd_utils import (
+        ActionsT,
+        AxesTupleListWithDataSet,
+        BreakConditionT,
+        MultiAxesTupleListWithDataSet,
+        ParamMeasT,
+    )
+    from qcodes.dataset.dond.sweep_order import SweepOrder
+    from qcodes.dataset.dond.sweeps import (
+        AbstractSweep,
+        RetraceSweep,
+        TogetherSweep,
+    )
+    from qcodes.dataset.experiment_container import Experiment
+    from qcodes.dataset.threading import OutType
+
+LOG = logging.getLogger(__name__)
+
+
+async def _async_get_params(params: Sequence[ParameterBase]) -> OutType:
+    """
+    Get the given parameters one after the other.
+    """
+    return [(param, await param.async_get()) for param in params]
+
+
+async def _async_call_params(
+    param_meas: Sequence[ParamMeasT],
+    params_per_instrument: Sequence[Sequence[ParameterBase]],
+) -> OutType:
+    """
+    Call the callables among ``param_meas`` and then get all parameters.
+    The parameters of different instruments are awaited concurrently while
+    the parameters of one instrument are awaited one after the other.
+    """
+    for param in param_meas:
+        if not isinstance(param, ParameterBase) and callable(param):
+            param()
+    results = await asyncio.gather(
+        *(_async_get_params(params) for params in params_per_instrument)
+    )
+    return [result for instrument_results in results for result in instrument_results]
+
+
+async def _async_apply_set_event(
+    set_event: ParameterSetEvent, results: dict[ParameterBase, Any]
+) -> None:
+    """
+    The asynchronous counterpart of the setting done for each set event
+    in :func:`dond`.
+    """
+    if set_event.should_set:
+        await set_event.parameter.async_set(set_event.new_value)
+        for act in set_event.actions:
+            act()
+        await asyncio.sleep(set_event.delay)
+
+    if set_event.get_after_set:
+        results[set_event.parameter] = await set_event.parameter.async_get()
+    else:
+        results[set_event.parameter] = set_event.new_value
+
+
+async def adond(
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
+    write_period: float | None = None,
+    measurement_name: str | Sequence[str] = "",
+    exp: Experiment | Sequence[Experiment] | None = None,
+    enter_actions: ActionsT = (),
+    exit_actions: ActionsT = (),
+    do_plot: bool | None = None,
+    show_progress: bool | None = None,
+    additional_setpoints: Sequence[ParameterBase] = tuple(),
+    log_info: str | None = None,
+    break_condition: BreakConditionT | None = None,
+    dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
+    in_memory_cache: bool | None = None,
+    order: SweepOrder = "row_major",
+    squeeze: bool = True,
+) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet:
+    """
+    Perform n-dimentional scan on an asyncio event loop. This is the
+    asynchronous counterpart of :func:`dond` and takes the same arguments,
+    except for ``use_threads`` and ``pipelined``.
+
+    Setpoints are set with ``async_set`` and the measured parameters are
+    acquired with ``async_get``. The parameters of different instruments
+    are acquired concurrently on the event loop while the parameters of
+    one instrument are acquired one after the other. Parameters that do
+    not implement a natively asynchronous transport are called in a worker
+    thread. Callables among the measured parameters are called before the
+    parameters are acquired. ``BufferedSweep`` and ``AdaptiveSweep`` are not
+    supported.
+
+    Usage:
+
+        .. code-block:: python
+
+           dataset, _, _ = await adond(LinSweep(dac.ch1, 0, 1, 101), dmm.v1)
+
+    Returns:
+        The same as :func:`dond`.
+
+    """
+    if do_plot is None:
+        do_plot = cast(bool, config.dataset.dond_plot)
+    if show_progress is None:
+        show_progress = config.dataset.dond_show_progress
+
+    run = _DondRun(
+        params,
+        write_period=write_period,
+        measurement_name=measurement_name,
+        exp=exp,
+        enter_actions=enter_actions,
+        exit_actions=exit_actions,
+        additional_setpoints=additional_setpoints,
+        log_info=log_info,
+        break_condition=break_condition,
+        dataset_dependencies=dataset_dependencies,
+        order=order,
+    )
+    if run.buffered_sweep is not None:
+        raise ValueError("adond does not support BufferedSweep.")
+    if run.adaptive_sweep is not None:
+        raise ValueError("adond does not support AdaptiveSweep.")
+    measurements = run.measurements
+
+    LOG.info(
+        "Starting an adond with scan with\n setpoints: %s,\n measuring: %s",
+        run.sweeper.all_setpoint_params,
+        measurements.measured_all,
+    )
+
+    params_per_instrument = tuple(
+        _instrument_to_param(measurements.measured_all).values()
+    )
+
+    interrupted: Callable[  # noqa E731
+        [], KeyboardInterrupt | BreakConditionInterrupt | None
+    ] = lambda: None
+    try:
+        with catch_interrupts() as interrupted, ExitStack() as stack:
+            run.enter_datasavers(stack, in_memory_cache)
+            run.enter_store(stack, await _async_get_params(additional_setpoints))
+
+            for step, set_events in enumerate(
+                tqdm(run.loop_sweeper, disable=not show_progress)
+            ):
+                LOG.debug("Processing set events: %s", set_events)
+                results: dict[ParameterBase, Any] = {}
+                for set_event in set_events:
+                    await _async_apply_set_event(set_event, results)
+
+                meas_value_pair = await _async_call_params(
+                    measurements.measured_all, params_per_instrument
+                )
+                for meas_param, value in meas_value_pair:
+                    results[meas_param] = value
+
+                run.store_point(step, results)
+    finally:
+        run.handle_plotting(do_plot, interrupted())
+
+    return run.output(squeeze)
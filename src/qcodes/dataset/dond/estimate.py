@@ -0,0 +1,288 @@
+"""
+Estimate the duration of a sweep without running it.
+
+The time spent setting the swept parameters is simulated from the setpoints
+of the sweeps, their delays and the ``step``, ``inter_delay`` and
+``post_delay`` of the parameters, including the ramps back to the start of
+each line. The time spent measuring is estimated from a few timed calls of
+each measured parameter. No dataset is written.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from qcodes import config
+from qcodes.dataset.dond.do_nd import (
+    _get_adaptive_sweep,
+    _get_buffered_sweep,
+    _Measurements,
+    _parse_dond_arguments,
+    _Sweeper,
+)
+from qcodes.dataset.dond.sweep_order import _axis_set_times, _param_set_times
+from qcodes.dataset.dond.sweeps import AdaptiveSweep, LinSweep
+from qcodes.parameters import ParameterBase
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qcodes.dataset.dond.do_nd_utils import ParamMeasT
+    from qcodes.dataset.dond.sweep_order import SweepOrder
+    from qcodes.dataset.dond.sweeps import (
+        AbstractSweep,
+        RetraceSweep,
+        TogetherSweep,
+    )
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass
+class MeasurementTimeEstimate:
+    """
+    The estimated duration of a sweep.
+
+    Args:
+        n_points: The number of points of the sweep.
+        set_time: The time spent setting the swept parameters including
+            ramps and delays.
+        measure_time: The time spent acquiring the measured parameters.
+        get_latencies: The median sampled latency of each measured parameter
+            and callable by name.
+        per_instrument: The time each instrument is busy setting and
+            measuring by the full name of the instrument. Parameters
+            without an instrument and callables are collected under None.
+
+    """
+
+    n_points: int
+    set_time: float
+    measure_time: float
+    get_latencies: dict[str, float]
+    per_instrument: dict[str | None, float]
+
+    @property
+    def total(self) -> float:
+        """
+        The estimated total duration of the sweep.
+        """
+        return self.set_time + self.measure_time
+
+    def __str__(self) -> str:
+        lines = [
+            f"Estimated duration of {self.n_points} points: {self.total:.3g} s",
+            f"  setting parameters: {self.set_time:.3g} s",
+            f"  measuring: {self.measure_time:.3g} s",
+            "Per instrument:",
+        ]
+        for name, busy_time in sorted(
+            self.per_instrument.items(), key=lambda item: -item[1]
+        ):
+            lines.append(f"  {name}: {busy_time:.3g} s")
+        return "\n".join(lines)
+
+
+def _instrument_name(param: ParamMeasT) -> str | None:
+    if isinstance(param, ParameterBase) and param.underlying_instrument is not None:
+        return param.underlying_instrument.full_name
+    return None
+
+
+def _name(param: ParamMeasT) -> str:
+    if isinstance(param, ParameterBase):
+        return param.full_name
+    return getattr(param, "__name__", repr(param))
+
+
+def _sample_latency(param: ParamMeasT, n_samples: int) -> float:
+    """
+    The median time it takes to get a parameter or call a callable.
+    """
+    latencies = []
+    for _ in range(n_samples):
+        t_start = time.perf_counter()
+        if isinstance(param, ParameterBase):
+            param.get()
+        else:
+            param()
+        latencies.append(time.perf_counter() - t_start)
+    return float(np.median(latencies))
+
+
+def estimate_dond(
+    *params: AbstractSweep
+    | TogetherSweep
+    | RetraceSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
+    use_threads: bool | None = None,
+    order: SweepOrder = "row_major",
+    n_samples: int = 3,
+) -> MeasurementTimeEstimate:
+    """
+    Estimate the duration of a :func:`dond` without running it. The sweeps
+    and measured parameters are given as for :func:`dond`.
+
+    Each measured parameter is got and each callable is called
+    ``n_samples`` times to sample their latency. The swept parameters are
+    not set. Their setting time is simulated from the setpoints and delays
+    of the sweeps and the ``step``, ``inter_delay`` and ``post_delay`` of
+    the parameters. The time spent on post actions and on storing the data
+    is not included.
+
+    The setpoints of an ``AdaptiveSweep`` are assumed to be evenly spaced
+    and all of its ``num_points`` are assumed to be measured. A
+    ``BufferedSweep`` is assumed to take its ``delay`` per point.
+
+    Args:
+        *params: The sweeps and the parameters and callables to measure.
+        use_threads: Estimate the duration of a measurement in which the
+            instruments are measured concurrently. If None the value will
+            be read from ``qcodesrc.json``.
+        order: The order in which the setpoints are traversed, see
+            :func:`dond`.
+        n_samples: The number of times each measured parameter is sampled.
+
+    Returns:
+        The estimated duration with a breakdown per instrument.
+
+    """
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be at least 1, got {n_samples}.")
+    if use_threads is None:
+        use_threads = config.dataset.use_threads
+
+    sweep_instances, params_meas = _parse_dond_arguments(*params)
+    buffered_sweep = _get_buffered_sweep(sweep_instances)
+    adaptive_sweep = _get_adaptive_sweep(sweep_instances)
+    measured_all, _, _ = _Measurements._extract_parameters_by_type_and_group(
+        params_meas
+    )
+    inner_sweep = buffered_sweep or adaptive_sweep
+    loop_sweeper = _Sweeper(
+        sweep_instances[:-1] if inner_sweep is not None else sweep_instances,
+        (),
+        order,
+    )
+    n_loop_points = len(loop_sweeper)
+    n_inner_points = inner_sweep.num_points if inner_sweep is not None else 1
+
+    per_instrument: dict[str | None, float] = defaultdict(float)
+
+    set_time = 0.0
+    for param, param_set_time in _param_set_times(
+        loop_sweeper.set_time_axes, loop_sweeper.traversal
+    ):
+        set_time += param_set_time
+        per_instrument[_instrument_name(param)] += param_set_time
+    if isinstance(inner_sweep, AdaptiveSweep):
+        # the adaptive sweep is repeated for each point of the outer sweeps
+        pass_time, return_time = _axis_set_times(
+            [
+                (
+                    inner_sweep.param,
+                    np.linspace(
+                        inner_sweep.start, inner_sweep.stop, inner_sweep.num_points
+                    ),
+                    inner_sweep.delay,
+                )
+            ]
+        )
+        inner_set_time = n_loop_points * pass_time + (n_loop_points - 1) * return_time
+        set_time += inner_set_time
+        per_instrument[_instrument_name(inner_sweep.param)] += inner_set_time
+
+    get_latencies: dict[str, float] = {}
+    measure_time = 0.0
+    if buffered_sweep is not None:
+        buffered_time = buffered_sweep.num_points * buffered_sweep.delay
+        measure_time = n_loop_points * buffered_time
+        per_instrument[_instrument_name(buffered_sweep.param)] += measure_time
+    else:
+        instrument_latencies: dict[str | None, float] = defaultdict(float)
+        for param_meas in measured_all:
+            if use_threads and not isinstance(param_meas, ParameterBase):
+                # callables are not called when measuring in threads
+                continue
+            latency = _sample_latency(param_meas, n_samples)
+            get_latencies[_name(param_meas)] = latency
+            instrument_latencies[_instrument_name(param_meas)] += latency
+        n_points = n_loop_points * n_inner_points
+        for instrument, latency in instrument_latencies.items():
+            per_instrument[instrument] += n_points * latency
+        point_latencies = instrument_latencies.values()
+        point_time = (
+            max(point_latencies, default=0.0) if use_threads else sum(point_latencies)
+        )
+        measure_time = n_points * point_time
+
+    estimate = MeasurementTimeEstimate(
+        n_points=n_loop_points * n_inner_points,
+        set_time=set_time,
+        measure_time=measure_time,
+        get_latencies=get_latencies,
+        per_instrument=dict(per_instrument),
+    )
+    LOG.info("%s", estimate)
+    return estimate
+
+
+def estimate_do1d(
+    param_set: ParameterBase,
+    start: float,
+    stop: float,
+    num_points: int,
+    delay: float,
+    *param_meas: ParamMeasT,
+    use_threads: bool | None = None,
+    n_samples: int = 3,
+) -> MeasurementTimeEstimate:
+    """
+    Estimate the duration of a :func:`do1d` without running it. The
+    arguments are the same as for :func:`do1d`. See :func:`estimate_dond`
+    for how the duration is estimated.
+    """
+    return estimate_dond(
+        LinSweep(param_set, start, stop, num_points, delay),
+        *param_meas,
+        use_threads=use_threads,
+        n_samples=n_samples,
+    )
+
+
+def estimate_do2d(
+    param_set1: ParameterBase,
+    start1: float,
+    stop1: float,
+    num_points1: int,
+    delay1: float,
+    param_set2: ParameterBase,
+    start2: float,
+    stop2: float,
+    num_points2: int,
+    delay2: float,
+    *param_meas: ParamMeasT,
+    use_threads: bool | None = None,
+    order: Literal["row_major", "snake"] = "row_major",
+    n_samples: int = 3,
+) -> MeasurementTimeEstimate:
+    """
+    Estimate the duration of a :func:`do2d` without running it. The
+    arguments are the same as for :func:`do2d`. See :func:`estimate_dond`
+    for how the duration is estimated.
+    """
+    return estimate_dond(
+        LinSweep(param_set1, start1, stop1, num_points1, delay1),
+        LinSweep(param_set2, start2, stop2, num_points2, delay2),
+        *param_meas,
+        use_threads=use_threads,
+        order=order,
+        n_samples=n_samples,
+    )
@@ -0,0 +1,298 @@
+"""
+Ordering of the setpoints of a sweep.
+
+By default the setpoints of a sweep are traversed in row major order: the
+last axis is the fastest and every line of it starts again from its first
+setpoint. Parameters that ramp in steps (``step`` and ``inter_delay``) or
+that wait after being set (``post_delay``) spend a lot of time returning to
+the start of every line. A snake order traverses every other line of the
+fastest axis backwards and a cost minimizing order additionally chooses
+which axes are swept fastest based on an estimate of the time spent setting
+each parameter.
+
+The results of a sweep that is snaked are still stored in row major order,
+such that the shaped cache of the dataset matches the grid of the
+setpoints. This holds back at most one line of the fastest axis. The
+results of a sweep whose axes are reordered are stored as they are
+measured instead.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, TypeVar
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from qcodes.parameters import ParameterBase
+
+    # the parameters, setpoints and delays of the sweeps along one axis
+    _AxisT: TypeAlias = Sequence[
+        tuple[ParameterBase, Sequence[Any] | np.ndarray, float]
+    ]
+
+LOG = logging.getLogger(__name__)
+
+SweepOrder = Literal["row_major", "snake", "min_cost"]
+"""
+The order in which the setpoints of a sweep are traversed. ``"row_major"``
+sweeps the last axis fastest and starts every line from its first setpoint.
+``"snake"`` traverses every other line of the last axis backwards, such
+that it does not return to its first setpoint.
+``"min_cost"`` chooses the order of the axes and whether to snake such that
+the estimated time spent setting parameters is minimal.
+"""
+
+# the number of axes up to which all orders of the axes are compared
+_MAX_PERMUTED_AXES = 6
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _Traversal:
+    """
+    A traversal of a grid of setpoints.
+
+    Args:
+        nesting: The axes of the grid from the slowest to the fastest.
+        snake: If True every other line of the fastest axis is traversed
+            backwards.
+        retraced: Axes that are traversed backwards when the index along
+            the axis preceding them, the direction of a ``RetraceSweep``,
+            is 1.
+
+    """
+
+    nesting: tuple[int, ...]
+    snake: bool
+    retraced: frozenset[int] = frozenset()
+
+    @classmethod
+    def row_major(
+        cls, n_axes: int, retraced: frozenset[int] = frozenset()
+    ) -> _Traversal:
+        return cls(tuple(range(n_axes)), False, retraced)
+
+    def is_row_major(self) -> bool:
+        return not self.snake and self.keeps_axis_order()
+
+    def keeps_axis_order(self) -> bool:
+        return self.nesting == tuple(range(len(self.nesting)))
+
+    def axis_indices(self, step: int, lengths: Sequence[int]) -> tuple[int, ...]:
+        """
+        The index along each axis of the grid, in the original order of the
+        axes, of the given step of the traversal.
+        """
+        indices = [0] * len(lengths)
+        higher = step
+        for axis in reversed(self.nesting):
+            length = lengths[axis]
+            index = higher % length
+            higher //= length
+            if self.snake and axis == self.nesting[-1] and higher % 2 == 1:
+                index = length - 1 - index
+            indices[axis] = index
+        for axis in self.retraced:
+            if indices[axis - 1] == 1:
+                indices[axis] = lengths[axis] - 1 - indices[axis]
+        return tuple(indices)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(
+        value, bool
+    )
+
+
+def _set_time(param: ParameterBase, old: Any, new: Any, delay: float) -> float:
+    """
+    Estimate the time it takes to set a parameter from ``old`` to ``new``
+    and wait for ``delay`` afterwards. A parameter with a ``step`` ramps in
+    steps. Each step waits for at least ``post_delay`` after it and for
+    ``inter_delay`` since the previous step.
+    """
+    try:
+        changed = bool(old != new)
+    except ValueError:
+        changed = True
+    if not changed:
+        return 0.0
+    n_steps = 1
+    step = param.step
+    if step and _is_number(old) and _is_number(new):
+        n_steps = max(1, math.ceil(round(abs(new - old) / step, 9)))
+    return delay + n_steps * max(param.inter_delay, param.post_delay)
+
+
+def _axis_set_times(axis: _AxisT) -> tuple[float, float]:
+    """
+    Estimate the time it takes to set the parameters of one axis through all
+    of its setpoints and the time to return from the last to the first
+    setpoint.
+    """
+    pass_time = 0.0
+    return_time = 0.0
+    for param, values, delay in axis:
+        if len(values) == 0:
+            continue
+        pass_time += sum(
+            _set_time(param, old, new, delay) for old, new in itertools.pairwise(values)
+        )
+        return_time += _set_time(param, values[-1], values[0], delay)
+    return pass_time, return_time
+
+
+def _traversal_set_time(
+    axis_set_times: Sequence[tuple[float, float]],
+    lengths: Sequence[int],
+    traversal: _Traversal,
+) -> float:
+    total = 0.0
+    n_passes = 1
+    for axis in traversal.nesting:
+        pass_time, return_time = axis_set_times[axis]
+        total += n_passes * pass_time
+        snaked = traversal.snake and axis == traversal.nesting[-1]
+        if not snaked and axis not in traversal.retraced:
+            total += (n_passes - 1) * return_time
+        n_passes *= lengths[axis]
+    return total
+
+
+def _param_set_times(
+    axes: Sequence[_AxisT], traversal: _Traversal
+) -> list[tuple[ParameterBase, float]]:
+    """
+    Estimate the time spent setting each parameter of the given axes when
+    traversing them with the given traversal.
+    """
+    lengths = tuple(len(axis[0][1]) if axis else 0 for axis in axes)
+    no_set_times = [(0.0, 0.0)] * len(axes)
+    set_times = []
+    for axis_index, axis in enumerate(axes):
+        for param, values, delay in axis:
+            axis_set_times = list(no_set_times)
+            axis_set_times[axis_index] = _axis_set_times([(param, values, delay)])
+            set_times.append(
+                (param, _traversal_set_time(axis_set_times, lengths, traversal))
+            )
+    return set_times
+
+
+@dataclass(frozen=True)
+class _TraversalEstimate:
+    traversal: _Traversal
+    set_time: float
+    row_major_set_time: float
+
+
+def _choose_traversal(axes: Sequence[_AxisT], order: SweepOrder) -> _TraversalEstimate:
+    """
+    Choose the traversal of a grid of setpoints for the given order and
+    estimate the time spent setting parameters with it and with the row
+    major order.
+    """
+    if order not in ("row_major", "snake", "min_cost"):
+        raise ValueError(
+            f"Invalid sweep order {order!r}, expected one of "
+            "'row_major', 'snake' or 'min_cost'."
+        )
+    n_axes = len(axes)
+    lengths = tuple(len(axis[0][1]) if axis else 0 for axis in axes)
+    axis_set_times = tuple(_axis_set_times(axis) for axis in axes)
+    row_major = _Traversal.row_major(n_axes)
+    row_major_set_time = _traversal_set_time(axis_set_times, lengths, row_major)
+
+    if order == "row_major":
+        candidates = [row_major]
+    elif order == "snake":
+        candidates = [_Traversal(row_major.nesting, True)]
+    else:
+        nestings = (
+            itertools.permutations(range(n_axes))
+            if n_axes <= _MAX_PERMUTED_AXES
+            else (row_major.nesting,)
+        )
+        candidates = [
+            _Traversal(nesting, snake)
+            for nesting in nestings
+            for snake in (False, True)
+        ]
+
+    best = candidates[0]
+    best_time = _traversal_set_time(axis_set_times, lengths, best)
+    for candidate in candidates[1:]:
+        candidate_time = _traversal_set_time(axis_set_times, lengths, candidate)
+        # ties are resolved in favour of the earlier and thus more
+        # conventional candidate
+        if candidate_time < best_time:
+            best, best_time = candidate, candidate_time
+    return _TraversalEstimate(best, best_time, row_major_set_time)
+
+
+def _report_set_time_estimate(
+    estimate: _TraversalEstimate, axis_names: Sequence[str]
+) -> None:
+    nesting = ", ".join(axis_names[axis] for axis in estimate.traversal.nesting)
+    order = "snake" if estimate.traversal.snake else "row major"
+    LOG.info(
+        f"Sweeping {nesting} (slowest to fastest) in {order} order. Setting "
+        f"parameters is estimated to take {estimate.set_time:.3g} s, saving "
+        f"{estimate.row_major_set_time - estimate.set_time:.3g} s compared to "
+        f"sweeping {', '.join(axis_names)} in row major order."
+    )
+
+
+class _GridOrderBuffer(Generic[T]):
+    """
+    Store results measured in any traversal order in row major order.
+
+    Results are added together with the row major index of the grid point
+    they belong to and several results may belong to one point. Results are
+    passed on to ``store`` as soon as all points preceding them in row major
+    order are complete. Results that are still held back when the buffer is
+    flushed, e.g. because the measurement was interrupted, are stored in row
+    major order.
+    """
+
+    def __init__(self, store: Callable[[T], None]):
+        self._store = store
+        self._next = 0
+        self._pending: dict[int, list[T]] = {}
+        self._complete: set[int] = set()
+
+    def add(self, grid_index: int, results: T) -> None:
+        if grid_index == self._next:
+            self._store(results)
+        else:
+            self._pending.setdefault(grid_index, []).append(results)
+
+    def complete(self, grid_index: int) -> None:
+        """
+        Mark that all results of a grid point have been added.
+        """
+        if grid_index != self._next:
+            self._complete.add(grid_index)
+            return
+        self._next += 1
+        while True:
+            for results in self._pending.pop(self._next, ()):
+                self._store(results)
+            if self._next not in self._complete:
+                return
+            self._complete.remove(self._next)
+            self._next += 1
+
+    def flush(self) -> None:
+        for grid_index in sorted(self._pending):
+            for results in self._pending.pop(grid_index):
+                self._store(results)
+        self._complete.clear()
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    Protocol,
+    TypeAlias,
+    TypeVar,
+)
 
 import numpy as np
 import numpy.typing as npt
 
+from qcodes.parameters import ManualParameter
+from qcodes.validators import Enum
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Mapping, Sequence
 
     from qcodes.dataset.dond.do_nd_utils import ActionsT
     from qcodes.parameters import ParameterBase
 
 T = TypeVar("T", bound=np.generic)
 
+AdaptiveLossT: TypeAlias = "Callable[[npt.NDArray[np.float64], npt.NDArray[np.float64]], npt.NDArray[np.float64]]"
+"""
+A loss function for an :class:`AdaptiveSweep`. It takes the setpoints
+measured so far in increasing order and the corresponding measured values,
+both scaled to the unit interval, and returns the loss of each of the
+intervals between consecutive setpoints. The next setpoint is placed in
+the middle of the interval with the largest loss.
+"""
+
 
 class AbstractSweep(ABC, Generic[T]):
     """
@@ -247,6 +267,319 @@ class ArraySweep(AbstractSweep, Generic[T]):
         return self._get_after_set
 
 
+class BufferedSweepBackend(Protocol):
+    """
+    Protocol implemented by instruments that can execute a 1D sweep
+    natively, e.g. using an internal source sweep, a trigger model or a
+    capture buffer, and return the data of the whole sweep at once.
+    """
+
+    def run_buffered_sweep(
+        self,
+        param: ParameterBase,
+        setpoints: npt.NDArray,
+        delay: float,
+        measured: Sequence[ParameterBase],
+    ) -> Mapping[ParameterBase, npt.NDArray]:
+        """
+        Sweep ``param`` over ``setpoints``, waiting ``delay`` seconds at
+        each point, and acquire the ``measured`` parameters at every point.
+
+        Returns:
+            A mapping from each of the measured parameters to an array with
+            one value per setpoint.
+
+        Raises:
+            ValueError: If the instrument cannot sweep ``param`` or acquire
+                one of the ``measured`` parameters.
+
+        """
+        ...
+
+
+class BufferedSweep(AbstractSweep, Generic[T]):
+    """
+    Sweep the values of a given array using an instrument that executes the
+    whole sweep natively. This is only supported as the innermost (last)
+    sweep of a dond. Rather than setting and measuring each point, dond
+    hands the whole sweep to the instrument and stores the acquired buffers
+    as one block. All measured parameters must be acquired by the
+    instrument.
+
+    Args:
+        param: Qcodes parameter to sweep.
+        array: array with values to sweep.
+        backend: The instrument that executes the sweep.
+        delay: Time in seconds between two consecutive sweep points. This
+            is passed to the instrument.
+
+    """
+
+    def __init__(
+        self,
+        param: ParameterBase,
+        array: Sequence[Any] | npt.NDArray[T],
+        backend: BufferedSweepBackend,
+        delay: float = 0,
+    ):
+        self._param = param
+        self._array = np.array(array)
+        self._backend = backend
+        self._delay = delay
+
+    def get_setpoints(self) -> npt.NDArray[T]:
+        return self._array
+
+    @property
+    def param(self) -> ParameterBase:
+        return self._param
+
+    @property
+    def backend(self) -> BufferedSweepBackend:
+        return self._backend
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    @property
+    def num_points(self) -> int:
+        return len(self._array)
+
+    @property
+    def post_actions(self) -> ActionsT:
+        return ()
+
+    def run(
+        self, measured: Sequence[ParameterBase]
+    ) -> dict[ParameterBase, npt.NDArray]:
+        """
+        Execute the sweep on the instrument.
+
+        Returns:
+            A mapping from the swept parameter and each of the measured
+            parameters to an array with one value per setpoint.
+
+        """
+        buffers = self._backend.run_buffered_sweep(
+            self._param, self._array, self._delay, measured
+        )
+        results: dict[ParameterBase, npt.NDArray] = {self._param: self._array}
+        for param in measured:
+            if param not in buffers:
+                raise ValueError(f"{self._backend} did not acquire {param}.")
+            buffer = np.asarray(buffers[param])
+            if len(buffer) != self.num_points:
+                raise ValueError(
+                    f"{self._backend} acquired {len(buffer)} values of "
+                    f"{param} but the sweep has {self.num_points} points."
+                )
+            results[param] = buffer
+        return results
+
+
+def _interval_lengths(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    return np.hypot(np.diff(x), np.diff(y))
+
+
+def distance_loss(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    The length of each interval in the plane of the scaled setpoints and
+    measured values. This samples evenly along the curve, so steep regions
+    are sampled more densely than flat ones.
+    """
+    return _interval_lengths(x, y)
+
+
+def gradient_loss(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    The change of the scaled measured value over each interval. This puts
+    almost all points in the regions where the measured value changes, e.g.
+    on the flanks of resonances and transitions.
+    """
+    return np.abs(np.diff(y))
+
+
+def curvature_loss(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    The length of each interval plus the square root of the area of the
+    triangles that it forms with its neighboring points. Compared to
+    :func:`distance_loss` this puts more points in regions where the
+    measured value bends, e.g. at the top of peaks.
+    """
+    loss = _interval_lengths(x, y)
+    if len(x) < 3:
+        return loss
+    areas = 0.5 * np.abs(
+        (x[1:-1] - x[:-2]) * (y[2:] - y[:-2]) - (x[2:] - x[:-2]) * (y[1:-1] - y[:-2])
+    )
+    neighbor_area = np.zeros_like(loss)
+    # each triangle (i, i+1, i+2) is adjacent to the intervals i and i+1
+    neighbor_area[:-1] = areas
+    neighbor_area[1:] = np.maximum(neighbor_area[1:], areas)
+    return loss + np.sqrt(neighbor_area)
+
+
+class AdaptiveSweep(AbstractSweep[np.float64]):
+    """
+    Sweep that chooses each setpoint based on the data measured so far. It
+    starts with ``initial_points`` evenly spaced setpoints and then
+    repeatedly splits the interval between two measured setpoints that has
+    the largest loss, such that the measurement time is spent in the
+    interesting regions.
+
+    This is only supported as the innermost (last) sweep of a dond and
+    cannot be part of a :class:`TogetherSweep`. If there are outer sweeps,
+    the adaptive sweep is repeated from scratch for every outer setpoint.
+    Since the setpoints depend on the measured data they are stored in the
+    order in which they are measured, i.e. they are not sorted.
+
+    Args:
+        param: Qcodes parameter to sweep.
+        start: Sweep start value.
+        stop: Sweep end value.
+        num_points: Maximum number of sweep points.
+        target: The measured parameter whose values drive the sampling. If
+            None, the first measured parameter of the dond is used.
+        loss: Function computing the loss of each interval, see
+            :data:`AdaptiveLossT`. Defaults to :func:`distance_loss`.
+        loss_goal: If given, the sweep stops before ``num_points`` once the
+            largest loss of all intervals is below this value.
+        min_interval: Intervals shorter than this are not split any further.
+            Defaults to ``abs(stop - start) / (100 * num_points)``.
+        initial_points: Number of evenly spaced setpoints measured before
+            sampling adaptively. At least 2.
+        delay: Time in seconds between two consecutive sweep points.
+        post_actions: Actions to do after each sweep point.
+
+    """
+
+    def __init__(
+        self,
+        param: ParameterBase,
+        start: float,
+        stop: float,
+        num_points: int,
+        target: ParameterBase | None = None,
+        loss: AdaptiveLossT | None = None,
+        loss_goal: float | None = None,
+        min_interval: float | None = None,
+        initial_points: int = 3,
+        delay: float = 0,
+        post_actions: ActionsT = (),
+    ):
+        if initial_points < 2:
+            raise ValueError("An AdaptiveSweep needs at least 2 initial points.")
+        if start == stop:
+            raise ValueError("The start and stop of an AdaptiveSweep must differ.")
+        self._param = param
+        self._start = start
+        self._stop = stop
+        self._num_points = num_points
+        self.target = target
+        self._loss = loss if loss is not None else distance_loss
+        self._loss_goal = loss_goal
+        self._min_interval = (
+            min_interval
+            if min_interval is not None
+            else abs(stop - start) / (100 * num_points)
+        )
+        self._initial_points = min(initial_points, num_points)
+        self._delay = delay
+        self._post_actions = post_actions
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all measured data and start a new sweep.
+        """
+        self._setpoints: list[float] = []
+        self._values: list[float] = []
+
+    def get_setpoints(self) -> npt.NDArray[np.float64]:
+        """
+        The setpoints measured so far in the current sweep, in the order in
+        which they were measured.
+        """
+        return np.array(self._setpoints, dtype=np.float64)
+
+    def next_setpoint(self) -> float | None:
+        """
+        Return the next setpoint to measure, or None if the sweep is done.
+        """
+        n_measured = len(self._setpoints)
+        if n_measured >= self._num_points:
+            return None
+        if n_measured < self._initial_points:
+            return float(
+                np.linspace(self._start, self._stop, self._initial_points)[n_measured]
+            )
+
+        order = np.argsort(self._setpoints)
+        x = np.array(self._setpoints)[order]
+        y = np.array(self._values, dtype=np.float64)[order]
+
+        x_scaled = (x - min(self._start, self._stop)) / abs(self._stop - self._start)
+        finite = np.isfinite(y)
+        y_range = np.ptp(y[finite]) if finite.any() else 0
+        y_scaled = (y - (y[finite].min() if finite.any() else 0)) / (y_range or 1)
+
+        losses = np.nan_to_num(np.asarray(self._loss(x_scaled, y_scaled)), nan=0.0)
+        losses[np.diff(x) < 2 * self._min_interval] = 0.0
+        interval = int(np.argmax(losses))
+        largest_loss = losses[interval]
+        if largest_loss <= 0 or (
+            self._loss_goal is not None and largest_loss < self._loss_goal
+        ):
+            return None
+        return float((x[interval] + x[interval + 1]) / 2)
+
+    def tell(self, setpoint: float, value: float) -> None:
+        """
+        Record the measured value of the target parameter at a setpoint.
+        """
+        self._setpoints.append(setpoint)
+        try:
+            self._values.append(float(value))
+        except (TypeError, ValueError):
+            self._values.append(np.nan)
+
+    @property
+    def param(self) -> ParameterBase:
+        return self._param
+
+    @property
+    def start(self) -> float:
+        return self._start
+
+    @property
+    def stop(self) -> float:
+        return self._stop
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    @property
+    def num_points(self) -> int:
+        """
+        The maximum number of sweep points.
+        """
+        return self._num_points
+
+    @property
+    def post_actions(self) -> ActionsT:
+        return self._post_actions
+
+
 class TogetherSweep:
     """
     A combination of Multiple sweeps that are to be performed in parallel
@@ -281,3 +614,86 @@ class TogetherSweep:
     @property
     def num_points(self) -> int:
         return self.sweeps[0].num_points
+
+
+class RetraceSweep:
+    """
+    A sweep that is traversed forward and then backward, such that the
+    backward trace replaces the ramp back to the start of the sweep.
+
+    Any sweep of a dond, except for a ``BufferedSweep`` or an
+    ``AdaptiveSweep``, may be retraced. The forward and backward traces are
+    swept one after the other for each point of the sweeps outside of the
+    retraced sweep.
+
+    If ``store`` is ``"datasets"`` the backward traces are stored in
+    separate datasets whose names are prefixed with ``"retrace"``. Only one
+    sweep of a dond may be retraced into separate datasets. If ``store`` is
+    ``"dimension"`` the :attr:`direction` of the trace, 0 for forward and 1
+    for backward, is stored as an additional setpoint that is swept just
+    outside of the retraced sweep. The points of the backward traces are
+    then stored in the order of the forward traces, such that the shaped
+    data of the dataset matches the grid of the setpoints.
+
+    Args:
+        sweep: The sweep to retrace.
+        store: Store the backward traces in separate ``"datasets"`` or as an
+            additional ``"dimension"`` of the datasets.
+
+    """
+
+    def __init__(
+        self,
+        sweep: AbstractSweep | TogetherSweep,
+        store: Literal["datasets", "dimension"] = "datasets",
+    ):
+        sub_sweeps = sweep.sweeps if isinstance(sweep, TogetherSweep) else (sweep,)
+        for sub_sweep in sub_sweeps:
+            if isinstance(sub_sweep, (BufferedSweep, AdaptiveSweep)):
+                raise ValueError(
+                    "A BufferedSweep or an AdaptiveSweep cannot be retraced, "
+                    f"got {sub_sweep}."
+                )
+        if store not in ("datasets", "dimension"):
+            raise ValueError(
+                f"Invalid store {store!r}, expected 'datasets' or 'dimension'."
+            )
+        self._sweep = sweep
+        self._store = store
+        param = sub_sweeps[0].param
+        self._direction = ManualParameter(
+            f"{param.full_name}_direction",
+            label=f"{param.full_name} direction",
+            initial_value=0,
+            vals=Enum(0, 1),
+        )
+        self._direction_sweep = ArraySweep(self._direction, np.array([0, 1]))
+
+    @property
+    def sweep(self) -> AbstractSweep | TogetherSweep:
+        return self._sweep
+
+    @property
+    def store(self) -> Literal["datasets", "dimension"]:
+        return self._store
+
+    @property
+    def direction(self) -> ManualParameter:
+        """
+        The direction of the trace, 0 for forward and 1 for backward.
+        """
+        return self._direction
+
+    @property
+    def direction_sweep(self) -> ArraySweep:
+        """
+        The sweep of the direction of the trace.
+        """
+        return self._direction_sweep
+
+    @property
+    def num_points(self) -> int:
+        """
+        The number of points of the forward and backward traces together.
+        """
+        return 2 * self._sweep.num_points
@@ -0,0 +1,191 @@
+"""
+Local inter-process feed of the data of a running measurement.
+
+A :class:`.DataSaver` can publish every block of results it flushes on a
+local socket (a Unix domain socket on POSIX and a named pipe on Windows).
+Any process on the same machine can follow the measurement through
+:meth:`.DataSetProtocol.live_stream` without reading from the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+from multiprocessing.connection import Client, Listener
+from queue import Queue
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from multiprocessing.connection import Connection
+    from types import TracebackType
+
+    import numpy as np
+
+log = logging.getLogger(__name__)
+
+_HELLO = "qcodes_live_stream_hello"
+
+
+def live_stream_address(guid: str) -> str:
+    """
+    Return the address of the live stream of the dataset with the given guid.
+    """
+    if sys.platform == "win32":
+        return rf"\\.\pipe\qcodes_live_{guid}"
+    return os.path.join(tempfile.gettempdir(), f"qcodes_live_{guid}.sock")
+
+
+def _authkey(guid: str) -> bytes:
+    return guid.encode("ascii")
+
+
+class _LiveStreamPublisher:
+    """
+    Publish blocks of results to all connected :class:`LiveStream` clients.
+
+    Clients are accepted on one thread and results are sent on another one,
+    so that neither a slow nor a crashed client blocks the measurement.
+    Blocks published before a client connects are not sent to it.
+    """
+
+    def __init__(self, guid: str) -> None:
+        self._guid = guid
+        self._listener = Listener(live_stream_address(guid), authkey=_authkey(guid))
+        self._clients: list[Connection] = []
+        self._lock = threading.Lock()
+        self._queue: Queue[Sequence[Mapping[str, np.ndarray]] | None] = Queue()
+
+        self._accept_thread = threading.Thread(target=self._accept, daemon=True)
+        self._send_thread = threading.Thread(target=self._send, daemon=True)
+        self._accept_thread.start()
+        self._send_thread.start()
+
+    @property
+    def address(self) -> str:
+        return live_stream_address(self._guid)
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                # the listener has been closed
+                return
+            except Exception as e:
+                # e.g. a client with a wrong authkey
+                log.warning(f"Could not accept live stream client: {e}")
+                continue
+            with self._lock:
+                try:
+                    conn.send(_HELLO)
+                except OSError:
+                    conn.close()
+                    continue
+                self._clients.append(conn)
+
+    def _send(self) -> None:
+        while True:
+            blocks = self._queue.get()
+            with self._lock:
+                for conn in tuple(self._clients):
+                    try:
+                        conn.send(blocks)
+                    except OSError:
+                        log.debug("Dropping disconnected live stream client")
+                        self._clients.remove(conn)
+                        conn.close()
+            if blocks is None:
+                return
+
+    def publish(self, blocks: Sequence[Mapping[str, np.ndarray]]) -> None:
+        """
+        Send a sequence of blocks, each mapping parameter names to the values
+        of one call to ``add_result``, to all connected clients. This does
+        not block.
+        """
+        if blocks:
+            self._queue.put(blocks)
+
+    def close(self) -> None:
+        """
+        Send all remaining blocks, notify the clients that the stream has
+        ended and stop accepting new clients.
+        """
+        self._queue.put(None)
+        self._send_thread.join()
+        self._listener.close()
+        with self._lock:
+            for conn in self._clients:
+                conn.close()
+            self._clients.clear()
+
+
+class LiveStream:
+    """
+    Client of the live stream of a running measurement.
+
+    Iterating over a :class:`LiveStream` yields lists of blocks, one list for
+    every flush of the :class:`.DataSaver`. Each block maps parameter names
+    to numpy arrays with the values of one call to ``add_result``. Iteration
+    stops when the measurement finishes. Only data flushed after the
+    connection has been made is received; data recorded before is available
+    from the dataset itself.
+
+    Not meant to be instantiated directly but rather via
+    :meth:`.DataSetProtocol.live_stream`.
+
+    Args:
+        guid: The guid of the dataset to follow.
+        timeout: Time in seconds to wait for new data before iteration
+            raises a ``TimeoutError``. None means wait forever.
+
+    """
+
+    def __init__(self, guid: str, timeout: float | None = None) -> None:
+        self._timeout = timeout
+        try:
+            self._conn = Client(live_stream_address(guid), authkey=_authkey(guid))
+        except OSError as e:
+            raise RuntimeError(
+                f"No live stream is published for dataset with guid {guid}. "
+                "Is the measurement running with live_stream=True?"
+            ) from e
+        hello = self._recv()
+        if hello != _HELLO:
+            self._conn.close()
+            raise RuntimeError(f"Unexpected live stream handshake: {hello!r}")
+
+    def _recv(self) -> Any:
+        if not self._conn.poll(self._timeout):
+            raise TimeoutError("No data received from live stream in time.")
+        return self._conn.recv()
+
+    def __iter__(self) -> Iterator[list[dict[str, np.ndarray]]]:
+        while True:
+            try:
+                blocks = self._recv()
+            except (EOFError, OSError):
+                # the publisher went away
+                blocks = None
+            if blocks is None:
+                self.close()
+                return
+            yield list(blocks)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> LiveStream:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
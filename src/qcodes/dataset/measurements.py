@@ -40,6 +40,8 @@ from qcodes.dataset.descriptions.dependencies import (
 )
 from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
 from qcodes.dataset.export_config import get_data_export_automatic
+from qcodes.dataset.live_stream import _LiveStreamPublisher
+from qcodes.dataset.sqlite.compression import resolve_compression
 from qcodes.parameters import (
     ArrayParameter,
     GroupedParameter,
@@ -47,7 +49,6 @@ from qcodes.parameters import (
     Parameter,
     ParameterBase,
     ParameterWithSetpoints,
-    expand_setpoints_helper,
 )
 from qcodes.station import Station
 from qcodes.utils import DelayedKeyboardInterrupt
@@ -55,7 +56,10 @@ from qcodes.utils import DelayedKeyboardInterrupt
 if TYPE_CHECKING:
     from types import TracebackType
 
-    from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
+    from qcodes.dataset.descriptions.versioning.rundescribertypes import (
+        Compression,
+        Shapes,
+    )
     from qcodes.dataset.experiment_container import Experiment
     from qcodes.dataset.sqlite.connection import ConnectionPlus
     from qcodes.dataset.sqlite.query_helpers import VALUE
@@ -87,9 +91,12 @@ class DataSaver:
         write_period: float,
         interdeps: InterDependencies_,
         span: trace.Span | None = None,
+        live_stream: _LiveStreamPublisher | None = None,
     ) -> None:
         self._span = span
         self._dataset = dataset
+        self._live_stream = live_stream
+        self._live_stream_blocks: list[dict[str, np.ndarray]] = []
         if (
             DataSaver.default_callback is not None
             and "run_tables_subscription_callback" in DataSaver.default_callback
@@ -120,7 +127,17 @@ class DataSaver:
         self._results: list[dict[str, VALUE]] = []
         self._last_save_time = perf_counter()
         self._known_dependencies: dict[str, list[str]] = {}
+        self._setpoints_cache: dict[
+            ParameterBase, tuple[tuple[Any, ...], list[np.ndarray], list[np.ndarray]]
+        ] = {}
         self.parent_datasets: list[DataSetProtocol] = []
+        # the parameters, index map and additional results that the packed
+        # results were last prepared for, see _add_packed_results
+        self._packed_key: tuple[Any, ...] | None = None
+        self._packed_additional: Sequence[tuple[ParameterBase, Any]] | None = None
+        self._packed_plan: (
+            tuple[tuple[ParamSpecBase, ...], dict[ParamSpecBase, np.ndarray]] | None
+        ) = None
 
         for link in self._dataset.parent_dataset_links:
             self.parent_datasets.append(load_by_guid(link.tail))
@@ -221,8 +238,105 @@ class DataSaver:
         self._validate_result_shapes(results_dict)
         self._validate_result_types(results_dict)
 
+        self._add_validated_results(results_dict)
+
+    def _add_packed_results(
+        self,
+        params: tuple[ParameterBase, ...],
+        values: Sequence[Any],
+        index_map: tuple[int, ...],
+        additional_results: Sequence[tuple[ParameterBase, Any]] = (),
+    ) -> None:
+        """
+        Add the values of the parameters at the positions ``index_map`` of
+        ``params`` together with ``additional_results``. This is equivalent
+        to calling :meth:`add_result` with these results.
+
+        This is meant to be called for every point of a measurement with
+        the same parameters. If all of them are plain parameters, whose
+        values :meth:`add_result` does not unpack, the parameters are looked
+        up and their dependencies and the ``additional_results`` are
+        validated only when the parameters, the index map or the additional
+        results change. Otherwise only the types and shapes of the values
+        are validated.
+        """
+        key = (params, index_map)
+        if key != self._packed_key or additional_results is not self._packed_additional:
+            self._packed_key = key
+            self._packed_additional = additional_results
+            self._packed_plan = self._make_packed_plan(
+                params, index_map, additional_results
+            )
+        if self._packed_plan is None:
+            self.add_result(
+                *((params[i], values[i]) for i in index_map), *additional_results
+            )
+            return
+
+        paramspecs, fixed_results = self._packed_plan
+        results_dict = {
+            paramspec: np.array(values[i])
+            for i, paramspec in zip(index_map, paramspecs)
+        }
+        self._validate_result_types(results_dict)
+        results_dict.update(fixed_results)
+        if any(array.ndim != 0 for array in results_dict.values()):
+            self._validate_result_shapes(results_dict)
+        self._add_validated_results(results_dict)
+
+    def _make_packed_plan(
+        self,
+        params: tuple[ParameterBase, ...],
+        index_map: tuple[int, ...],
+        additional_results: Sequence[tuple[ParameterBase, Any]],
+    ) -> tuple[tuple[ParamSpecBase, ...], dict[ParamSpecBase, np.ndarray]] | None:
+        """
+        The paramspecs of the parameters selected by ``index_map`` and the
+        validated additional results for :meth:`_add_packed_results`, or None
+        if the results have to be added with :meth:`add_result`.
+        """
+        selected = [params[i] for i in index_map] + [
+            param for param, _ in additional_results
+        ]
+        if not all(_is_plain_parameter(param) for param in selected):
+            return None
+        names = [param.register_name for param in selected]
+        if len(set(names)) != len(names):
+            # add_result raises for parameters with the same name
+            return None
+        id_to_paramspec = self._interdeps._id_to_paramspec
+        try:
+            paramspecs = tuple(
+                id_to_paramspec[params[i].register_name] for i in index_map
+            )
+            fixed_results = {
+                id_to_paramspec[param.register_name]: np.array(value)
+                for param, value in additional_results
+            }
+        except KeyError:
+            # add_result raises for parameters that are not registered
+            return None
+        # only the parameters present matter for the dependencies
+        present: dict[ParamSpecBase, Any] = dict.fromkeys(paramspecs)
+        present.update(fixed_results)
+        self._validate_result_deps(present)
+        self._validate_result_types(fixed_results)
+        return paramspecs, fixed_results
+
+    def _add_validated_results(
+        self, results_dict: dict[ParamSpecBase, np.ndarray]
+    ) -> None:
+        """
+        Add results that have already been unpacked into arrays and
+        validated, see :meth:`add_result`.
+        """
         self.dataset._enqueue_results(results_dict)
 
+        if self._live_stream is not None:
+            self._live_stream_blocks.append(
+                {ps.name: values for ps, values in results_dict.items()}
+            )
+
         if perf_counter() - self._last_save_time > self.write_period:
             self.flush_data_to_database()
             self._last_save_time = perf_counter()
@@ -250,18 +364,69 @@ class DataSaver:
                 "Either supply all of them or none of them."
             )
         else:
-            expanded_partial_result = expand_setpoints_helper(parameter, data)
-            for res in expanded_partial_result:
-                local_results.update(self._unpack_partial_result(res))
+            for setpoint, grid in zip(
+                parameter.setpoints, self._get_setpoint_grids(parameter)
+            ):
+                local_results.update(
+                    self._unpack_partial_result((setpoint, grid), copy=False)
+                )
+            local_results.update(self._unpack_partial_result((parameter, data)))
         return local_results
 
+    def _get_setpoint_grids(
+        self, parameter: ParameterWithSetpoints
+    ) -> list[np.ndarray]:
+        """
+        Get the setpoints of a :class:`ParameterWithSetpoints` broadcast to
+        the shape of the parameter. The grids are read-only views of the
+        setpoint axes.
+
+        The axes and grids are cached between calls. A setpoint parameter that
+        only returns its cached value is not read again as long as its cache
+        timestamp is unchanged. Any other setpoint parameter is read but the
+        cached grids are reused if the values did not change.
+        """
+        cached = self._setpoints_cache.get(parameter)
+        cached_keys: tuple[Any, ...] = cached[0] if cached is not None else ()
+        cached_axes = cached[1] if cached is not None else []
+
+        keys: list[Any] = []
+        axes: list[np.ndarray] = []
+        unchanged = cached is not None
+        for i, setpoint in enumerate(parameter.setpoints):
+            timestamp = setpoint.cache.timestamp
+            if (
+                unchanged
+                and getattr(setpoint, "_get_returns_cache", False)
+                and setpoint.cache.valid
+                and timestamp is not None
+                and cached_keys[i] == timestamp
+            ):
+                keys.append(timestamp)
+                axes.append(cached_axes[i])
+                continue
+            axis = np.array(setpoint.get())
+            axis.flags.writeable = False
+            keys.append(setpoint.cache.timestamp)
+            if unchanged and not np.array_equal(axis, cached_axes[i]):
+                unchanged = False
+            axes.append(axis)
+
+        if cached is not None and unchanged:
+            grids = cached[2]
+        else:
+            grids = _read_only_grids(axes)
+        self._setpoints_cache[parameter] = (tuple(keys), axes, grids)
+        return grids
+
     def _unpack_partial_result(
-        self, partial_result: res_type
+        self, partial_result: res_type, copy: bool = True
     ) -> dict[ParamSpecBase, np.ndarray]:
         """
         Unpack a partial result (not containing :class:`ArrayParameters` or
         class:`MultiParameters`) into a standard results dict form and return
-        that dict
+        that dict. If ``copy`` is False, numpy arrays are used without
+        copying them.
         """
         param, values = partial_result
         try:
@@ -281,7 +446,9 @@ class DataSaver:
                     "with this measurement."
                 )
             raise ValueError(err_msg)
-        return {parameter: np.array(values)}
+        if copy:
+            return {parameter: np.array(values)}
+        return {parameter: np.asarray(values)}
 
     def _unpack_arrayparameter(
         self, partial_result: res_type
@@ -408,7 +575,7 @@ class DataSaver:
                     "No setpoints registered for "
                     f"{type(parameter)} {parameter.full_name}!"
                 )
-            sps = np.array(sps)
+            sps = np.asarray(sps)
             while sps.ndim > 1:
                 # The outermost setpoint axis or an nD param is nD
                 # but the innermost is 1D. In all cases we just need
@@ -418,7 +585,7 @@ class DataSaver:
             setpoint_parameters.append(setpoint_parameter)
             setpoint_axes.append(sps)
 
-        output_grids = np.meshgrid(*setpoint_axes, indexing="ij")
+        output_grids = _read_only_grids(setpoint_axes)
         result_dict = {}
         for grid, param in zip(output_grids, setpoint_parameters):
             result_dict.update({param: grid})
@@ -500,6 +667,9 @@ class DataSaver:
 
         """
         self.dataset._flush_data_to_database(block=block)
+        if self._live_stream is not None:
+            self._live_stream.publish(self._live_stream_blocks)
+            self._live_stream_blocks = []
 
     def export_data(self) -> None:
         """Export data at end of measurement as per export_type
@@ -550,6 +720,9 @@ class Runner:
         dataset_class: DataSetType = DataSetType.DataSet,
         parent_span: trace.Span | None = None,
         registered_parameters: Sequence[ParameterBase] | None = None,
+        live_stream: bool = False,
+        compression: Compression | None = None,
+        typed_columns: bool = False,
     ) -> None:
         if in_memory_cache is None:
             in_memory_cache = qc.config.dataset.in_memory_cache
@@ -571,6 +744,8 @@ class Runner:
         self.station = station
         self._interdependencies = interdeps
         self._shapes: Shapes | None = shapes
+        self._compression: Compression | None = compression
+        self._typed_columns = typed_columns
         self.name = name if name else "results"
         self._parent_datasets = parent_datasets
         self._extra_log_info = extra_log_info
@@ -579,6 +754,8 @@ class Runner:
         self._parent_span = parent_span
         self.ds: DataSetProtocol
         self._registered_parameters = registered_parameters
+        self._live_stream = live_stream
+        self._live_stream_publisher: _LiveStreamPublisher | None = None
 
     @staticmethod
     def _calculate_write_period(
@@ -679,6 +856,8 @@ class Runner:
             write_in_background=self._write_in_background,
             shapes=self._shapes,
             parent_datasets=self._parent_datasets,
+            compression=self._compression,
+            typed_columns=self._typed_columns,
         )
 
         # register all subscribers
@@ -714,11 +893,16 @@ class Runner:
         )
         log.info(f"Using background writing: {self._write_in_background}")
 
+        if self._live_stream:
+            self._live_stream_publisher = _LiveStreamPublisher(self.ds.guid)
+            log.info(f"Publishing live stream on {self._live_stream_publisher.address}")
+
         self.datasaver = DataSaver(
             dataset=self.ds,
             write_period=self.write_period,
             interdeps=self._interdependencies,
             span=self._span,
+            live_stream=self._live_stream_publisher,
         )
 
         return self.datasaver
@@ -732,36 +916,42 @@ class Runner:
         with DelayedKeyboardInterrupt(
             context={"reason": "qcodes measurement exit", "qcodes_guid": self.ds.guid}
         ):
-            self.datasaver.flush_data_to_database(block=True)
-
-            # perform the "teardown" events
-            for func, args in self.exitactions:
-                func(*args)
-
-            if exception_type:
-                # if an exception happened during the measurement,
-                # log the exception
-                stream = io.StringIO()
-                tb_module.print_exception(
-                    exception_type, exception_value, traceback, file=stream
-                )
-                exception_string = stream.getvalue()
-                log.warning(
-                    "An exception occurred in measurement with guid: %s;"
-                    "\nTraceback:\n%s",
-                    self.ds.guid,
-                    exception_string,
-                )
-                self._span.set_status(trace.Status(trace.StatusCode.ERROR))
-                if isinstance(exception_value, Exception):
-                    self._span.record_exception(exception_value)
-                self.ds.add_metadata("measurement_exception", exception_string)
-
-            # and finally mark the dataset as closed, thus
-            # finishing the measurement
-            # Note that the completion of a dataset entails waiting for the
-            # write thread to terminate (iff the write thread has been started)
-            self.ds.mark_completed()
+            try:
+                self.datasaver.flush_data_to_database(block=True)
+
+                # perform the "teardown" events
+                for func, args in self.exitactions:
+                    func(*args)
+
+                if exception_type:
+                    # if an exception happened during the measurement,
+                    # log the exception
+                    stream = io.StringIO()
+                    tb_module.print_exception(
+                        exception_type, exception_value, traceback, file=stream
+                    )
+                    exception_string = stream.getvalue()
+                    log.warning(
+                        "An exception occurred in measurement with guid: %s;"
+                        "\nTraceback:\n%s",
+                        self.ds.guid,
+                        exception_string,
+                    )
+                    self._span.set_status(trace.Status(trace.StatusCode.ERROR))
+                    if isinstance(exception_value, Exception):
+                        self._span.record_exception(exception_value)
+                    self.ds.add_metadata("measurement_exception", exception_string)
+
+                # and finally mark the dataset as closed, thus
+                # finishing the measurement
+                # Note that the completion of a dataset entails waiting for the
+                # write thread to terminate (iff the write thread has been started)
+                self.ds.mark_completed()
+            finally:
+                # close the live stream also if the teardown fails, such
+                # that its socket and threads are not leaked
+                if self._live_stream_publisher is not None:
+                    self._live_stream_publisher.close()
             if get_data_export_automatic():
                 self.datasaver.export_data()
             log.info(
@@ -809,6 +999,7 @@ class Measurement:
         self.write_period = qc.config.dataset.write_period
         self._interdeps = InterDependencies_()
         self._shapes: Shapes | None = None
+        self._compression: str | Mapping[str, str] | None = None
         self._parent_datasets: list[dict[str, str]] = []
         self._extra_log_info: str = ""
         self._registered_parameters: list[ParameterBase] = []
@@ -1393,12 +1584,33 @@ class Measurement:
         """
         self._shapes = shapes
 
+    def set_compression(self, compression: str | Mapping[str, str] | None) -> None:
+        """
+        Set the compression used to store array parameters of this
+        measurement in the database. The compression is recorded in the run
+        description and the data is decompressed transparently when read.
+        Versions of QCoDeS older than the one that introduced compression
+        cannot read compressed data. Compression is not supported by
+        :class:`.DataSetInMem`.
+
+        Args:
+            compression: Either the name of a codec to use for all parameters
+                registered with paramtype 'array', a dictionary from parameter
+                names to codecs or None to disable compression. The
+                available codecs are listed in
+                :data:`qcodes.dataset.sqlite.compression.COMPRESSION_CODECS`.
+
+        """
+        self._compression = compression
+
     def run(
         self,
         write_in_background: bool | None = None,
         in_memory_cache: bool | None = True,
         dataset_class: DataSetType = DataSetType.DataSet,
         parent_span: trace.Span | None = None,
+        live_stream: bool = False,
+        typed_columns: bool = False,
     ) -> Runner:
         """
         Returns the context manager for the experimental run
@@ -1416,6 +1628,16 @@ class Measurement:
                 with.
             parent_span: An optional opentelemetry span that this should be registered a
                 a child of if using opentelemetry.
+            live_stream: If True, every block of results flushed by the
+                ``DataSaver`` is also published on a local socket, such that
+                other processes can follow the measurement with
+                :meth:`.DataSetProtocol.live_stream` without reading the
+                database.
+            typed_columns: If True, numeric parameters are stored in
+                strictly typed REAL columns of the results table, which
+                are read back without any Python level conversion. NaN
+                values are stored as NULL together with a mask. Only
+                affects datasets stored in the database.
 
         """
         if write_in_background is None:
@@ -1437,9 +1659,33 @@ class Measurement:
             dataset_class=dataset_class,
             parent_span=parent_span,
             registered_parameters=self._registered_parameters,
+            live_stream=live_stream,
+            compression=resolve_compression(self._compression, self._interdeps),
+            typed_columns=typed_columns,
         )
 
 
+def _is_plain_parameter(param: ParameterBase) -> bool:
+    """
+    True if :meth:`DataSaver.add_result` adds the value of the parameter as
+    is rather than unpacking it.
+    """
+    return not isinstance(
+        param, (ArrayParameter, MultiParameter, ParameterWithSetpoints)
+    ) and not isinstance(param.vals, vals.Arrays)
+
+
+def _read_only_grids(axes: Sequence[np.ndarray]) -> list[np.ndarray]:
+    """
+    Broadcast 1D setpoint axes to a grid without copying them. The returned
+    arrays are read-only views of the axes.
+    """
+    grids = np.meshgrid(*axes, indexing="ij", copy=False)
+    for grid in grids:
+        grid.flags.writeable = False
+    return list(grids)
+
+
 def str_or_register_name(sp: str | ParameterBase) -> str:
     """Returns either the str passed or the register_name of the Parameter"""
     if isinstance(sp, str):
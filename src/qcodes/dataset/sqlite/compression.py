@@ -0,0 +1,172 @@
+"""
+Optional compression of array parameters stored in the results tables.
+
+Compressed arrays are stored as blobs starting with a magic prefix
+followed by the codec used. The ``array`` converter registered in
+:func:`qcodes.dataset.sqlite.database.connect` recognizes that prefix, so
+compressed and uncompressed data can be read transparently.
+
+Versions of QCoDeS older than the one that introduced compression cannot
+read compressed data. The magic prefix is the preamble of a npy file whose
+header is a message rather than a dictionary, such that these versions fail
+with an error that includes that message.
+
+The ``-shuffle`` variants of the codecs reorder the bytes of the array such
+that the n-th bytes of all elements are stored next to each other before
+compressing. For numeric data this typically improves the compression ratio
+considerably at a small cost in speed.
+"""
+
+from __future__ import annotations
+
+import bz2
+import io
+import lzma
+import sqlite3
+import struct
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from qcodes.dataset.descriptions.dependencies import InterDependencies_
+    from qcodes.dataset.descriptions.versioning.rundescribertypes import (
+        Compression,
+    )
+    from qcodes.dataset.sqlite.query_helpers import VALUE
+
+_MAGIC_HEADER = (
+    repr("Array compressed by QCoDeS. Reading it requires a newer version of QCoDeS.")
+    + "\n"
+).encode("latin1")
+MAGIC = b"\x93NUMPY\x01\x00" + struct.pack("<H", len(_MAGIC_HEADER)) + _MAGIC_HEADER
+_SHUFFLE_FLAG = 0x80
+_SHUFFLE_HEADER = struct.Struct("<IH")
+
+_COMPRESSORS: dict[str, tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]]]
+_COMPRESSORS = {
+    "zlib": (1, lambda data: zlib.compress(data, 1), zlib.decompress),
+    "lzma": (2, lambda data: lzma.compress(data, preset=1), lzma.decompress),
+    "bz2": (3, lambda data: bz2.compress(data, 9), bz2.decompress),
+}
+_DECOMPRESSORS = {codec_id: decomp for codec_id, _, decomp in _COMPRESSORS.values()}
+
+COMPRESSION_CODECS: tuple[str, ...] = tuple(
+    codec for name in _COMPRESSORS for codec in (name, f"{name}-shuffle")
+)
+"""The names of the available compression codecs."""
+
+
+def _parse_codec(codec: str) -> tuple[int, bool]:
+    name, _, shuffle = codec.partition("-")
+    if name not in _COMPRESSORS or shuffle not in ("", "shuffle"):
+        raise ValueError(
+            f"Unknown compression codec {codec!r}. "
+            f"Valid codecs are {COMPRESSION_CODECS}."
+        )
+    return _COMPRESSORS[name][0], shuffle == "shuffle"
+
+
+def compress_array(arr: np.ndarray, codec: str) -> bytes:
+    """
+    Serialize a numpy array in the npy format and compress it with the given
+    codec.
+    """
+    codec_id, shuffle = _parse_codec(codec)
+    compressor = _COMPRESSORS[codec.partition("-")[0]][1]
+
+    out = io.BytesIO()
+    np.lib.format.write_array(out, arr, version=(3, 0), allow_pickle=False)
+    raw = out.getvalue()
+
+    itemsize = arr.dtype.itemsize
+    if not shuffle or itemsize == 1:
+        return MAGIC + bytes((codec_id,)) + compressor(raw)
+
+    header_len = len(raw) - arr.nbytes
+    data = np.frombuffer(raw, dtype=np.uint8, offset=header_len)
+    shuffled = data.reshape(-1, itemsize).T.tobytes()
+    return (
+        MAGIC
+        + bytes((codec_id | _SHUFFLE_FLAG,))
+        + _SHUFFLE_HEADER.pack(header_len, itemsize)
+        + compressor(raw[:header_len] + shuffled)
+    )
+
+
+def decompress_array_bytes(blob: bytes) -> bytes:
+    """
+    Return the npy serialized array stored in a blob. Blobs that are not
+    compressed are returned unchanged.
+    """
+    if not blob.startswith(MAGIC):
+        return blob
+    flags = blob[len(MAGIC)]
+    offset = len(MAGIC) + 1
+    decompressor = _DECOMPRESSORS.get(flags & ~_SHUFFLE_FLAG)
+    if decompressor is None:
+        raise ValueError(
+            f"Array compressed with unknown codec {flags & ~_SHUFFLE_FLAG}. "
+            "It may have been written by a newer version of QCoDeS."
+        )
+    if not flags & _SHUFFLE_FLAG:
+        return decompressor(blob[offset:])
+
+    header_len, itemsize = _SHUFFLE_HEADER.unpack_from(blob, offset)
+    raw = decompressor(blob[offset + _SHUFFLE_HEADER.size :])
+    data = np.frombuffer(raw, dtype=np.uint8, offset=header_len)
+    unshuffled = data.reshape(itemsize, -1).T.tobytes()
+    return raw[:header_len] + unshuffled
+
+
+def resolve_compression(
+    compression: str | Mapping[str, str] | None, interdeps: InterDependencies_
+) -> Compression | None:
+    """
+    Resolve a compression setting into a mapping from parameter name to
+    codec. A single codec is applied to all array parameters.
+
+    Raises:
+        ValueError: If a codec is unknown or a parameter is not an
+            array parameter of the given interdependencies.
+
+    """
+    if compression is None:
+        return None
+    array_params = {ps.name for ps in interdeps.paramspecs if ps.type == "array"}
+    if isinstance(compression, str):
+        resolved = {name: compression for name in sorted(array_params)}
+    else:
+        resolved = dict(compression)
+    for name, codec in resolved.items():
+        _parse_codec(codec)
+        if name not in array_params:
+            raise ValueError(
+                f"Cannot compress parameter {name!r}. Only parameters "
+                "registered with paramtype 'array' can be compressed."
+            )
+    return resolved or None
+
+
+def compress_values(
+    keys: Sequence[str],
+    values: Sequence[Sequence[VALUE]],
+    compression: Mapping[str, str],
+) -> list[list[Any]]:
+    """
+    Compress the array values of the columns listed in ``compression`` in
+    rows of values as passed to ``insert_many_values``.
+    """
+    codecs = [compression.get(key) for key in keys]
+    return [
+        [
+            sqlite3.Binary(compress_array(value, codec))
+            if codec is not None and isinstance(value, np.ndarray)
+            else value
+            for value, codec in zip(row, codecs)
+        ]
+        for row in values
+    ]
@@ -18,6 +18,7 @@ import numpy as np
 
 import qcodes
 from qcodes.dataset.experiment_settings import reset_default_experiment_id
+from qcodes.dataset.sqlite.compression import decompress_array_bytes
 from qcodes.dataset.sqlite.connection import ConnectionPlus
 from qcodes.dataset.sqlite.db_upgrades import (
     _latest_available_version,
@@ -54,7 +55,10 @@ def _convert_array(text: bytes) -> np.ndarray:
     # Using np.lib.format.read_array (counterpart of np.lib.format.write_array)
     # npy format version 3.0 is 3 times faster than previous verions (no clean up step
     # for python 2 backward compatibility)
-    return np.lib.format.read_array(io.BytesIO(text), allow_pickle=False)
+    # Arrays may be stored compressed, see qcodes.dataset.sqlite.compression
+    return np.lib.format.read_array(
+        io.BytesIO(decompress_array_bytes(text)), allow_pickle=False
+    )
 
 
 def _convert_complex(text: bytes) -> np.complexfloating:
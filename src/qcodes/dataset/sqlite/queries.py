@@ -47,6 +47,12 @@ from qcodes.dataset.sqlite.query_helpers import (
     sql_placeholder_string,
     update_where,
 )
+from qcodes.dataset.sqlite.snapshot_store import insert_snapshot, load_snapshot
+from qcodes.dataset.sqlite.typed_columns import (
+    column_definitions,
+    is_typed,
+    not_null_condition,
+)
 from qcodes.utils import list_of_data_to_maybe_ragged_nd_array
 
 if TYPE_CHECKING:
@@ -88,6 +94,9 @@ RUNS_TABLE_COLUMNS = (
     "captured_counter",
 )
 
+# columns that are added to the "runs" table when needed but are not metadata
+_NON_METADATA_COLUMNS = (*RUNS_TABLE_COLUMNS, "snapshot_hash")
+
 
 def is_run_id_in_database(conn: ConnectionPlus, *run_ids: int) -> dict[int, bool]:
     """
@@ -236,7 +245,14 @@ def get_parameter_data_for_one_paramtree(
 ) -> tuple[dict[str, np.ndarray], int]:
     interdeps = rundescriber.interdeps
     data, paramspecs, n_rows = _get_data_for_one_param_tree(
-        conn, table_name, interdeps, output_param, start, end, callback
+        conn,
+        table_name,
+        interdeps,
+        output_param,
+        start,
+        end,
+        callback,
+        typed_columns=rundescriber.typed_columns,
     )
     if not paramspecs[0].name == output_param:
         raise ValueError(
@@ -335,6 +351,7 @@ def _get_data_for_one_param_tree(
     start: int | None,
     end: int | None,
     callback: Callable[[float], None] | None = None,
+    typed_columns: bool = False,
 ) -> tuple[list[tuple[Any, ...]], list[ParamSpecBase], int]:
     output_param_spec = interdeps._id_to_paramspec[output_param]
     # find all the dependencies of this param
@@ -350,12 +367,15 @@ def _get_data_for_one_param_tree(
         start=start,
         end=end,
         callback=callback,
+        nan_masked=is_typed(output_param_spec, typed_columns),
     )
     n_rows = len(res)
     return res, paramspecs, n_rows
 
 
-def get_parameter_db_row(conn: ConnectionPlus, table_name: str, param_name: str) -> int:
+def get_parameter_db_row(
+    conn: ConnectionPlus, table_name: str, param_name: str, nan_masked: bool = False
+) -> int:
     """
     Get the total number of not-null values of a parameter
 
@@ -363,14 +383,16 @@ def get_parameter_db_row(conn: ConnectionPlus, table_name: str, param_name: str)
         conn: Connection to the database
         table_name: Name of the table that holds the data
         param_name: Name of the parameter to get the setpoints of
+        nan_masked: Is the parameter stored in a typed column where NaN
+            values are stored as NULL and marked in a mask column
 
     Returns:
         The total number of not-null values
 
     """
     sql = f"""
-           SELECT COUNT({param_name}) FROM "{table_name}"
-           WHERE {param_name} IS NOT NULL
+           SELECT COUNT(*) FROM "{table_name}"
+           WHERE {not_null_condition(param_name, nan_masked)}
            """
     c = atomic_transaction(conn, sql)
 
@@ -399,7 +421,7 @@ def get_table_max_id(conn: ConnectionPlus, table_name: str) -> int:
 
 
 def _get_offset_limit_for_callback(
-    conn: ConnectionPlus, table_name: str, param_name: str
+    conn: ConnectionPlus, table_name: str, param_name: str, nan_masked: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Since sqlite3 does not allow to keep track of the data loading progress,
@@ -412,6 +434,8 @@ def _get_offset_limit_for_callback(
         conn: Connection to the database
         table_name: Name of the table that holds the data
         param_name: Name of the parameter to get the setpoints of
+        nan_masked: Is the parameter stored in a typed column where NaN
+            values are stored as NULL and marked in a mask column
 
     Returns:
         offset: list of SQL offset corresponding to a progress of
@@ -423,7 +447,7 @@ def _get_offset_limit_for_callback(
 
     # First, we get the number of row to be downloaded for the wanted
     # dependent parameter
-    nb_row = get_parameter_db_row(conn, table_name, param_name)
+    nb_row = get_parameter_db_row(conn, table_name, param_name, nan_masked)
 
     # Second, we get the max id of the table
     max_id = get_table_max_id(conn, table_name)
@@ -457,6 +481,7 @@ def get_parameter_tree_values(
     start: int | None = None,
     end: int | None = None,
     callback: Callable[[float], None] | None = None,
+    nan_masked: bool = False,
 ) -> list[tuple[Any, ...]]:
     """
     Get the values of one or more columns from a data table. The rows
@@ -479,6 +504,8 @@ def get_parameter_tree_values(
             nothing is returned.
         callback: Function called during the data loading every
             config.dataset.callback_percent.
+        nan_masked: Is the top level parameter stored in a typed column
+            where NaN values are stored as NULL and marked in a mask column.
 
     Returns:
         A list of list. The outer list index is row number, the inner list
@@ -502,14 +529,14 @@ def get_parameter_tree_values(
     # start and end currently not working with callback
     if start is None and end is None and callback is not None:
         offset, limit = _get_offset_limit_for_callback(
-            conn, result_table_name, toplevel_param_name
+            conn, result_table_name, toplevel_param_name, nan_masked
         )
 
     # Create the base sql query
     columns = [toplevel_param_name] + list(other_param_names)
     sql = f"""
            SELECT "{'","'.join(columns)}" FROM "{result_table_name}"
-           WHERE {toplevel_param_name} IS NOT NULL
+           WHERE {not_null_condition(toplevel_param_name, nan_masked)}
            LIMIT ? OFFSET ?
            """
 
@@ -1521,6 +1548,7 @@ def add_parameter(
     conn: ConnectionPlus,
     run_id: int,
     insert_into_results_table: bool,
+    typed_columns: bool = False,
 ) -> None:
     """
     Add parameters to the dataset
@@ -1534,6 +1562,8 @@ def add_parameter(
         run_id: id ot the run to add parameters to
         insert_into_results_table: Should the parameters be added as columns to the
            results table?
+        typed_columns: Should numeric parameters be added as typed REAL
+           columns with a NaN mask column?
         parameter: the list of ParamSpecs for parameters to add
 
     """
@@ -1544,7 +1574,8 @@ def add_parameter(
         p_names = []
         for p in parameter:
             if insert_into_results_table:
-                insert_column(atomic_conn, formatted_name, p.name, p.type)
+                for column, column_type in column_definitions(p, typed_columns):
+                    insert_column(atomic_conn, formatted_name, column, column_type)
             p_names.append(p.name)
         # get old parameters column from run table
         sql = """
@@ -1623,6 +1654,7 @@ def _create_run_table(
     formatted_name: str,
     parameters: Sequence[ParamSpecBase] | None = None,
     values: VALUES | None = None,
+    typed_columns: bool = False,
 ) -> None:
     """Create run table with formatted_name as name
 
@@ -1631,13 +1663,19 @@ def _create_run_table(
         formatted_name: the name of the table to create
         parameters: Parameters to insert in the table.
         values: Values for the parameters above.
+        typed_columns: Store numeric parameters in typed REAL columns
+            with a NaN mask column.
 
     """
     _validate_table_name(formatted_name)
 
     with atomic(conn) as atomic_conn:
         if parameters and values:
-            _parameters = ",".join(p.sql_repr() for p in parameters)
+            _parameters = ",".join(
+                f'"{column}" {column_type}'
+                for p in parameters
+                for column, column_type in column_definitions(p, typed_columns)
+            )
             query = f"""
             CREATE TABLE "{formatted_name}" (
                 id INTEGER PRIMARY KEY,
@@ -1650,7 +1688,11 @@ def _create_run_table(
                 atomic_conn, formatted_name, [p.name for p in parameters], values
             )
         elif parameters:
-            _parameters = ",".join(p.sql_repr() for p in parameters)
+            _parameters = ",".join(
+                f'"{column}" {column_type}'
+                for p in parameters
+                for column, column_type in column_definitions(p, typed_columns)
+            )
             query = f"""
             CREATE TABLE "{formatted_name}" (
                 id INTEGER PRIMARY KEY,
@@ -1746,11 +1788,15 @@ def create_run(
         if metadata:
             add_data_to_dynamic_columns(conn, run_id, metadata)
         if snapshot_raw:
-            add_data_to_dynamic_columns(conn, run_id, {"snapshot": snapshot_raw})
+            add_snapshot_to_run(conn, run_id, snapshot_raw)
         _update_experiment_run_counter(conn, exp_id, run_counter)
         if create_run_table:
             _create_run_table(
-                conn, formatted_name, description.interdeps.paramspecs, values
+                conn,
+                formatted_name,
+                description.interdeps.paramspecs,
+                values,
+                typed_columns=description.typed_columns,
             )
         else:
             formatted_name = None
@@ -1829,7 +1875,7 @@ def get_metadata_from_run_id(conn: ConnectionPlus, run_id: int) -> dict[str, Any
     """
     Get all metadata associated with the specified run
     """
-    non_metadata = RUNS_TABLE_COLUMNS
+    non_metadata = _NON_METADATA_COLUMNS
 
     metadata = {}
     possible_tags = []
@@ -1945,6 +1991,72 @@ def add_data_to_dynamic_columns(
             raise e
 
 
+def add_snapshot_to_run(
+    conn: ConnectionPlus,
+    run_id: int,
+    snapshot_raw: str,
+    deduplicate: bool | None = None,
+) -> None:
+    """
+    Store the snapshot of a run, replacing any existing snapshot of the run.
+
+    Args:
+        conn: the connection to the sqlite database
+        run_id: the run to add the snapshot to
+        snapshot_raw: the JSON encoded snapshot
+        deduplicate: store the snapshot in the content addressed snapshots
+            table, see :mod:`qcodes.dataset.sqlite.snapshot_store`, rather
+            than in the ``snapshot`` column of the run. Snapshots that cannot
+            be deduplicated are stored in the ``snapshot`` column. If None
+            the value will be read from ``qcodesrc.json``.
+
+    """
+    if deduplicate is None:
+        deduplicate = config.dataset.deduplicate_snapshots
+    with atomic(conn) as atomic_conn:
+        if deduplicate:
+            try:
+                snapshot_hash = insert_snapshot(atomic_conn, snapshot_raw)
+            except ValueError:
+                log.warning(
+                    "Could not deduplicate the snapshot of run %s, storing it as is.",
+                    run_id,
+                    exc_info=True,
+                )
+            else:
+                insert_column(atomic_conn, "runs", "snapshot_hash", "TEXT")
+                update_where(
+                    atomic_conn,
+                    "runs",
+                    "run_id",
+                    run_id,
+                    snapshot=None,
+                    snapshot_hash=snapshot_hash,
+                )
+                return
+        add_data_to_dynamic_columns(atomic_conn, run_id, {"snapshot": snapshot_raw})
+        if is_column_in_table(atomic_conn, "runs", "snapshot_hash"):
+            update_where(atomic_conn, "runs", "run_id", run_id, snapshot_hash=None)
+
+
+def get_raw_snapshot_from_run_id(conn: ConnectionPlus, run_id: int) -> str | None:
+    """
+    Get the JSON encoded snapshot of a run, whether it is stored in the
+    ``snapshot`` column of the run or in the snapshots table.
+    """
+    snapshot_raw = select_one_where(conn, "runs", "snapshot", "run_id", run_id)
+    assert isinstance(snapshot_raw, (str, type(None)))
+    if snapshot_raw is not None or not is_column_in_table(
+        conn, "runs", "snapshot_hash"
+    ):
+        return snapshot_raw
+    snapshot_hash = select_one_where(conn, "runs", "snapshot_hash", "run_id", run_id)
+    assert isinstance(snapshot_hash, (str, type(None)))
+    if snapshot_hash is None:
+        return None
+    return load_snapshot(conn, snapshot_hash)
+
+
 def get_experiment_name_from_experiment_id(conn: ConnectionPlus, exp_id: int) -> str:
     exp_name = select_one_where(conn, "experiments", "name", "exp_id", exp_id)
     assert isinstance(exp_name, str)
@@ -2181,7 +2293,7 @@ def _populate_results_table(
 
     for row in source_cursor.execute(get_data_query):
         column_names = ",".join(
-            d[0] for d in source_cursor.description[1:]
+            f'"{d[0]}"' for d in source_cursor.description[1:]
         )  # the first key is "id"
         values = tuple(val for val in row[1:])
         value_placeholders = sql_placeholder_string(len(values))
@@ -2256,8 +2368,7 @@ def get_raw_run_attributes(
     name = select_one_where(conn, "runs", "name", "guid", guid)
     assert isinstance(name, str)
 
-    rawsnapshot = select_one_where(conn, "runs", "snapshot", "guid", guid)
-    assert isinstance(rawsnapshot, (str, type(None)))
+    rawsnapshot = get_raw_snapshot_from_run_id(conn, run_id)
     output: RawRunAttributesDict = {
         "run_id": run_id,
         "experiment": experiment,
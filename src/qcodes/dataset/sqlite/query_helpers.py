@@ -295,7 +295,7 @@ def insert_many_values(
         max_var = SQLiteSettings.limits["MAX_VARIABLE_NUMBER"]
     rows_per_transaction = int(int(max_var) / no_of_columns)
 
-    _columns = ",".join(columns)
+    _columns = ",".join(f'"{column}"' for column in columns)
     _values = "(" + ",".join(["?"] * len(values[0])) + ")"
 
     a, b = divmod(no_of_rows, rows_per_transaction)
@@ -0,0 +1,196 @@
+"""
+Optional content addressed storage of the snapshots of runs.
+
+A deduplicated snapshot is split into the snapshots of the objects that it
+contains, i.e. the dicts with a ``__class__`` key such as the snapshots of
+instruments, their channels and their parameters. Each of these is stored
+once in the ``snapshots`` table keyed by the SHA-256 hash of its JSON
+encoding, in which the snapshots of the objects that it contains are
+replaced by references to their hashes. The ``snapshot_hash`` column of the
+``runs`` table refers to the snapshot of the run as a whole and the
+``snapshot`` column of the run is left empty. As consecutive runs mostly
+snapshot the same unchanged instruments and parameters, only the snapshots
+of the objects that changed take up space for each run.
+
+Reading a snapshot splices the stored JSON fragments back together, which
+gives the JSON encoding of the original snapshot as produced by ``json.dumps``
+with the default separators. Snapshots that are encoded otherwise, e.g.
+indented, cannot be joined back into the exact JSON that was stored and are
+therefore not deduplicated. Versions of QCoDeS that do not know about this
+format read deduplicated snapshots as missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+from qcodes.dataset.sqlite.connection import transaction
+
+if TYPE_CHECKING:
+    from qcodes.dataset.sqlite.connection import ConnectionPlus
+
+SNAPSHOTS_TABLE = "snapshots"
+"""The table in which the fragments of deduplicated snapshots are stored."""
+
+_REF_KEY = "__snapshot_ref__"
+_REF_PATTERN = re.compile(r'\{"__snapshot_ref__": "([0-9a-f]{64})"\}')
+# the number of variables in a query is limited to 999 in older versions of
+# SQLite
+_MAX_QUERY_VARIABLES = 999
+
+
+def _ref(snapshot_hash: str) -> dict[str, str]:
+    return {_REF_KEY: snapshot_hash}
+
+
+def split_snapshot(snapshot_raw: str) -> tuple[str, dict[str, str]]:
+    """
+    Split a JSON encoded snapshot into the fragments that are stored in the
+    snapshots table.
+
+    Args:
+        snapshot_raw: The JSON encoded snapshot.
+
+    Returns:
+        The hash of the snapshot as a whole and a mapping from the hash of
+        each fragment to the fragment.
+
+    Raises:
+        ValueError: If the snapshot contains a dict with the key that marks
+            the references between fragments or if joining the fragments
+            does not give back ``snapshot_raw``.
+
+    """
+    fragments: dict[str, str] = {}
+
+    def store(node: dict[str, Any]) -> str:
+        fragment = json.dumps(node)
+        fragment_hash = hashlib.sha256(fragment.encode("utf-8")).hexdigest()
+        fragments[fragment_hash] = fragment
+        return fragment_hash
+
+    def replace_object(node: dict[str, Any]) -> dict[str, Any]:
+        # the dicts are decoded innermost first, so the snapshots of the
+        # objects that the object contains have already been replaced
+        if _REF_KEY in node:
+            raise ValueError(
+                f"Cannot deduplicate a snapshot that contains the key {_REF_KEY}."
+            )
+        if "__class__" in node:
+            return _ref(store(node))
+        return node
+
+    root = json.loads(snapshot_raw, object_hook=replace_object)
+    if isinstance(root, dict) and _REF_KEY in root:
+        snapshot_hash = root[_REF_KEY]
+    else:
+        snapshot_hash = store(root)
+    if join_snapshot(snapshot_hash, fragments) != snapshot_raw:
+        raise ValueError(
+            "Cannot deduplicate a snapshot that is not encoded as by json.dumps "
+            "with the default settings."
+        )
+    return snapshot_hash, fragments
+
+
+def join_snapshot(snapshot_hash: str, fragments: dict[str, str]) -> str:
+    """
+    Join the fragments of a snapshot split by :func:`split_snapshot` back
+    into the JSON encoded snapshot.
+    """
+
+    def splice(match: re.Match[str]) -> str:
+        return join_snapshot(match[1], fragments)
+
+    return _REF_PATTERN.sub(splice, fragments[snapshot_hash])
+
+
+def create_snapshots_table(conn: ConnectionPlus) -> None:
+    """
+    Create the snapshots table if it does not exist yet. Needs to be called
+    within an atomic block.
+    """
+    transaction(
+        conn,
+        f"""
+        CREATE TABLE IF NOT EXISTS "{SNAPSHOTS_TABLE}" (
+            hash TEXT PRIMARY KEY,
+            snapshot TEXT NOT NULL
+        )
+        """,
+    )
+
+
+def insert_snapshot(conn: ConnectionPlus, snapshot_raw: str) -> str:
+    """
+    Store the fragments of a snapshot in the snapshots table that are not
+    stored yet. Needs to be called within an atomic block.
+
+    Args:
+        conn: The connection to the database.
+        snapshot_raw: The JSON encoded snapshot.
+
+    Returns:
+        The hash by which the snapshot can be loaded with
+        :func:`load_snapshot`.
+
+    """
+    snapshot_hash, fragments = split_snapshot(snapshot_raw)
+    create_snapshots_table(conn)
+    conn.cursor().executemany(
+        f'INSERT OR IGNORE INTO "{SNAPSHOTS_TABLE}" (hash, snapshot) VALUES (?, ?)',
+        fragments.items(),
+    )
+    return snapshot_hash
+
+
+def load_snapshot(conn: ConnectionPlus, snapshot_hash: str) -> str:
+    """
+    Load a snapshot stored with :func:`insert_snapshot` from the snapshots
+    table. The fragments of the snapshot are fetched level by level.
+
+    Args:
+        conn: The connection to the database.
+        snapshot_hash: The hash of the snapshot.
+
+    Returns:
+        The JSON encoded snapshot.
+
+    Raises:
+        RuntimeError: If a fragment of the snapshot is missing.
+
+    """
+    fragments: dict[str, str] = {}
+    pending = [snapshot_hash]
+    while pending:
+        fetched: list[str] = []
+        for start in range(0, len(pending), _MAX_QUERY_VARIABLES):
+            batch = pending[start : start + _MAX_QUERY_VARIABLES]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.cursor()
+            cursor.execute(
+                f'SELECT hash, snapshot FROM "{SNAPSHOTS_TABLE}" '
+                f"WHERE hash IN ({placeholders})",
+                batch,
+            )
+            for fragment_hash, fragment in cursor.fetchall():
+                fragments[fragment_hash] = fragment
+                fetched.append(fragment)
+        missing = set(pending).difference(fragments)
+        if missing:
+            raise RuntimeError(
+                f"The snapshot {snapshot_hash} is incomplete, the fragments "
+                f"{sorted(missing)} are missing from the {SNAPSHOTS_TABLE} table."
+            )
+        pending = list(
+            {
+                ref
+                for fragment in fetched
+                for ref in _REF_PATTERN.findall(fragment)
+                if ref not in fragments
+            }
+        )
+    return join_snapshot(snapshot_hash, fragments)
@@ -0,0 +1,98 @@
+"""
+Strictly typed storage of numeric parameters in the results tables.
+
+By default numeric parameters are stored in columns declared with the custom
+``numeric`` type. Every value read from such a column goes through a Python
+converter that decides whether it is an int, a float or a string, and NaN is
+stored as the string ``"nan"``.
+
+Runs created with typed columns instead declare numeric parameters as
+``REAL``. SQLite returns the values of those columns as Python floats without
+calling any converter. NaN is stored as NULL. Since NULL also marks rows in
+which a parameter has no value, every typed column has a companion mask
+column ``"<name>:nan"`` which is set to 1 in the rows where the value is NaN.
+The mask column name cannot clash with a parameter since parameter names
+must be valid identifiers.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qcodes.dataset.descriptions.param_spec import ParamSpecBase
+
+_NAN_MASK_SUFFIX = ":nan"
+
+
+def nan_mask_column(name: str) -> str:
+    """
+    Return the name of the column that masks the NaN values of the typed
+    column of the given parameter.
+    """
+    return f"{name}{_NAN_MASK_SUFFIX}"
+
+
+def is_typed(paramspec: ParamSpecBase, typed_columns: bool) -> bool:
+    """
+    Return True if the parameter is stored in a typed column.
+    """
+    return typed_columns and paramspec.type == "numeric"
+
+
+def column_definitions(
+    paramspec: ParamSpecBase, typed_columns: bool
+) -> list[tuple[str, str]]:
+    """
+    Return the names and sqlite types of the results table columns that hold
+    the data of a parameter.
+    """
+    if is_typed(paramspec, typed_columns):
+        return [(paramspec.name, "REAL"), (nan_mask_column(paramspec.name), "INTEGER")]
+    return [(paramspec.name, paramspec.type)]
+
+
+def not_null_condition(name: str, nan_masked: bool) -> str:
+    """
+    Return an SQL condition selecting the rows in which the parameter with
+    the given name has a value.
+    """
+    if nan_masked:
+        return f'("{name}" IS NOT NULL OR "{nan_mask_column(name)}" IS NOT NULL)'
+    return f'"{name}" IS NOT NULL'
+
+
+def mask_nan_values(
+    keys: Sequence[str],
+    values: Sequence[Sequence[Any]],
+    typed_names: Sequence[str],
+) -> tuple[list[str], list[list[Any]]]:
+    """
+    Replace NaN values of the typed parameters in rows of values as passed
+    to ``insert_many_values`` with NULL and add the corresponding mask
+    columns.
+    """
+    typed_indices = [i for i, key in enumerate(keys) if key in typed_names]
+    if not typed_indices:
+        return list(keys), [list(row) for row in values]
+
+    new_keys = list(keys) + [nan_mask_column(keys[i]) for i in typed_indices]
+    new_values = []
+    for row in values:
+        new_row = list(row)
+        masks: list[int | None] = []
+        for i in typed_indices:
+            value = new_row[i]
+            if isinstance(value, (float, np.floating)) and math.isnan(value):
+                new_row[i] = None
+                masks.append(1)
+            else:
+                masks.append(None)
+        new_row.extend(masks)
+        new_values.append(new_row)
+    return new_keys, new_values
@@ -7,10 +7,12 @@ from queue import Empty, Queue
 from threading import Thread
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from qcodes.dataset.sqlite.connection import atomic_transaction
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Mapping, Sequence
 
     from qcodes.dataset.data_set import DataSet
 
@@ -129,3 +131,167 @@ class _Subscriber(Thread):
 
     def _clean_up(self) -> None:
         self.log.debug("Stopped subscriber")
+
+
+class _BatchSubscriber(Thread):
+    """
+    Class to add a batch subscriber to a :class:`.DataSet`. Unlike the
+    :class:`_Subscriber` this does not install an SQLite trigger. Instead, the
+    :class:`.DataSet` pushes every batch of results that it writes (or
+    enqueues for writing) to the subscriber as a mapping from parameter
+    name to a column array. The callback is called with such a mapping
+    holding all rows received since the last call, the length of the
+    dataset and the state.
+
+    The _BatchSubscriber is not meant to be instantiated directly, but rather
+    used via the 'subscribe' method of the :class:`.DataSet` with
+    ``batched=True``.
+
+    NOTE: Special care shall be taken when using the *state* object: it is the
+    user's responsibility to operate with it in a thread-safe way.
+    """
+
+    def __init__(
+        self,
+        dataSet: DataSet,
+        id_: str,
+        callback: Callable[..., None],
+        state: Any | None = None,
+        loop_sleep_time: int = 0,  # in milliseconds
+        min_queue_length: int = 1,
+        callback_kwargs: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._id = id_
+
+        self.dataSet = dataSet
+        self.table_name = dataSet.table_name
+        self._data_set_len = len(dataSet)
+
+        self.state = state
+
+        self.data_queue: Queue[Any] = Queue()
+        self._pending: list[Mapping[str, np.ndarray]] = []
+        self._queue_length: int = 0
+        # convert milliseconds to seconds
+        self._loop_sleep_time = loop_sleep_time / 1000
+        self.min_queue_length = min_queue_length
+
+        if callback_kwargs is None or len(callback_kwargs) == 0:
+            self.callback = callback
+        else:
+            self.callback = functools.partial(callback, **callback_kwargs)
+
+        self.log = logging.getLogger(f"_BatchSubscriber {self._id}")
+
+    def put_batch(self, columns: Mapping[str, np.ndarray], n_rows: int) -> None:
+        """
+        Hand a block of rows to the subscriber. This is called by the
+        :class:`.DataSet` from the thread that writes the results.
+        """
+        self.data_queue.put((columns, n_rows))
+
+    def run(self) -> None:
+        self.log.debug("Starting batch subscriber")
+        self._loop()
+
+    def _call_callback_on_pending_data(self) -> None:
+        columns = _concatenate_column_blocks(self._pending)
+        self._pending = []
+        self._queue_length = 0
+        self.callback(columns, self._data_set_len, self.state)
+
+    def _loop(self) -> None:
+        while True:
+            item = self.data_queue.get()
+            if item is _STOP:
+                self._clean_up()
+                break
+            if item is _DONE:
+                if self._pending:
+                    self._call_callback_on_pending_data()
+                break
+
+            columns, n_rows = item
+            self._pending.append(columns)
+            self._data_set_len += n_rows
+            self._queue_length += n_rows
+
+            if self._queue_length >= self.min_queue_length:
+                self._call_callback_on_pending_data()
+                if self._loop_sleep_time > 0:
+                    time.sleep(self._loop_sleep_time)
+
+    def done_callback(self) -> None:
+        """
+        Deliver all remaining rows to the callback and wait for the
+        subscriber to finish.
+        """
+        if self.is_alive():
+            self.data_queue.put(_DONE)
+            self.join()
+
+    def schedule_stop(self) -> None:
+        if self.is_alive():
+            self.log.debug("Scheduling stop")
+            self.data_queue.put(_STOP)
+
+    def _clean_up(self) -> None:
+        self.log.debug("Stopped batch subscriber")
+
+
+_STOP = object()
+_DONE = object()
+
+
+def _rows_to_columns(
+    keys: Sequence[str], values: Sequence[Sequence[Any]]
+) -> dict[str, np.ndarray]:
+    """
+    Transpose a list of rows as passed to ``DataSet.add_results`` into a
+    mapping from parameter name to column array.
+    """
+    return {
+        key: _to_column_array([row[i] for row in values]) for i, key in enumerate(keys)
+    }
+
+
+def _to_column_array(column: Sequence[Any]) -> np.ndarray:
+    try:
+        return np.asarray(column)
+    except ValueError:
+        # ragged arrays or a mix of None and arrays can not be stacked
+        arr = np.empty(len(column), dtype=object)
+        arr[:] = column
+        return arr
+
+
+def _concatenate_column_blocks(
+    blocks: Sequence[Mapping[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """
+    Concatenate a sequence of column blocks into one. Parameters that are
+    missing from a block are filled with None.
+    """
+    if len(blocks) == 1:
+        return dict(blocks[0])
+
+    keys: dict[str, None] = {}
+    for block in blocks:
+        keys.update(dict.fromkeys(block))
+
+    columns: dict[str, np.ndarray] = {}
+    for key in keys:
+        parts = []
+        for block in blocks:
+            if key in block:
+                parts.append(block[key])
+            else:
+                n_rows = len(next(iter(block.values())))
+                parts.append(np.full(n_rows, None, dtype=object))
+        try:
+            columns[key] = np.concatenate(parts)
+        except ValueError:
+            columns[key] = _to_column_array([row for part in parts for row in part])
+    return columns
@@ -8,10 +8,15 @@ import concurrent
 import concurrent.futures
 import itertools
 import logging
+import threading
+import time
 from collections import defaultdict
+from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING, Protocol, TypeAlias, TypeVar
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, TypeVar
 
+from qcodes.parameters import get_coalesced
 from qcodes.utils import RespondingThread
 
 if TYPE_CHECKING:
@@ -34,10 +39,7 @@ class _ParamCaller:
         self._parameters = parameters
 
     def __call__(self) -> tuple[tuple[ParameterBase, ParamDataType], ...]:
-        output = []
-        for param in self._parameters:
-            output.append((param, param.get()))
-        return tuple(output)
+        return get_coalesced(*self._parameters)
 
     def __repr__(self) -> str:
         names = tuple(param.full_name for param in self._parameters)
@@ -96,11 +98,17 @@ def _call_params(param_meas: Sequence[ParamMeasT]) -> OutType:
 
     output: OutType = []
 
+    # parameters between two callables are got together such that their
+    # queries can be coalesced
+    parameters: list[ParameterBase] = []
     for parameter in param_meas:
         if isinstance(parameter, ParameterBase):
-            output.append((parameter, parameter.get()))
+            parameters.append(parameter)
         elif callable(parameter):
+            output.extend(get_coalesced(*parameters))
+            parameters = []
             parameter()
+    output.extend(get_coalesced(*parameters))
 
     return output
 
@@ -221,3 +229,185 @@ class ThreadPoolParamsCaller(_ParamsCallerProtocol):
         exc_tb: TracebackType | None,
     ) -> None:
         self._thread_pool.__exit__(exc_type, exc_val, exc_tb)
+
+
+@dataclass
+class CallTimingStatistics:
+    """
+    Timing statistics of the calls of the parameters of one instrument by
+    an :class:`InstrumentWorkersParamsCaller`. All times are in seconds.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+    last: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float("nan")
+
+    def _add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        self.min = min(duration, self.min)
+        self.max = max(duration, self.max)
+
+
+_STOP_WORKER = object()
+
+
+class _InstrumentWorker:
+    """
+    A long lived thread that calls the parameters of one instrument every
+    time it is triggered and reports the result on a shared queue.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        param_caller: _ParamCaller,
+        done: SimpleQueue[tuple[int, Any, BaseException | None]],
+        name: str,
+    ):
+        self._index = index
+        self._param_caller = param_caller
+        self._done = done
+        self._trigger: SimpleQueue[object] = SimpleQueue()
+        self._name = name
+        self.statistics = CallTimingStatistics()
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        trigger = self._trigger
+        done = self._done
+        param_caller = self._param_caller
+        statistics = self.statistics
+        while trigger.get() is not _STOP_WORKER:
+            t0 = time.perf_counter()
+            try:
+                result = param_caller()
+            except BaseException as e:
+                done.put((self._index, None, e))
+            else:
+                statistics._add(time.perf_counter() - t0)
+                done.put((self._index, result, None))
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def trigger(self) -> None:
+        self._trigger.put(None)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._trigger.put(_STOP_WORKER)
+        self._thread.join()
+        self._thread = None
+
+
+class InstrumentWorkersParamsCaller(_ParamsCallerProtocol):
+    """
+    Context manager for calling given parameters with one long lived worker
+    thread per instrument. Parameters that have the same underlying
+    instrument are called in the same thread, and the same thread is used
+    for that instrument on every call. Compared to
+    :class:`ThreadPoolParamsCaller` no tasks or futures are created per call;
+    every call only wakes up the workers and waits for all of them to
+    report back, which keeps the overhead per point small.
+
+    The time spent calling the parameters of each instrument is recorded in
+    :attr:`timing_statistics`, which can be used to find the instrument
+    that limits the measurement speed.
+
+    Usage:
+
+        .. code-block:: python
+
+           ...
+           with InstrumentWorkersParamsCaller(p1, p2, ...) as caller:
+               ...
+               output = caller()
+               ...
+           print(caller.timing_statistics)
+
+    Args:
+        param_meas: parameter or a callable without arguments
+
+    """
+
+    def __init__(self, *param_meas: ParamMeasT):
+        inst_param_mapping = _instrument_to_param(param_meas)
+        self._done: SimpleQueue[tuple[int, Any, BaseException | None]] = SimpleQueue()
+        self._instrument_names = tuple(inst_param_mapping.keys())
+        self._workers = tuple(
+            _InstrumentWorker(
+                index,
+                _ParamCaller(*param_list),
+                self._done,
+                name=f"{self.__class__.__name__}:{instrument_name}",
+            )
+            for index, (instrument_name, param_list) in enumerate(
+                inst_param_mapping.items()
+            )
+        )
+        self._started = False
+
+    @property
+    def timing_statistics(self) -> dict[str | None, CallTimingStatistics]:
+        """
+        The timing statistics of the calls of the parameters of each
+        instrument, keyed by the full name of the instrument. Parameters
+        without an underlying instrument are listed under ``None``.
+        """
+        return {
+            name: worker.statistics
+            for name, worker in zip(self._instrument_names, self._workers)
+        }
+
+    def __call__(self) -> OutType:
+        """
+        Call the parameters on the worker threads and return
+        `(param, value)` tuples, grouped by instrument.
+        """
+        if not self._started:
+            raise RuntimeError(
+                f"{self.__class__.__name__} must be entered as a context "
+                "manager before it can be called."
+            )
+        for worker in self._workers:
+            worker.trigger()
+
+        results: list[Any] = [None] * len(self._workers)
+        exception: BaseException | None = None
+        # wait for all workers even if one fails such that no worker is
+        # still busy when the next call is made
+        for _ in self._workers:
+            index, result, worker_exception = self._done.get()
+            results[index] = result
+            if worker_exception is not None and exception is None:
+                exception = worker_exception
+        if exception is not None:
+            raise exception
+
+        return list(itertools.chain.from_iterable(results))
+
+    def __enter__(self) -> InstrumentWorkersParamsCaller:
+        for worker in self._workers:
+            worker.start()
+        self._started = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for worker in self._workers:
+            worker.stop()
+        self._started = False
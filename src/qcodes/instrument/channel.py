@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
@@ -73,6 +74,25 @@ class InstrumentModule(InstrumentBase):
     def ask_raw(self, cmd: str) -> str:
         return self._parent.ask_raw(cmd)
 
+    async def async_write(self, cmd: str) -> None:
+        if type(self).write is not InstrumentModule.write:
+            # the command is transformed by a subclass
+            await asyncio.to_thread(self.write, cmd)
+            return
+        await self._parent.async_write(cmd)
+
+    async def async_write_raw(self, cmd: str) -> None:
+        await self._parent.async_write_raw(cmd)
+
+    async def async_ask(self, cmd: str) -> str:
+        if type(self).ask is not InstrumentModule.ask:
+            # the command is transformed by a subclass
+            return await asyncio.to_thread(self.ask, cmd)
+        return await self._parent.async_ask(cmd)
+
+    async def async_ask_raw(self, cmd: str) -> str:
+        return await self._parent.async_ask_raw(cmd)
+
     @property
     def parent(self) -> InstrumentBase:
         return self._parent
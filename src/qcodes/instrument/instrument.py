@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import weakref
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
+from qcodes.parameters import get_coalesced
+from qcodes.parameters.coalesced_get import _coalescable_query
 from qcodes.utils import strip_attrs
 from qcodes.validators import Anything
 
@@ -14,6 +17,8 @@ from .instrument_base import InstrumentBase, InstrumentBaseKWArgs
 from .instrument_meta import InstrumentMeta
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from typing_extensions import Unpack
 
     from qcodes.logger.instrument_logger import InstrumentLoggerAdapter
@@ -33,6 +38,26 @@ class InstrumentProtocol(Protocol):
 
 T = TypeVar("T", bound="Instrument")
 
+
+class _EventLoopLock:
+    """
+    An :class:`asyncio.Lock` that serializes the asynchronous communication
+    with an instrument. A new lock is created for every event loop since an
+    asyncio lock can only be used from the event loop it was first used in.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    def get(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+
 # a metaclass that overrides __call__ means that we lose
 # both the args and return type hints.
 # Since our metaclass does not modify the signature
@@ -59,6 +84,23 @@ class Instrument(InstrumentBase, metaclass=instrument_meta_class):
 
     """
 
+    query_separator: str | None = None
+    """
+    The separator with which several queries can be joined into one message
+    to the instrument, e.g. ``";"`` for most SCPI instruments. If set, the
+    queries of parameters with a string ``get_cmd`` that are got together,
+    e.g. in a measurement or a snapshot, are sent in one message by
+    :meth:`ask_many`. If None, which is the default, every query is sent on
+    its own.
+    """
+
+    response_separator: str | None = None
+    """
+    The separator of the responses to queries joined with
+    :attr:`query_separator`. If None, the responses are assumed to be
+    separated by :attr:`query_separator`.
+    """
+
     _all_instruments: weakref.WeakValueDictionary[str, Instrument] = (
         weakref.WeakValueDictionary()
     )
@@ -438,6 +480,73 @@ class Instrument(InstrumentBase, metaclass=instrument_meta_class):
             e.args = e.args + ("asking " + repr(cmd) + " to " + inst,)
             raise e
 
+    def ask_many(self, cmds: Sequence[str]) -> list[str]:
+        """
+        Write several command strings to the hardware and return their
+        responses.
+
+        If :attr:`query_separator` is set, the commands are joined into one
+        message such that they only take one round trip to the instrument
+        and the response is split at the :attr:`response_separator`.
+        Otherwise every command is sent with :meth:`ask` on its own.
+
+        Args:
+            cmds: The strings to send to the instrument.
+
+        Returns:
+            The response to each command.
+
+        Raises:
+            ValueError: If the number of responses to the joined commands
+                does not match the number of commands.
+
+        """
+        if self.query_separator is None or len(cmds) < 2:
+            return [self.ask(cmd) for cmd in cmds]
+        joined = self.query_separator.join(cmds)
+        response = self.ask(joined)
+        separator = (
+            self.query_separator
+            if self.response_separator is None
+            else self.response_separator
+        )
+        responses = response.split(separator)
+        if len(responses) != len(cmds):
+            raise ValueError(
+                f"Expected {len(cmds)} responses separated by {separator!r} "
+                f"when asking {joined!r} to {self!r}, got {response!r}."
+            )
+        return responses
+
+    def _get_coalesced_for_snapshot(
+        self, params_to_skip_update: Sequence[str]
+    ) -> set[str]:
+        """
+        Get the parameters that are updated in a snapshot and whose queries
+        can be coalesced with :func:`.get_coalesced`, and return their names.
+        """
+        if self.query_separator is None:
+            return set()
+        to_get = {
+            name: param
+            for name, param in self.parameters.items()
+            if not param.snapshot_exclude
+            and name not in params_to_skip_update
+            and param._snapshot_value
+            and param._snapshot_get
+            and param.gettable
+            and _coalescable_query(param) is not None
+        }
+        if len(to_get) < 2:
+            return set()
+        try:
+            get_coalesced(*to_get.values())
+        except Exception:
+            self.log.warning("Snapshot: Could not coalesce the parameter updates")
+            self.log.info("Details for Snapshot:", exc_info=True)
+            return set()
+        return set(to_get)
+
     def ask_raw(self, cmd: str) -> str:
         """
         Low level method to write to the hardware and return a response.
@@ -454,6 +563,90 @@ class Instrument(InstrumentBase, metaclass=instrument_meta_class):
             f"Instrument {type(self).__name__} has not defined an ask method"
         )
 
+    async def async_write(self, cmd: str) -> None:
+        """
+        Write a command string with NO response to the hardware without
+        blocking the event loop.
+
+        If a subclass overrides ``write`` to transform ``cmd``, ``write`` is
+        called in a worker thread. Otherwise ``async_write_raw`` is awaited.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+
+        """
+        if type(self).write is not Instrument.write:
+            await asyncio.to_thread(self.write, cmd)
+            return
+        try:
+            await self.async_write_raw(cmd)
+        except Exception as e:
+            inst = repr(self)
+            e.args = e.args + ("writing " + repr(cmd) + " to " + inst,)
+            raise e
+
+    async def async_write_raw(self, cmd: str) -> None:
+        """
+        Low level method to write a command string to the hardware without
+        blocking the event loop.
+
+        The default implementation calls ``write_raw`` in a worker thread.
+        Subclasses that implement a natively asynchronous hardware
+        communication should override this method.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        """
+        await asyncio.to_thread(self.write_raw, cmd)
+
+    async def async_ask(self, cmd: str) -> str:
+        """
+        Write a command string to the hardware and return a response without
+        blocking the event loop.
+
+        If a subclass overrides ``ask`` to transform ``cmd``, ``ask`` is
+        called in a worker thread. Otherwise ``async_ask_raw`` is awaited.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Returns:
+            response
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+
+        """
+        if type(self).ask is not Instrument.ask:
+            return await asyncio.to_thread(self.ask, cmd)
+        try:
+            return await self.async_ask_raw(cmd)
+        except Exception as e:
+            inst = repr(self)
+            e.args = e.args + ("asking " + repr(cmd) + " to " + inst,)
+            raise e
+
+    async def async_ask_raw(self, cmd: str) -> str:
+        """
+        Low level method to write to the hardware and return a response
+        without blocking the event loop.
+
+        The default implementation calls ``ask_raw`` in a worker thread.
+        Subclasses that implement a natively asynchronous hardware
+        communication should override this method.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        """
+        return await asyncio.to_thread(self.ask_raw, cmd)
+
 
 def find_or_create_instrument(
     instrument_class: type[T],
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import collections.abc
 import logging
+import time
 import warnings
 from collections.abc import Callable, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import numpy as np
@@ -17,7 +20,7 @@ from qcodes.parameters import Function, Parameter, ParameterBase
 from qcodes.utils import DelegateAttributes, full_class
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping, Sequence
+    from collections.abc import Callable, Iterator, Mapping, Sequence
 
     from typing_extensions import NotRequired
 
@@ -30,6 +33,34 @@ log = logging.getLogger(__name__)
 
 TParameter = TypeVar("TParameter", bound=ParameterBase, default=Parameter)
 
+# the time.monotonic() after which snapshots stop updating parameters
+_snapshot_deadline: ContextVar[float | None] = ContextVar(
+    "_snapshot_deadline", default=None
+)
+
+
+@contextmanager
+def _snapshot_time_budget(timeout: float | None) -> Iterator[None]:
+    """
+    Limit the time that snapshots taken within the context spend updating
+    parameters to ``timeout`` seconds. Parameters that are due for an
+    update after the time is up are snapshotted from their cache and
+    listed under ``"stale_parameters"`` in the snapshot of their
+    instrument. An enclosing time budget that ends earlier is kept.
+    """
+    if timeout is None:
+        yield
+        return
+    deadline = time.monotonic() + timeout
+    outer_deadline = _snapshot_deadline.get()
+    if outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
+    token = _snapshot_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _snapshot_deadline.reset(token)
+
 
 class InstrumentBaseKWArgs(TypedDict):
     """
@@ -396,6 +427,11 @@ class InstrumentBase(MetadatableWithName, DelegateAttributes):
         :class:`.NumpyJSONEncoder`
         supports).
 
+        If the snapshot is taken with a time budget, e.g. by a
+        :class:`.Station` with a ``snapshot_timeout``, the parameters that are
+        due for an update after the time is up are snapshotted from their
+        cache and listed under ``"stale_parameters"``.
+
         Args:
             update: If ``True``, update the state by querying the
                 instrument. If None update the state if known to be invalid.
@@ -429,13 +465,32 @@ class InstrumentBase(MetadatableWithName, DelegateAttributes):
             "__class__": full_class(self),
         }
 
+        deadline = _snapshot_deadline.get()
+        coalesced = (
+            self._get_coalesced_for_snapshot(params_to_skip_update)
+            if update and (deadline is None or time.monotonic() < deadline)
+            else set()
+        )
+        stale_parameters = []
+
         for name, param in self.parameters.items():
             if param.snapshot_exclude:
                 continue
             if params_to_skip_update and name in params_to_skip_update:
                 update_par: bool | None = False
+            elif name in coalesced:
+                # the value was just got, so the cache is up to date
+                update_par = None
             else:
                 update_par = update
+            if (
+                deadline is not None
+                and (update_par or (update_par is None and not param.cache.valid))
+                and time.monotonic() >= deadline
+            ):
+                # the time budget of the snapshot is used up
+                update_par = False
+                stale_parameters.append(name)
             try:
                 snap["parameters"][name] = param.snapshot(update=update_par)
             except Exception:
@@ -445,6 +500,9 @@ class InstrumentBase(MetadatableWithName, DelegateAttributes):
                 self.log.info("Details for Snapshot:", exc_info=True)
                 snap["parameters"][name] = param.snapshot(update=False)
 
+        if stale_parameters:
+            snap["stale_parameters"] = stale_parameters
+
         for attr in set(self._meta_attrs):
             val = getattr(self, attr, None)
             if val is not None:
@@ -455,6 +513,17 @@ class InstrumentBase(MetadatableWithName, DelegateAttributes):
 
         return snap
 
+    def _get_coalesced_for_snapshot(
+        self, params_to_skip_update: Sequence[str]
+    ) -> set[str]:
+        """
+        Get the parameters that are updated in a snapshot together before
+        the snapshot of each parameter is taken, and return their names.
+        Instruments that can join several queries into one message override
+        this.
+        """
+        return set()
+
     def print_readable_snapshot(
         self, update: bool = False, max_chars: int = 80
     ) -> None:
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import socket
+import threading
+from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING, Any
 
-from .instrument import Instrument
+from .instrument import Instrument, _EventLoopLock
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, Generator, Sequence
     from types import TracebackType
 
     from typing_extensions import Unpack
@@ -18,6 +21,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# the interval in seconds at which the event loop polls for the lock of the
+# socket while it is used by another thread
+_IO_LOCK_POLL_INTERVAL = 0.001
+
 
 class IPInstrument(Instrument):
     r"""
@@ -66,6 +73,10 @@ class IPInstrument(Instrument):
         self._buffer_size = 1400
 
         self._socket: socket.socket | None = None
+        # serializes all communication over the socket, from any thread and
+        # from the event loop
+        self._io_lock = threading.Lock()
+        self._async_lock = _EventLoopLock()
 
         self.set_persistent(persistent)
 
@@ -109,7 +120,8 @@ class IPInstrument(Instrument):
             self._disconnect()
 
     def flush_connection(self) -> None:
-        self._recv()
+        with self._io_lock:
+            self._recv()
 
     def _connect(self) -> None:
         if self._socket is not None:
@@ -192,7 +204,7 @@ class IPInstrument(Instrument):
 
         """
 
-        with self._ensure_connection:
+        with self._io_lock, self._ensure_connection:
             self._send(cmd)
             if self._confirmation:
                 self._recv()
@@ -208,10 +220,95 @@ class IPInstrument(Instrument):
             The instrument's string response.
 
         """
-        with self._ensure_connection:
+        with self._io_lock, self._ensure_connection:
             self._send(cmd)
             return self._recv()
 
+    @asynccontextmanager
+    async def _acquire_io_lock(self) -> AsyncGenerator[None, None]:
+        # poll for the lock rather than blocking the event loop while another
+        # thread communicates with the instrument
+        while not self._io_lock.acquire(blocking=False):
+            await asyncio.sleep(_IO_LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            self._io_lock.release()
+
+    @contextmanager
+    def _non_blocking_socket(self) -> Generator[socket.socket, None, None]:
+        if self._socket is None:
+            raise RuntimeError(f"IPInstrument {self.name} is not connected")
+        sock = self._socket
+        sock.setblocking(False)
+        try:
+            yield sock
+        finally:
+            # restore the blocking mode with timeout used by the
+            # synchronous communication unless the socket has been closed
+            if self._socket is sock:
+                sock.settimeout(float(self._timeout))
+
+    async def _async_send(self, sock: socket.socket, cmd: str) -> None:
+        data = cmd + self._terminator
+        log.debug(f"Writing {data} to instrument {self.name}")
+        await asyncio.get_running_loop().sock_sendall(sock, data.encode())
+
+    async def _async_recv(self, sock: socket.socket) -> str:
+        try:
+            result = await asyncio.wait_for(
+                asyncio.get_running_loop().sock_recv(sock, self._buffer_size),
+                self._timeout,
+            )
+        except asyncio.TimeoutError as e:
+            # a response arriving after the timeout would be read as the
+            # response to the next command, so drop the connection. It is
+            # opened again by the next command.
+            log.warning(
+                f"Timed out waiting for a response from instrument {self.name}, "
+                "reconnecting."
+            )
+            self._disconnect()
+            raise TimeoutError("timed out") from e
+        log.debug(f"Got {result!r} from instrument {self.name}")
+        if result == b"":
+            log.warning("Got empty response from Socket recv() Connection broken.")
+        return result.decode()
+
+    async def async_write_raw(self, cmd: str) -> None:
+        """
+        Low-level interface to send a command that gets no response without
+        blocking the event loop. The socket is used directly by the event
+        loop rather than from a worker thread.
+
+        Args:
+            cmd: The command to send to the instrument.
+
+        """
+        async with self._async_lock.get(), self._acquire_io_lock():
+            with self._ensure_connection, self._non_blocking_socket() as sock:
+                await self._async_send(sock, cmd)
+                if self._confirmation:
+                    await self._async_recv(sock)
+
+    async def async_ask_raw(self, cmd: str) -> str:
+        """
+        Low-level interface to send a command an read a response without
+        blocking the event loop. The socket is used directly by the event
+        loop rather than from a worker thread.
+
+        Args:
+            cmd: The command to send to the instrument.
+
+        Returns:
+            The instrument's string response.
+
+        """
+        async with self._async_lock.get(), self._acquire_io_lock():
+            with self._ensure_connection, self._non_blocking_socket() as sock:
+                await self._async_send(sock, cmd)
+                return await self._async_recv(sock)
+
     def snapshot_base(
         self,
         update: bool | None = False,
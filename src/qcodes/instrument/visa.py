@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import warnings
 from importlib.resources import as_file, files
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
@@ -11,13 +13,14 @@ from weakref import finalize
 import pyvisa
 import pyvisa.constants as vi_const
 import pyvisa.resources
+import pyvisa.rname
 from pyvisa.errors import InvalidSession
 
 import qcodes.validators as vals
 from qcodes.logger import get_instrument_logger
 from qcodes.utils import DelayedKeyboardInterrupt
 
-from .instrument import Instrument
+from .instrument import Instrument, _EventLoopLock
 from .instrument_base import InstrumentBase, InstrumentBaseKWArgs
 
 if TYPE_CHECKING:
@@ -81,6 +84,11 @@ class VisaInstrumentKWArgs(TypedDict):
     """
     Name of a pyvisa-sim yaml file used to simulate the instrument.
     """
+    async_socket: NotRequired[bool]
+    """
+    Use a separate asyncio socket connection for asynchronous communication
+    with a TCPIP SOCKET resource.
+    """
 
 
 class VisaInstrument(Instrument):
@@ -114,6 +122,12 @@ class VisaInstrument(Instrument):
             ``qcodes.instruments.sims:AimTTi_PL601P.yaml`` in which case it is loaded
             from the supplied module. Note that it is an error to pass both
             ``pyvisa_sim_file`` and ``visalib``.
+        async_socket: If True, the asynchronous communication methods
+            (``async_ask``, ``async_write``) use a separate socket connection
+            driven by the asyncio event loop rather than calling the VISA
+            resource in a worker thread. Only supported for TCPIP SOCKET
+            resources, and the instrument must accept more than one
+            connection. Default False.
         **kwargs: Other kwargs are forwarded to the baseclass.
 
     See help for :class:`.Instrument` for additional information on writing
@@ -132,6 +146,16 @@ class VisaInstrument(Instrument):
     None means no timeout e.g. wait forever.
     """
 
+    # class level defaults such that subclasses that do not call
+    # ``VisaInstrument.__init__`` (e.g. simulated IP instruments) fall back
+    # to the default asynchronous communication
+    _async_socket: bool = False
+    _async_socket_address: tuple[str, int] | None = None
+    _async_streams: (
+        tuple[asyncio.AbstractEventLoop, asyncio.StreamReader, asyncio.StreamWriter]
+        | None
+    ) = None
+
     def __init__(
         self,
         name: str,
@@ -141,6 +165,7 @@ class VisaInstrument(Instrument):
         device_clear: bool = True,
         visalib: str | None = None,
         pyvisa_sim_file: str | None = None,
+        async_socket: bool = False,
         **kwargs: Unpack[InstrumentBaseKWArgs],
     ):
         if terminator == "Unset":
@@ -201,6 +226,11 @@ class VisaInstrument(Instrument):
         self.visalib: str | None = visalib
         self._address = address
 
+        self._async_socket = async_socket
+        self._async_lock = _EventLoopLock()
+        if async_socket:
+            self._async_socket_address = self._get_socket_address(address)
+
         if device_clear:
             self.device_clear()
 
@@ -264,6 +294,9 @@ class VisaInstrument(Instrument):
         self._address = address
         self.visabackend = visabackend
         self.resource_manager = resource_manager
+        if self._async_socket:
+            self._close_async_streams()
+            self._async_socket_address = self._get_socket_address(address)
 
     def device_clear(self) -> None:
         """Clear the buffers of the device"""
@@ -323,6 +356,7 @@ class VisaInstrument(Instrument):
         """Disconnect and irreversibly tear down the instrument."""
         if getattr(self, "visa_handle", None):
             self.visa_handle.close()
+        self._close_async_streams()
 
         if getattr(self, "visabackend", None) == "sim" and getattr(
             self, "resource_manager", None
@@ -391,6 +425,106 @@ class VisaInstrument(Instrument):
             self.visa_log.debug(f"Response: {response}")
         return response
 
+    @staticmethod
+    def _get_socket_address(address: str) -> tuple[str, int]:
+        try:
+            resource_name = pyvisa.rname.parse_resource_name(address)
+        except pyvisa.rname.InvalidResourceName:
+            resource_name = None
+        if not isinstance(resource_name, pyvisa.rname.TCPIPSocket):
+            raise ValueError(
+                f"async_socket is only supported for TCPIP SOCKET resources, "
+                f"got {address}"
+            )
+        return resource_name.host_address, int(resource_name.port)
+
+    def _close_async_streams(self) -> None:
+        if self._async_streams is None:
+            return
+        _, _, writer = self._async_streams
+        self._async_streams = None
+        try:
+            writer.close()
+        except RuntimeError:
+            # the event loop that the connection was made in is closed
+            # and has already closed the transport
+            pass
+
+    async def _get_async_streams(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        assert self._async_socket_address is not None
+        loop = asyncio.get_running_loop()
+        if self._async_streams is None or self._async_streams[0] is not loop:
+            self._close_async_streams()
+            host, port = self._async_socket_address
+            self.visa_log.info(f"Opening asyncio socket to {host}:{port}")
+            reader, writer = await asyncio.open_connection(host, port)
+            self._async_streams = (loop, reader, writer)
+        return self._async_streams[1], self._async_streams[2]
+
+    async def _async_socket_write(self, writer: asyncio.StreamWriter, cmd: str) -> None:
+        self.visa_log.debug(f"Writing: {cmd}")
+        writer.write((cmd + (self.visa_handle.write_termination or "")).encode())
+        await writer.drain()
+
+    async def async_write_raw(self, cmd: str) -> None:
+        """
+        Low-level interface to write a command without blocking the event
+        loop. Uses the asyncio socket connection if the instrument was
+        created with ``async_socket=True``, otherwise ``write_raw`` is called
+        in a worker thread.
+
+        Args:
+            cmd: The command to send to the instrument.
+
+        """
+        if self._async_socket_address is None:
+            await super().async_write_raw(cmd)
+            return
+        async with self._async_lock.get():
+            _, writer = await self._get_async_streams()
+            await self._async_socket_write(writer, cmd)
+
+    async def async_ask_raw(self, cmd: str) -> str:
+        """
+        Low-level interface to query the instrument without blocking the
+        event loop. Uses the asyncio socket connection if the instrument was
+        created with ``async_socket=True``, otherwise ``ask_raw`` is called
+        in a worker thread.
+
+        Args:
+            cmd: The command to send to the instrument.
+
+        Returns:
+            str: The instrument's response.
+
+        """
+        if self._async_socket_address is None:
+            return await super().async_ask_raw(cmd)
+        async with self._async_lock.get():
+            reader, writer = await self._get_async_streams()
+            await self._async_socket_write(writer, cmd)
+            read_termination = self.visa_handle.read_termination
+            if read_termination:
+                read = reader.readuntil(read_termination.encode())
+            else:
+                read = reader.read(65536)
+            timeout = self._get_visa_timeout()
+            if timeout is not None and math.isinf(timeout):
+                timeout = None
+            try:
+                data = await asyncio.wait_for(read, timeout)
+            except asyncio.TimeoutError as e:
+                # the connection may still deliver the stale response
+                self._close_async_streams()
+                raise TimeoutError(f"Timeout while querying {cmd!r}") from e
+            response = data.decode()
+            if read_termination:
+                response = response[: -len(read_termination)]
+            self.visa_log.debug(f"Response: {response}")
+        return response
+
     def snapshot_base(
         self,
         update: bool | None = True,
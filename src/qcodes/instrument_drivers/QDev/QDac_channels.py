@@ -18,7 +18,7 @@ from qcodes.instrument import (
     VisaInstrument,
     VisaInstrumentKWArgs,
 )
-from qcodes.parameters import MultiChannelInstrumentParameter, ParamRawDataType
+from qcodes.parameters import MultiChannelInstrumentParameter, ParamDataType
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -177,27 +177,19 @@ class QDevQDacMultiChannelParameter(MultiChannelInstrumentParameter):
     ):
         super().__init__(channels, param_name, *args, **kwargs)
 
-    def get_raw(self) -> tuple[ParamRawDataType, ...]:
+    def get_channel_values(self) -> "Sequence[ParamDataType]":
         """
-        Return a tuple containing the data from each of the channels in the
-        list.
+        Get the value of the parameter of each of the channels. The
+        voltages of all channels are read with a single status query.
         """
-        # For voltages, we can do something slightly faster than the naive
-        # approach
-
         if self._param_name == "v":
             qdac = self._channels[0]._parent
             qdac._update_cache(readcurrents=False)
-            output = tuple(
+            return tuple(
                 chan.parameters[self._param_name].get_latest()
                 for chan in self._channels
             )
-        else:
-            output = tuple(
-                chan.parameters[self._param_name].get() for chan in self._channels
-            )
-
-        return output
+        return super().get_channel_values()
 
 
 QDacMultiChannelParameter = QDevQDacMultiChannelParameter
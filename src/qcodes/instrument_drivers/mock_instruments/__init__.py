@@ -29,6 +29,8 @@ if TYPE_CHECKING:
 
     from typing_extensions import Unpack
 
+    from qcodes.parameters import ParameterBase
+
 log = logging.getLogger(__name__)
 
 
@@ -1163,6 +1165,71 @@ class MockLockin(DummyBase):
         )
 
 
+class MockBufferedSource(DummyBase):
+    """
+    A simulated source measure unit that can execute a voltage sweep
+    natively and return the current measured at every point as one buffer.
+    It implements the
+    :class:`qcodes.dataset.dond.sweeps.BufferedSweepBackend` protocol, so
+    the voltage can be swept in a dond using a
+    :class:`qcodes.dataset.dond.sweeps.BufferedSweep`. The current is
+    ``voltage / resistance``.
+    """
+
+    def __init__(self, name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
+        super().__init__(name=name, **kwargs)
+        self.add_parameter(
+            "voltage",
+            parameter_class=Parameter,
+            initial_value=0.0,
+            unit="V",
+            vals=Numbers(-10.0, 10.0),
+            get_cmd=None,
+            set_cmd=None,
+        )
+        self.add_parameter(
+            "resistance",
+            parameter_class=Parameter,
+            initial_value=1e3,
+            unit="Ohm",
+            vals=Numbers(1e-3, 1e12),
+            get_cmd=None,
+            set_cmd=None,
+        )
+        self.add_parameter(
+            "current",
+            parameter_class=Parameter,
+            unit="A",
+            get_cmd=lambda: self.voltage.get() / self.resistance.get(),
+            set_cmd=False,
+        )
+        self.buffered_sweep_count = 0
+        """The number of buffered sweeps executed by the instrument."""
+
+    def run_buffered_sweep(
+        self,
+        param: ParameterBase,
+        setpoints: np.ndarray,
+        delay: float,
+        measured: Sequence[ParameterBase],
+    ) -> dict[ParameterBase, np.ndarray]:
+        if param is not self.voltage:
+            raise ValueError(f"{self} can only sweep {self.voltage}, not {param}.")
+        for meas_param in measured:
+            if meas_param is not self.current:
+                raise ValueError(
+                    f"{self} can only acquire {self.current}, not {meas_param}."
+                )
+        setpoints = np.asarray(setpoints, dtype=float)
+        for value in (setpoints.min(), setpoints.max()):
+            self.voltage.validate(value)
+        if delay > 0:
+            time.sleep(delay * len(setpoints))
+        self.voltage.set(setpoints[-1])
+        self.buffered_sweep_count += 1
+        return {self.current: setpoints / self.resistance.get()}
+
+
 class MockDACChannel(InstrumentChannel):
     """
     A single dummy channel implementation
@@ -69,6 +69,7 @@ more specialized ones:
 """
 
 from .array_parameter import ArrayParameter
+from .coalesced_get import get_coalesced
 from .combined_parameter import CombinedParameter, combine
 from .delegate_parameter import DelegateParameter
 from .function import Function
@@ -84,6 +85,7 @@ from .parameter_base import (
     invert_val_mapping,
 )
 from .parameter_with_setpoints import ParameterWithSetpoints, expand_setpoints_helper
+from .ramp_scheduler import ramp_parameters
 from .scaled_paramter import ScaledParameter
 from .specialized_parameters import ElapsedTimeParameter, InstrumentRefParameter
 from .sweep_values import SweepFixedValues, SweepValues
@@ -116,5 +118,7 @@ __all__ = [
     "create_on_off_val_mapping",
     "combine",
     "expand_setpoints_helper",
+    "get_coalesced",
     "invert_val_mapping",
+    "ramp_parameters",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -45,6 +46,26 @@ class _CacheProtocol(Protocol):
     def __call__(self) -> ParamDataType: ...
 
 
+def _monotonic_to_datetime(monotonic_ns: int) -> datetime:
+    """
+    Convert a time of :func:`time.monotonic_ns` into a wall clock
+    ``datetime`` in local time, truncated to microseconds like
+    :meth:`datetime.now`.
+    """
+    wall_ns = time.time_ns() - (time.monotonic_ns() - monotonic_ns)
+    seconds, nanoseconds = divmod(wall_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _datetime_to_monotonic(timestamp: datetime) -> int:
+    """
+    Convert a wall clock ``datetime`` into the corresponding time of
+    :func:`time.monotonic_ns`.
+    """
+    age_ns = time.time_ns() - round(timestamp.timestamp() * 1e9)
+    return time.monotonic_ns() - age_ns
+
+
 class _Cache:
     """
     Cache object for parameter to hold its value and raw value
@@ -63,14 +84,21 @@ class _Cache:
             disabled. ``max_val_age`` should not be used for a parameter
             that does not have a get function.
 
+    The time of the last update is stored as a :func:`time.monotonic_ns`
+    timestamp, which is cheap to take and to compare with ``max_val_age``.
+    The ``datetime`` of :attr:`timestamp` is only created when it is
+    requested.
+
     """
 
     def __init__(self, parameter: ParameterBase, max_val_age: float | None = None):
         self._parameter = parameter
         self._value: ParamDataType = None
         self._raw_value: ParamRawDataType = None
+        self._monotonic_ns: int | None = None
         self._timestamp: datetime | None = None
         self._max_val_age = max_val_age
+        self._max_val_age_ns = None if max_val_age is None else round(max_val_age * 1e9)
         self._marked_valid: bool = False
 
     @property
@@ -86,6 +114,8 @@ class _Cache:
         If ``None``, the cache hasn't been updated yet and shall be seen as
         "invalid".
         """
+        if self._timestamp is None and self._monotonic_ns is not None:
+            self._timestamp = _monotonic_to_datetime(self._monotonic_ns)
         return self._timestamp
 
     @property
@@ -163,22 +193,21 @@ class _Cache:
         self._value = value
         self._raw_value = raw_value
         if timestamp is None:
-            self._timestamp = datetime.now()
+            self._monotonic_ns = time.monotonic_ns()
         else:
-            self._timestamp = timestamp
+            self._monotonic_ns = _datetime_to_monotonic(timestamp)
+        # the datetime of "now" is only created when it is requested
+        self._timestamp = timestamp
         self._marked_valid = True
 
     def _timestamp_expired(self) -> bool:
-        if self._timestamp is None:
+        if self._monotonic_ns is None:
             # parameter has never been captured
             return True
-        if self._max_val_age is None:
+        if self._max_val_age_ns is None:
             # parameter cannot expire
             return False
-        oldest_accepted_timestamp = datetime.now() - timedelta(
-            seconds=self._max_val_age
-        )
-        if self._timestamp < oldest_accepted_timestamp:
+        if time.monotonic_ns() - self._monotonic_ns > self._max_val_age_ns:
             # Time of last get exceeds max_val_age seconds, need to
             # perform new .get()
             return True
@@ -218,7 +247,7 @@ class _Cache:
             return self._value
 
     def _construct_error_msg(self) -> str:
-        if self._timestamp is None:
+        if self._monotonic_ns is None:
             error_msg = (
                 f"Value of parameter "
                 f"{self._parameter.full_name} "
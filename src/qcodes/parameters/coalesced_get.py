@@ -0,0 +1,133 @@
+"""
+This module implements getting several parameters of an instrument with a
+single round trip to the instrument, by joining the queries of parameters
+with a string ``get_cmd`` into one message. The instrument opts in to this
+by setting its :attr:`.Instrument.query_separator`. The queries of the
+parameters of its channels are joined with its own.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .parameter_base import ParamDataType, ParameterBase, ParamRawDataType
+
+LOG = logging.getLogger(__name__)
+
+
+def _query_instrument(parameter: ParameterBase) -> Any:
+    """
+    The instrument that the queries of a parameter are sent to. Instrument
+    modules that pass queries on to their parent unchanged are skipped, so
+    that the queries of the parameters of all channels of an instrument can
+    be joined.
+    """
+    from qcodes.instrument.channel import InstrumentModule
+
+    instrument = parameter.instrument
+    while (
+        isinstance(instrument, InstrumentModule)
+        and type(instrument).ask is InstrumentModule.ask
+    ):
+        instrument = instrument.parent
+    return instrument
+
+
+def _coalescable_query(parameter: ParameterBase) -> str | None:
+    """
+    The query of a parameter if it can be joined with other queries to its
+    instrument, otherwise None.
+    """
+    query: str | None = getattr(parameter, "_get_query", None)
+    if query is None:
+        return None
+    if getattr(_query_instrument(parameter), "query_separator", None) is None:
+        return None
+    return query
+
+
+def _process_raw_value(
+    parameter: ParameterBase, raw_value: ParamRawDataType
+) -> ParamDataType:
+    try:
+        return parameter._process_raw_value(raw_value)
+    except Exception as e:
+        e.args = e.args + (f"getting {parameter}",)
+        raise e
+
+
+def _ask_coalesced(
+    instrument: Any, parameters: Sequence[ParameterBase], queries: Sequence[str]
+) -> list[ParamDataType] | None:
+    """
+    Ask the joined queries of the given parameters of an instrument and
+    process the responses into the values of the parameters. Returns None
+    if the instrument does not respond with one response per query.
+    """
+    try:
+        raw_values = instrument.ask_many(queries)
+    except ValueError:
+        LOG.warning(
+            "Could not coalesce the queries of %s, getting them one by one.",
+            [parameter.full_name for parameter in parameters],
+            exc_info=True,
+        )
+        return None
+    return [
+        _process_raw_value(parameter, raw_value)
+        for parameter, raw_value in zip(parameters, raw_values)
+    ]
+
+
+def get_coalesced(
+    *parameters: ParameterBase,
+) -> tuple[tuple[ParameterBase, ParamDataType], ...]:
+    """
+    Get the given parameters, joining the queries of parameters with a
+    string ``get_cmd`` on the same instrument into one message to the
+    instrument. Queries are only joined for instruments that set a
+    :attr:`.Instrument.query_separator`, all other parameters are got with
+    ``get``. The responses are parsed and validated and update the caches
+    of the parameters as if each parameter was got on its own.
+
+    If an instrument does not respond with one response per query, a
+    warning is logged and its parameters are got one by one.
+
+    Args:
+        *parameters: The parameters to get.
+
+    Returns:
+        Each parameter together with its value in the order of
+        ``parameters``.
+
+    """
+    batches: dict[int, tuple[Any, list[ParameterBase], list[str]]] = {}
+    for parameter in parameters:
+        query = _coalescable_query(parameter)
+        if query is None:
+            continue
+        instrument = _query_instrument(parameter)
+        _, batch, queries = batches.setdefault(id(instrument), (instrument, [], []))
+        batch.append(parameter)
+        queries.append(query)
+
+    values: dict[int, ParamDataType] = {}
+    for instrument, batch, queries in batches.values():
+        if len(batch) < 2:
+            continue
+        batch_values = _ask_coalesced(instrument, batch, queries)
+        if batch_values is None:
+            continue
+        for parameter, value in zip(batch, batch_values):
+            values[id(parameter)] = value
+
+    return tuple(
+        (parameter, values[id(parameter)])
+        if id(parameter) in values
+        else (parameter, parameter.get())
+        for parameter in parameters
+    )
@@ -4,6 +4,7 @@ import logging
 import sys
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from .coalesced_get import get_coalesced
 from .multi_parameter import MultiParameter
 
 if TYPE_CHECKING:
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
 
     from qcodes.instrument.channel import InstrumentModule
 
-    from .parameter_base import ParamRawDataType
+    from .parameter_base import ParamDataType, ParameterBase, ParamRawDataType
 
 InstrumentModuleType = TypeVar("InstrumentModuleType", bound="InstrumentModule")
 _LOG = logging.getLogger(__name__)
@@ -42,43 +43,120 @@ class MultiChannelInstrumentParameter(MultiParameter, Generic[InstrumentModuleTy
         self._channels = channels
         self._param_name = param_name
 
+    @property
+    def _channel_parameters(self) -> list[ParameterBase]:
+        return [chan.parameters[self._param_name] for chan in self._channels]
+
     def get_raw(self) -> tuple[ParamRawDataType, ...]:
         """
         Return a tuple containing the data from each of the channels in the
-        list.
+        list, as returned by :meth:`get_channel_values`.
+        """
+        return tuple(self.get_channel_values())
+
+    def get_channel_values(self) -> Sequence[ParamDataType]:
         """
-        return tuple(chan.parameters[self._param_name].get() for chan in self._channels)
+        Get the value of the parameter of each of the channels.
+
+        Drivers that can query the values of all channels at once should
+        override this and update the caches of the parameters of the
+        channels. By default the parameters are got with
+        :func:`.get_coalesced`, which joins their queries into one message
+        if the instrument has a ``query_separator``.
+        """
+        return [value for _, value in get_coalesced(*self._channel_parameters)]
 
     def set_raw(self, value: ParamRawDataType | Sequence[ParamRawDataType]) -> None:
         """
         Set all parameters to this/these value(s).
 
+        If :meth:`set_channel_values` is overridden, the value(s) are
+        validated for all channels before it is called. Otherwise the
+        channels are set one by one and each channel validates its value
+        when it is set.
+
         Args:
             value: The value(s) to set to. The type is given by the
                 underlying parameter.
 
         """
+        if (
+            type(self).set_channel_values
+            is MultiChannelInstrumentParameter.set_channel_values
+        ):
+            self._set_channels_one_by_one(value)
+        else:
+            self.set_channel_values(self._validated_channel_values(value))
+
+    def set_channel_values(self, values: Sequence[ParamDataType]) -> None:
+        """
+        Set the parameter of each of the channels to the corresponding value.
+
+        Drivers that can set all channels at once should override this and
+        update the caches of the parameters of the channels. The values are
+        validated before this is called. By default the parameters are set
+        one by one.
+
+        Args:
+            values: One value per channel.
+
+        """
+        for parameter, value in zip(self._channel_parameters, values):
+            parameter.set(value)
+
+    def _set_channels_one_by_one(
+        self, value: ParamDataType | Sequence[ParamDataType]
+    ) -> None:
+        parameters = self._channel_parameters
         try:
-            for chan in self._channels:
-                getattr(chan, self._param_name).set(value)
+            for parameter in parameters:
+                parameter.set(value)
         except Exception as err:
             try:
                 # Catch wrong length of value before any setting is done
                 value_list = list(value)
-                if len(value_list) != len(self._channels):
+                if len(value_list) != len(parameters):
+                    raise ValueError
+                for parameter, val in zip(parameters, value_list):
+                    parameter.set(val)
+            except (TypeError, ValueError):
+                self._add_value_note(err)
+                raise err from None
+
+    def _validated_channel_values(
+        self, value: ParamDataType | Sequence[ParamDataType]
+    ) -> list[ParamDataType]:
+        """
+        The value to set each of the channels to, given either one value
+        that is valid for all channels or one value per channel.
+        """
+        parameters = self._channel_parameters
+        try:
+            for parameter in parameters:
+                parameter.validate(value)
+            return [value] * len(parameters)
+        except Exception as err:
+            try:
+                value_list = list(value)
+                if len(value_list) != len(parameters):
                     raise ValueError
-                for chan, val in zip(self._channels, value_list):
-                    getattr(chan, self._param_name).set(val)
+                for parameter, val in zip(parameters, value_list):
+                    parameter.validate(val)
             except (TypeError, ValueError):
-                note = (
-                    "Value should either be valid for a single parameter of the channel list "
-                    "or a sequence of valid values of the same length as the list."
-                )
-                if sys.version_info >= (3, 11):
-                    err.add_note(note)
-                else:
-                    _LOG.error(note)
+                self._add_value_note(err)
                 raise err from None
+            return value_list
+
+    @staticmethod
+    def _add_value_note(err: Exception) -> None:
+        note = (
+            "Value should either be valid for a single parameter of the channel list "
+            "or a sequence of valid values of the same length as the list."
+        )
+        if sys.version_info >= (3, 11):
+            err.add_note(note)
+        else:
+            _LOG.error(note)
 
     @property
     def full_names(self) -> tuple[str, ...]:
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import partial
 from types import MethodType
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -13,7 +14,7 @@ from .parameter_base import ParamDataType, ParameterBase, ParamRawDataType
 from .sweep_values import SweepFixedValues
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
     from qcodes.instrument.base import InstrumentBase
     from qcodes.logger.instrument_logger import InstrumentLoggerAdapter
@@ -191,11 +192,14 @@ class Parameter(ParameterBase):
                 )
             else:
                 mylogger = log
-            mylogger.debug(
-                "Getting raw value of parameter: %s as %s",
-                self.full_name,
-                self.cache.raw_value,
-            )
+            # computing the full name is comparable to the cost of the get
+            # itself so only do it if the message is logged
+            if mylogger.isEnabledFor(logging.DEBUG):
+                mylogger.debug(
+                    "Getting raw value of parameter: %s as %s",
+                    self.full_name,
+                    self.cache.raw_value,
+                )
             return self.cache.raw_value
 
         def _set_manual_parameter(
@@ -207,9 +211,10 @@ class Parameter(ParameterBase):
                 )
             else:
                 mylogger = log
-            mylogger.debug(
-                "Setting raw value of parameter: %s to %s", self.full_name, x
-            )
+            if mylogger.isEnabledFor(logging.DEBUG):
+                mylogger.debug(
+                    "Setting raw value of parameter: %s to %s", self.full_name, x
+                )
             self.cache._set_from_raw_value(x)
             return x
 
@@ -245,7 +250,15 @@ class Parameter(ParameterBase):
             **kwargs,
         )
 
+        # the query of a string ``get_cmd`` which may be coalesced with the
+        # queries of other parameters of the instrument, see ``get_coalesced``
+        self._get_query: str | None = None
+
         no_instrument_get = not self.gettable and (get_cmd is None or get_cmd is False)
+        # True if ``get`` only ever returns the value stored in the cache
+        # such that the value can only change together with the cache
+        # timestamp.
+        self._get_returns_cache = not self.gettable and get_cmd is None
         # TODO: a matching check should be in ParameterBase but
         #   due to the current limited design the ParameterBase cannot
         #   know if this subclass will supply a get_cmd
@@ -288,6 +301,12 @@ class Parameter(ParameterBase):
                     cmd=get_cmd,
                     exec_str=exec_str_ask,
                 )
+                if isinstance(get_cmd, str) and exec_str_ask is not None:
+                    self._get_query = get_cmd.format()
+                async_ask = getattr(instrument, "async_ask", None)
+                if isinstance(get_cmd, str) and async_ask is not None:
+                    self.async_get_raw: Callable[[], Awaitable[ParamRawDataType]]
+                    self.async_get_raw = partial(async_ask, get_cmd.format())
             self._gettable = True
             # mypy resolves the type of self.get_raw to object here.
             # this may be resolvable if Command above is correctly wrapped in MethodType
@@ -320,6 +339,10 @@ class Parameter(ParameterBase):
                 self.set_raw = Command(  # type: ignore[assignment]
                     arg_count=1, cmd=set_cmd, exec_str=exec_str_write
                 )
+                async_write = getattr(instrument, "async_write", None)
+                if isinstance(set_cmd, str) and async_write is not None:
+                    self.async_set_raw: Callable[[ParamRawDataType], Awaitable[None]]
+                    self.async_set_raw = partial(_async_write_cmd, async_write, set_cmd)
             self._settable = True
             self.set = self._wrap_set(self.set_raw)
 
@@ -443,6 +466,12 @@ class Parameter(ParameterBase):
         return SweepFixedValues(self, start=start, stop=stop, step=step, num=num)
 
 
+async def _async_write_cmd(
+    async_write: Callable[[str], Awaitable[None]], cmd: str, value: ParamRawDataType
+) -> None:
+    await async_write(cmd.format(value))
+
+
 class ManualParameter(Parameter):
     def __init__(
         self,
@@ -1,28 +1,44 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import logging
+import operator
 import time
 import warnings
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from functools import cached_property, wraps
 from typing import TYPE_CHECKING, Any, ClassVar, overload
 
+import numpy as np
+
 from qcodes.metadatable import Metadatable, MetadatableWithName
 from qcodes.utils import DelegateAttributes, full_class, qcodes_abstractmethod
+from qcodes.utils.json_utils import _MemoizedSnapshot, _SnapshotMemo
 from qcodes.validators import Enum, Ints, Validator
 
 from .cache import _Cache, _CacheProtocol
 from .named_repr import named_repr
 from .permissive_range import permissive_range
+from .ramp_scheduler import ramp_scheduler
 
 # for now the type the parameter may contain is not restricted at all
 ParamDataType = Any
 ParamRawDataType = Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Iterable, Mapping, Sequence, Sized
+    from collections.abc import (
+        Callable,
+        Generator,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+        Sized,
+    )
+    from concurrent.futures import Future
     from types import TracebackType
 
     from qcodes.instrument.base import InstrumentBase
@@ -94,6 +110,375 @@ def invert_val_mapping(val_mapping: Mapping[Any, Any]) -> dict[Any, Any]:
     return {v: k for k, v in val_mapping.items()}
 
 
+_MISSING = object()
+
+
+def _chain(
+    steps: Sequence[Callable[[Any], Any]],
+) -> Callable[[Any], Any] | None:
+    """
+    Chain the given steps of a transformation into one callable, or None
+    if there are no steps.
+    """
+    if not steps:
+        return None
+    if len(steps) == 1:
+        return steps[0]
+    if len(steps) == 2:
+        first, second = steps
+
+        def chained_two(value: Any) -> Any:
+            return second(first(value))
+
+        return chained_two
+    first, *rest = steps
+
+    def chained(value: Any) -> Any:
+        value = first(value)
+        for step in rest:
+            value = step(value)
+        return value
+
+    return chained
+
+
+def _as_broadcastable(
+    factor: float | Iterable[float],
+) -> float | np.ndarray:
+    """
+    Convert an iterable scale or offset into an array once, such that it
+    can be broadcast against array values without converting it again.
+    """
+    if isinstance(factor, collections.abc.Iterable):
+        return np.asarray(factor)
+    return factor
+
+
+def _fits_in_place(
+    result: np.ndarray, operand: float | np.ndarray, true_divide: bool = False
+) -> bool:
+    """
+    Check if an operation of ``result`` with ``operand`` can be written into
+    ``result``, i.e. if neither the dtype nor the shape of the result of the
+    operation differ from ``result``. A true division requires ``result``
+    to be inexact.
+    """
+    if true_divide and result.dtype.kind not in "fc":
+        return False
+    return np.result_type(result, operand) == result.dtype and (
+        np.ndim(operand) == 0
+        or np.broadcast_shapes(result.shape, np.shape(operand)) == result.shape
+    )
+
+
+# the largest range of integer keys that is looked up in a dense table
+_MAX_DENSE_LOOKUP_SIZE = 1 << 16
+
+
+class _ArrayLookup:
+    """
+    Map all elements of an array through a mapping with a lookup table,
+    which is created on first use. Integer keys in a small range are looked
+    up by indexing a dense table and other keys by a binary search of the
+    sorted keys. Arrays that cannot be looked up in the table, e.g. because
+    they contain values that are not in the mapping or because their dtype
+    cannot be compared with the keys, are mapped element by element with
+    ``map_element``.
+    """
+
+    def __init__(self, mapping: Mapping[Any, Any], map_element: Callable[[Any], Any]):
+        self._mapping = mapping
+        self._map_element = map_element
+        self._created = False
+        self._keys: np.ndarray = np.empty(0)
+        self._values: np.ndarray = np.empty(0)
+        self._dense: tuple[int, np.ndarray, np.ndarray] | None = None
+
+    def _create_table(self) -> None:
+        self._created = True
+        keys = np.asarray(list(self._mapping.keys()))
+        if (
+            len({type(key) for key in self._mapping}) != 1
+            or keys.dtype.kind not in "biufSU"
+            or keys.ndim != 1
+        ):
+            # keys that cannot be sorted and compared element wise
+            return
+        mapped = list(self._mapping.values())
+        if len({type(value) for value in mapped}) == 1:
+            values = np.asarray(mapped)
+        else:
+            # keep values of different types as they are
+            values = np.empty(len(mapped), dtype=object)
+            values[:] = mapped
+        order = np.argsort(keys, kind="stable")
+        self._keys, self._values = keys[order], values[order]
+
+        if keys.dtype.kind in "biu":
+            int_keys = keys.astype(np.int64)
+            low = int(int_keys.min())
+            size = int(int_keys.max()) - low + 1
+            if size <= _MAX_DENSE_LOOKUP_SIZE:
+                present = np.zeros(size, dtype=bool)
+                present[int_keys - low] = True
+                dense_values = np.empty(size, dtype=values.dtype)
+                dense_values[int_keys - low] = values
+                self._dense = (low, present, dense_values)
+
+    def _map_elements(self, array: np.ndarray) -> np.ndarray:
+        mapped = [self._map_element(element) for element in array.ravel().tolist()]
+        return np.asarray(mapped).reshape(array.shape)
+
+    def _lookup_dense(self, array: np.ndarray) -> np.ndarray | None:
+        assert self._dense is not None
+        low, present, dense_values = self._dense
+        if array.min() < low or array.max() >= low + len(present):
+            return None
+        indices = array.astype(np.intp, copy=False)
+        if low:
+            indices = indices - low
+        if not present[indices].all():
+            return None
+        return dense_values[indices]
+
+    def _lookup_sorted(self, array: np.ndarray) -> np.ndarray | None:
+        indices = np.searchsorted(self._keys, array)
+        np.minimum(indices, len(self._keys) - 1, out=indices)
+        if not np.array_equal(self._keys[indices], array):
+            return None
+        return self._values[indices]
+
+    def __call__(self, array: np.ndarray) -> np.ndarray:
+        if not self._created:
+            self._create_table()
+        numeric = "biuf"
+        key_kind = self._keys.dtype.kind
+        comparable = (key_kind in numeric and array.dtype.kind in numeric) or (
+            key_kind in "SU" and key_kind == array.dtype.kind
+        )
+        if len(self._keys) == 0 or not comparable:
+            return self._map_elements(array)
+        if array.size == 0:
+            return np.empty(array.shape, dtype=self._values.dtype)
+        if self._dense is not None and array.dtype.kind in "biu":
+            mapped = self._lookup_dense(array)
+        else:
+            mapped = self._lookup_sorted(array)
+        if mapped is None:
+            # let the element wise mapping handle missing values
+            return self._map_elements(array)
+        return mapped
+
+
+def _compile_raw_to_value(
+    get_parser: Callable[..., Any] | None,
+    offset: float | Iterable[float] | None,
+    scale: float | Iterable[float] | None,
+    inverse_val_mapping: Mapping[Any, Any] | None,
+) -> Callable[[ParamRawDataType], ParamDataType] | None:
+    """
+    Compile the transformation of a raw value into a value, i.e. the
+    ``get_parser`` followed by the offset, the scale and the inverse value
+    mapping, into one callable. Returns None if the value is the raw value.
+
+    Array values are transformed with one NumPy operation per step, and the
+    scale is applied in place to the array that the offset created.
+    """
+    steps: list[Callable[[Any], Any]] = []
+    if get_parser is not None:
+        steps.append(get_parser)
+
+    if offset is not None:
+        offset_array = _as_broadcastable(offset)
+
+        def subtract_offset(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                return np.subtract(value, offset_array)
+            if value is None:
+                return value
+            try:
+                return value - offset
+            except TypeError:
+                if isinstance(offset, collections.abc.Iterable):
+                    # offset contains multiple elements, one for each value
+                    return tuple(val - off for val, off in zip(value, offset))
+                elif isinstance(value, collections.abc.Iterable):
+                    # Use single offset for all values
+                    return tuple(val - offset for val in value)
+                raise
+
+    if scale is not None:
+        scale_array = _as_broadcastable(scale)
+
+        def divide_scale(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                return np.divide(value, scale_array)
+            if value is None:
+                return value
+            try:
+                return value / scale
+            except TypeError:
+                if isinstance(scale, collections.abc.Iterable):
+                    # Scale contains multiple elements, one for each value
+                    return tuple(val / sc for val, sc in zip(value, scale))
+                elif isinstance(value, collections.abc.Iterable):
+                    # Use single scale for all values
+                    return tuple(val / scale for val in value)
+                raise
+
+    if offset is not None and scale is not None:
+
+        def subtract_offset_and_divide_scale(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                result = np.subtract(value, offset_array)
+                if _fits_in_place(result, scale_array, true_divide=True):
+                    # the result is a new array so it is safe to overwrite
+                    return np.divide(result, scale_array, out=result)
+                return np.divide(result, scale_array)
+            if value is None:
+                return value
+            try:
+                return (value - offset) / scale
+            except TypeError:
+                return divide_scale(subtract_offset(value))
+
+        steps.append(subtract_offset_and_divide_scale)
+    elif offset is not None:
+        steps.append(subtract_offset)
+    elif scale is not None:
+        steps.append(divide_scale)
+
+    if inverse_val_mapping is not None:
+
+        def map_element(value: Any) -> Any:
+            mapped = inverse_val_mapping.get(value, _MISSING)
+            if mapped is not _MISSING:
+                return mapped
+            try:
+                return inverse_val_mapping[int(value)]
+            except (ValueError, KeyError):
+                raise KeyError(f"'{value}' not in val_mapping")
+
+        map_array = _ArrayLookup(inverse_val_mapping, map_element)
+
+        def map_value(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                return map_array(value)
+            return map_element(value)
+
+        steps.append(map_value)
+
+    return _chain(steps)
+
+
+def _compile_value_to_raw(
+    val_mapping: Mapping[Any, Any] | None,
+    scale: float | Iterable[float] | None,
+    offset: float | Iterable[float] | None,
+    set_parser: Callable[..., Any] | None,
+) -> Callable[[ParamDataType], ParamRawDataType] | None:
+    """
+    Compile the transformation of a value into a raw value, i.e. the value
+    mapping followed by the scale, the offset and the ``set_parser``, into
+    one callable. Returns None if the raw value is the value.
+
+    Array values are transformed with one NumPy operation per step, and the
+    offset is applied in place to the array that the scale created.
+    """
+    steps: list[Callable[[Any], Any]] = []
+    if val_mapping is not None:
+        map_element = val_mapping.__getitem__
+        map_array = _ArrayLookup(val_mapping, map_element)
+
+        def map_value(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                return map_array(value)
+            return map_element(value)
+
+        steps.append(map_value)
+
+    if scale is not None:
+        scale_array = _as_broadcastable(scale)
+        if isinstance(scale, collections.abc.Iterable):
+            # Scale contains multiple elements, one for each value
+            def multiply_scale(value: Any) -> Any:
+                if isinstance(value, np.ndarray):
+                    return np.multiply(value, scale_array)
+                return tuple(val * sc for val, sc in zip(value, scale))
+        else:
+            # Use single scale for all values
+            def multiply_scale(value: Any) -> Any:
+                return value * scale
+
+    if offset is not None:
+        offset_array = _as_broadcastable(offset)
+        if isinstance(offset, collections.abc.Iterable):
+            # offset contains multiple elements, one for each value
+            def add_offset(value: Any) -> Any:
+                if isinstance(value, np.ndarray):
+                    return np.add(value, offset_array)
+                return tuple(val + off for val, off in zip(value, offset))
+        else:
+            # Use single offset for all values
+            def add_offset(value: Any) -> Any:
+                return value + offset
+
+    if scale is not None and offset is not None:
+
+        def multiply_scale_and_add_offset(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                result = np.multiply(value, scale_array)
+                if _fits_in_place(result, offset_array):
+                    # the result is a new array so it is safe to overwrite
+                    return np.add(result, offset_array, out=result)
+                return np.add(result, offset_array)
+            return add_offset(multiply_scale(value))
+
+        steps.append(multiply_scale_and_add_offset)
+    elif scale is not None:
+        steps.append(multiply_scale)
+    elif offset is not None:
+        steps.append(add_offset)
+
+    if set_parser is not None:
+        steps.append(set_parser)
+
+    return _chain(steps)
+
+
+@dataclass(frozen=True)
+class _CompiledTransforms:
+    """
+    The transformations between values and raw values and the validation
+    of a parameter, compiled from its current configuration.
+
+    Args:
+        raw_to_value: The transformation of ``_from_raw_value_to_value``
+            without overrides by subclasses, or None for the identity.
+        value_to_raw: The transformation of ``_from_value_to_raw_value``
+            without overrides by subclasses, or None for the identity.
+        get_transform: The transformation applied when getting, which is
+            the override of ``_from_raw_value_to_value`` if there is one.
+        set_transform: The transformation applied when setting, which is
+            the override of ``_from_value_to_raw_value`` if there is one.
+        validate: Validates a value, which is the override of ``validate``
+            if there is one.
+        default_ramp: True if ``get_ramp_values`` is not overridden, such
+            that a parameter without a step is set in a single step.
+        default_checks: True if ``gettable``, ``settable`` and ``abstract``
+            are not overridden, such that they can be checked directly.
+
+    """
+
+    raw_to_value: Callable[[ParamRawDataType], ParamDataType] | None
+    value_to_raw: Callable[[ParamDataType], ParamRawDataType] | None
+    get_transform: Callable[[ParamRawDataType], ParamDataType] | None
+    set_transform: Callable[[ParamDataType], ParamRawDataType] | None
+    validate: Callable[[ParamDataType], None]
+    default_ramp: bool
+    default_checks: bool
+
+
 class ParameterBase(MetadatableWithName):
     """
     Shared behavior for all parameters. Not intended to be used
@@ -226,6 +611,11 @@ class ParameterBase(MetadatableWithName):
         self._snapshot_get = snapshot_get
         self._snapshot_value = snapshot_value
         self.snapshot_exclude = snapshot_exclude
+        self._compiled_transforms: _CompiledTransforms | None = None
+        self._snapshot_memo: tuple[str, tuple[Any, ...], _SnapshotMemo] | None = None
+        self._snapshot_attrs_getter: (
+            tuple[list[str], Callable[[ParameterBase], tuple[Any, ...]]] | None
+        ) = None
 
         if not isinstance(vals, (Validator, type(None))):
             raise TypeError("vals must be None or a Validator")
@@ -249,8 +639,8 @@ class ParameterBase(MetadatableWithName):
         else:
             self.inverse_val_mapping = invert_val_mapping(val_mapping)
 
-        self.get_parser: Callable[..., Any] | None = get_parser
-        self.set_parser: Callable[..., Any] | None = set_parser
+        self.get_parser = get_parser
+        self.set_parser = set_parser
 
         # ``_Cache`` stores "latest" value (and raw value) and timestamp
         # when it was set or measured
@@ -350,6 +740,162 @@ class ParameterBase(MetadatableWithName):
     def _build__doc__(self) -> str | None:
         return self.__doc__
 
+    def _invalidate_transforms(self) -> None:
+        """
+        Discard the compiled transformations such that they are compiled
+        again from the current configuration on the next get or set.
+        """
+        self._compiled_transforms = None
+
+    def _compile_transforms(self) -> _CompiledTransforms:
+        """
+        Compile the transformations between values and raw values and the
+        validation from the current configuration of the parameter. They
+        are compiled again whenever the scale, offset, parsers, value
+        mapping or validators change.
+        """
+        raw_to_value = _compile_raw_to_value(
+            self._get_parser, self._offset, self._scale, self._inverse_val_mapping
+        )
+        value_to_raw = _compile_value_to_raw(
+            self._val_mapping, self._scale, self._offset, self._set_parser
+        )
+        cls = type(self)
+        get_transform = (
+            raw_to_value
+            if cls._from_raw_value_to_value is ParameterBase._from_raw_value_to_value
+            else self._from_raw_value_to_value
+        )
+        set_transform = (
+            value_to_raw
+            if cls._from_value_to_raw_value is ParameterBase._from_value_to_raw_value
+            else self._from_value_to_raw_value
+        )
+        validate: Callable[[ParamDataType], None]
+        if cls.validate is ParameterBase.validate:
+            validate = self._compile_validate()
+        else:
+            validate = self.validate
+        self._compiled_transforms = _CompiledTransforms(
+            raw_to_value=raw_to_value,
+            value_to_raw=value_to_raw,
+            get_transform=get_transform,
+            set_transform=set_transform,
+            validate=validate,
+            default_ramp=cls.get_ramp_values is ParameterBase.get_ramp_values,
+            default_checks=(
+                cls.gettable is ParameterBase.gettable
+                and cls.settable is ParameterBase.settable
+                and cls.abstract is ParameterBase.abstract
+            ),
+        )
+        return self._compiled_transforms
+
+    def _compile_validate(self) -> Callable[[ParamDataType], None]:
+        validators = tuple(
+            validator.validate
+            for validator in reversed(self._vals)
+            if validator is not None
+        )
+        context = self._validate_context
+
+        if not validators:
+
+            def validate(value: ParamDataType) -> None:
+                pass
+
+        elif len(validators) == 1:
+            (single_validate,) = validators
+
+            def validate(value: ParamDataType) -> None:
+                single_validate(value, context)
+
+        else:
+
+            def validate(value: ParamDataType) -> None:
+                for validator_validate in validators:
+                    validator_validate(value, context)
+
+        return validate
+
+    @property
+    def scale(self) -> float | Iterable[float] | None:
+        """
+        Scale to multiply value with before performing set. The
+        internally multiplied value is stored in ``cache.raw_value``.
+        Scale is divided out when getting.
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: float | Iterable[float] | None) -> None:
+        self._scale = scale
+        self._invalidate_transforms()
+
+    @property
+    def offset(self) -> float | Iterable[float] | None:
+        """
+        Offset to add to value before performing set. The internally
+        added value is stored in ``cache.raw_value``. Offset is subtracted
+        when getting.
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: float | Iterable[float] | None) -> None:
+        self._offset = offset
+        self._invalidate_transforms()
+
+    @property
+    def val_mapping(self) -> Mapping[Any, Any] | None:
+        """
+        A map from values to instrument codes.
+        """
+        return self._val_mapping
+
+    @val_mapping.setter
+    def val_mapping(self, val_mapping: Mapping[Any, Any] | None) -> None:
+        self._val_mapping = val_mapping
+        self._invalidate_transforms()
+
+    @property
+    def inverse_val_mapping(self) -> Mapping[Any, Any] | None:
+        """
+        A map from instrument codes to values.
+        """
+        return self._inverse_val_mapping
+
+    @inverse_val_mapping.setter
+    def inverse_val_mapping(
+        self, inverse_val_mapping: Mapping[Any, Any] | None
+    ) -> None:
+        self._inverse_val_mapping = inverse_val_mapping
+        self._invalidate_transforms()
+
+    @property
+    def get_parser(self) -> Callable[..., Any] | None:
+        """
+        Function to transform the response from get.
+        """
+        return self._get_parser
+
+    @get_parser.setter
+    def get_parser(self, get_parser: Callable[..., Any] | None) -> None:
+        self._get_parser = get_parser
+        self._invalidate_transforms()
+
+    @property
+    def set_parser(self) -> Callable[..., Any] | None:
+        """
+        Function to transform the input set value.
+        """
+        return self._set_parser
+
+    @set_parser.setter
+    def set_parser(self, set_parser: Callable[..., Any] | None) -> None:
+        self._set_parser = set_parser
+        self._invalidate_transforms()
+
     @property
     def vals(self) -> Validator | None:
         """
@@ -384,6 +930,7 @@ class ParameterBase(MetadatableWithName):
         else:
             # setting the validator to None but the parameter already doesn't have a validator
             pass
+        self._invalidate_transforms()
         self.__doc__ = self._build__doc__()
 
     def add_validator(self, vals: Validator) -> None:
@@ -395,6 +942,7 @@ class ParameterBase(MetadatableWithName):
 
         """
         self._vals.append(vals)
+        self._invalidate_transforms()
         self.__doc__ = self._build__doc__()
 
     def remove_validator(self) -> Validator | None:
@@ -409,6 +957,7 @@ class ParameterBase(MetadatableWithName):
         """
         if len(self._vals) > 0:
             removed = self._vals.pop()
+            self._invalidate_transforms()
             self.__doc__ = self._build__doc__()
             return removed
         else:
@@ -535,7 +1084,20 @@ class ParameterBase(MetadatableWithName):
                 stacklevel=2,
             )
 
-        state: dict[str, Any] = {"__class__": full_class(self), "full_name": str(self)}
+        full_name = str(self)
+        memo = self._snapshot_memo
+        if memo is not None and not self._snapshot_calls_get(update):
+            memo_name, memo_fingerprint, snapshot_memo = memo
+            fingerprint = self._snapshot_fingerprint()
+            if (
+                fingerprint is not None
+                and memo_name == full_name
+                and len(fingerprint) == len(memo_fingerprint)
+                and all(map(operator.is_, fingerprint, memo_fingerprint))
+            ):
+                return _MemoizedSnapshot(snapshot_memo)
+
+        state: dict[str, Any] = {"__class__": full_class(self), "full_name": full_name}
 
         if self._snapshot_value:
             has_get = self.gettable
@@ -556,6 +1118,7 @@ class ParameterBase(MetadatableWithName):
             state["raw_value"] = self.cache.raw_value
 
         state["ts"] = self.cache.timestamp
+        memoizable = True
 
         if isinstance(state["ts"], datetime):
             dttime: datetime = state["ts"]
@@ -579,10 +1142,72 @@ class ParameterBase(MetadatableWithName):
                         state[attr_strip] = repr(val)
                     elif isinstance(val, Metadatable):
                         state[attr_strip] = val.snapshot(update=update)
+                        # the snapshot of the attribute may change on its own
+                        memoizable = False
                     else:
                         state[attr_strip] = val
 
-        return state
+        fingerprint = self._snapshot_fingerprint() if memoizable else None
+        if fingerprint is None:
+            return state
+        snapshot_memo = _SnapshotMemo(state)
+        self._snapshot_memo = (full_name, fingerprint, snapshot_memo)
+        return _MemoizedSnapshot(snapshot_memo)
+
+    def _snapshot_calls_get(self, update: bool | None) -> bool:
+        """
+        Whether creating the snapshot with the given ``update`` gets the
+        parameter.
+        """
+        return (
+            self._snapshot_value
+            and self._snapshot_get
+            and update is not False
+            and self.gettable
+            and (bool(update) or not self.cache.valid)
+        )
+
+    def _snapshot_fingerprint(self) -> tuple[Any, ...] | None:
+        """
+        The objects that the snapshot of the parameter is created from. The
+        snapshot is reused by the next snapshot for which the parameter is
+        not got, as long as all these objects are identical, i.e. the cache
+        has not been updated and none of the attributes in the snapshot have
+        been replaced. Returns None if the snapshot cannot be reused, which
+        is the case for subclasses that extend the snapshot and for caches
+        other than the default cache.
+        """
+        cache = self.cache
+        if (
+            type(cache) is not _Cache
+            or type(self).snapshot_base is not ParameterBase.snapshot_base
+        ):
+            return None
+        getter = self._snapshot_attrs_getter
+        if getter is None or getter[0] != self._meta_attrs:
+            # the validators are part of the fingerprint on their own
+            attrs = [attr for attr in self._meta_attrs if attr != "validators"]
+            getter = (
+                list(self._meta_attrs),
+                operator.attrgetter("_snapshot_value", *attrs),
+            )
+            self._snapshot_attrs_getter = getter
+        try:
+            attr_values = getter[1](self)
+        except AttributeError:
+            return None
+        fingerprint = [
+            cache._monotonic_ns,
+            cache._timestamp,
+            cache._value,
+            cache._raw_value,
+            *attr_values,
+        ]
+        for validator in self._vals:
+            # validators can be modified in place through their setters
+            fingerprint.append(validator)
+            fingerprint.extend(getattr(validator, "__dict__", {}).values())
+        return tuple(fingerprint)
 
     @property
     def snapshot_value(self) -> bool:
@@ -592,91 +1217,46 @@ class ParameterBase(MetadatableWithName):
         return self._snapshot_value
 
     def _from_value_to_raw_value(self, value: ParamDataType) -> ParamRawDataType:
-        raw_value: ParamRawDataType
-
-        if self.val_mapping is not None:
-            # Convert set values using val_mapping dictionary
-            raw_value = self.val_mapping[value]
-        else:
-            raw_value = value
-
-        # transverse transformation in reverse order as compared to
-        # getter: apply scale first
-        if self.scale is not None:
-            if isinstance(self.scale, collections.abc.Iterable):
-                # Scale contains multiple elements, one for each value
-                raw_value = tuple(
-                    val * scale for val, scale in zip(raw_value, self.scale)
-                )
-            else:
-                # Use single scale for all values
-                raw_value = raw_value * self.scale
-
-        # apply offset next
-        if self.offset is not None:
-            if isinstance(self.offset, collections.abc.Iterable):
-                # offset contains multiple elements, one for each value
-                raw_value = tuple(
-                    val + offset for val, offset in zip(raw_value, self.offset)
-                )
-            else:
-                # Use single offset for all values
-                raw_value = raw_value + self.offset
-
-        # parser last
-        if self.set_parser is not None:
-            raw_value = self.set_parser(raw_value)
-
-        return raw_value
+        # the value mapping is applied first, then the scale and the offset
+        # and the parser last, in reverse order as compared to the getter
+        transforms = self._compiled_transforms or self._compile_transforms()
+        if transforms.value_to_raw is None:
+            return value
+        return transforms.value_to_raw(value)
 
     def _from_raw_value_to_value(self, raw_value: ParamRawDataType) -> ParamDataType:
-        value: ParamDataType
+        # the parser is applied first, then the offset and the scale and the
+        # inverse value mapping last
+        transforms = self._compiled_transforms or self._compile_transforms()
+        if transforms.raw_to_value is None:
+            return raw_value
+        return transforms.raw_to_value(raw_value)
+
+    def _check_gettable(self) -> None:
+        if not self.gettable:
+            raise TypeError("Trying to get a parameter that is not gettable.")
+        if self.abstract:
+            raise NotImplementedError(
+                f"Trying to get an abstract parameter: {self.full_name}"
+            )
 
-        if self.get_parser is not None:
-            value = self.get_parser(raw_value)
-        else:
-            value = raw_value
+    def _check_settable(self) -> None:
+        if not self.settable:
+            raise TypeError("Trying to set a parameter that is not settable.")
+        if self.abstract:
+            raise NotImplementedError(
+                f"Trying to set an abstract parameter: {self.full_name}"
+            )
 
-        # apply offset first (native scale)
-        if self.offset is not None and value is not None:
-            # offset values
-            try:
-                value = value - self.offset
-            except TypeError:
-                if isinstance(self.offset, collections.abc.Iterable):
-                    # offset contains multiple elements, one for each value
-                    value = tuple(
-                        val - offset for val, offset in zip(value, self.offset)
-                    )
-                elif isinstance(value, collections.abc.Iterable):
-                    # Use single offset for all values
-                    value = tuple(val - self.offset for val in value)
-                else:
-                    raise
+    def _process_raw_value(self, raw_value: ParamRawDataType) -> ParamDataType:
+        transforms = self._compiled_transforms or self._compile_transforms()
+        get_transform = transforms.get_transform
+        value = raw_value if get_transform is None else get_transform(raw_value)
 
-        # scale second
-        if self.scale is not None and value is not None:
-            # Scale values
-            try:
-                value = value / self.scale
-            except TypeError:
-                if isinstance(self.scale, collections.abc.Iterable):
-                    # Scale contains multiple elements, one for each value
-                    value = tuple(val / scale for val, scale in zip(value, self.scale))
-                elif isinstance(value, collections.abc.Iterable):
-                    # Use single scale for all values
-                    value = tuple(val / self.scale for val in value)
-                else:
-                    raise
+        if self._validate_on_get:
+            self.validate(value)
 
-        if self.inverse_val_mapping is not None:
-            if value in self.inverse_val_mapping:
-                value = self.inverse_val_mapping[value]
-            else:
-                try:
-                    value = self.inverse_val_mapping[int(value)]
-                except (ValueError, KeyError):
-                    raise KeyError(f"'{value}' not in val_mapping")
+        self.cache._update_with(value=value, raw_value=raw_value)
 
         return value
 
@@ -685,24 +1265,14 @@ class ParameterBase(MetadatableWithName):
     ) -> Callable[..., ParamDataType]:
         @wraps(get_function)
         def get_wrapper(*args: Any, **kwargs: Any) -> ParamDataType:
-            if not self.gettable:
-                raise TypeError("Trying to get a parameter that is not gettable.")
-            if self.abstract:
-                raise NotImplementedError(
-                    f"Trying to get an abstract parameter: {self.full_name}"
-                )
+            transforms = self._compiled_transforms or self._compile_transforms()
+            if not (transforms.default_checks and self._gettable) or self._abstract:
+                self._check_gettable()
             try:
                 # There might be cases where a .get also has args/kwargs
                 raw_value = get_function(*args, **kwargs)
 
-                value = self._from_raw_value_to_value(raw_value)
-
-                if self._validate_on_get:
-                    self.validate(value)
-
-                self.cache._update_with(value=value, raw_value=raw_value)
-
-                return value
+                return self._process_raw_value(raw_value)
 
             except Exception as e:
                 e.args = e.args + (f"getting {self}",)
@@ -714,25 +1284,16 @@ class ParameterBase(MetadatableWithName):
         @wraps(set_function)
         def set_wrapper(value: ParamDataType, **kwargs: Any) -> None:
             try:
-                if not self.settable:
-                    raise TypeError("Trying to set a parameter that is not settable.")
-                if self.abstract:
-                    raise NotImplementedError(
-                        f"Trying to set an abstract parameter: {self.full_name}"
+                transforms = self._compiled_transforms or self._compile_transforms()
+                if not (transforms.default_checks and self._settable) or self._abstract:
+                    self._check_settable()
+                set_transform = transforms.set_transform
+                transforms.validate(value)
+
+                for val_step in self._set_steps(value, transforms):
+                    raw_val_step = (
+                        val_step if set_transform is None else set_transform(val_step)
                     )
-                self.validate(value)
-
-                # In some cases intermediate sweep values must be used.
-                # Unless `self.step` is defined, get_sweep_values will return
-                # a list containing only `value`.
-                steps = self.get_ramp_values(value, step=self.step)
-
-                for step_index, val_step in enumerate(steps):
-                    # even if the final value is valid we may be generating
-                    # steps that are not so validate them too
-                    self.validate(val_step)
-
-                    raw_val_step = self._from_value_to_raw_value(val_step)
 
                     # Check if delay between set operations is required
                     t_elapsed = time.perf_counter() - self._t_last_set
@@ -763,6 +1324,167 @@ class ParameterBase(MetadatableWithName):
 
         return set_wrapper
 
+    async def async_get(self) -> ParamDataType:
+        """
+        Get the value of the parameter without blocking the event loop.
+
+        If the parameter implements ``async_get_raw`` the raw value is
+        awaited from it and transformed like in ``get``. Otherwise ``get``
+        is called in a worker thread.
+        """
+        async_get_raw = getattr(self, "async_get_raw", None)
+        if async_get_raw is None:
+            return await asyncio.to_thread(self.get)
+
+        self._check_gettable()
+        try:
+            raw_value = await async_get_raw()
+            return self._process_raw_value(raw_value)
+        except Exception as e:
+            e.args = e.args + (f"getting {self}",)
+            raise e
+
+    async def async_set(self, value: ParamDataType) -> None:
+        """
+        Set the value of the parameter without blocking the event loop.
+
+        If the parameter implements ``async_set_raw`` the raw values are
+        awaited on it, including ramping in steps and waiting for
+        ``inter_delay`` and ``post_delay``, like in ``set``. Otherwise
+        ``set`` is called in a worker thread.
+        """
+        async_set_raw = getattr(self, "async_set_raw", None)
+        if async_set_raw is None:
+            await asyncio.to_thread(self.set, value)
+            return
+
+        try:
+            self._check_settable()
+            transforms = self._compiled_transforms or self._compile_transforms()
+            set_transform = transforms.set_transform
+            transforms.validate(value)
+
+            for val_step in self._set_steps(value, transforms):
+                raw_val_step = (
+                    val_step if set_transform is None else set_transform(val_step)
+                )
+
+                t_elapsed = time.perf_counter() - self._t_last_set
+                if t_elapsed < self.inter_delay:
+                    await asyncio.sleep(self.inter_delay - t_elapsed)
+
+                t0 = time.perf_counter()
+
+                await async_set_raw(raw_val_step)
+
+                self._t_last_set = time.perf_counter()
+
+                t_elapsed = self._t_last_set - t0
+                if t_elapsed < self.post_delay:
+                    await asyncio.sleep(self.post_delay - t_elapsed)
+
+                self.cache._update_with(value=val_step, raw_value=raw_val_step)
+
+        except Exception as e:
+            e.args = e.args + (f"setting {self} to {value}",)
+            raise e
+
+    def ramp_to(self, value: ParamDataType) -> Future[None]:
+        """
+        Ramp the parameter to the given value in the background.
+
+        The parameter is set in steps of ``step``, waiting for
+        ``inter_delay`` and ``post_delay``, like in ``set``, but without
+        blocking the caller. The ramps of all parameters of an instrument
+        are performed by one ramp scheduler, which interleaves their steps,
+        so ramping several parameters takes as long as the longest ramp
+        rather than the sum of all of them. Ramps of the same parameter
+        are performed in the order in which they are requested, each one
+        starting from the value the previous one ended at.
+
+        The parameters of an instrument that is ramping should not be set
+        from other threads at the same time.
+
+        Args:
+            value: The value to ramp the parameter to.
+
+        Returns:
+            A future that is done when the parameter has been set to
+            ``value``, holding the exception if ramping failed.
+
+        """
+        try:
+            self._check_settable()
+            transforms = self._compiled_transforms or self._compile_transforms()
+            transforms.validate(value)
+        except Exception as e:
+            e.args = e.args + (f"setting {self} to {value}",)
+            raise e
+        return ramp_scheduler(self).submit(self, self._ramp_steps(value, transforms))
+
+    def _ramp_steps(
+        self, value: ParamDataType, transforms: _CompiledTransforms
+    ) -> Iterator[float]:
+        """
+        Set the parameter to the given, already validated, value like in
+        ``set``, but yield the ``time.perf_counter`` time to wait for
+        instead of sleeping.
+        """
+        try:
+            if getattr(self.set_raw, "__qcodes_is_abstract_method__", False):
+                # the parameter implements set directly so it cannot be
+                # set step by step
+                self.set(value)
+                return
+            set_transform = transforms.set_transform
+
+            for val_step in self._set_steps(value, transforms):
+                raw_val_step = (
+                    val_step if set_transform is None else set_transform(val_step)
+                )
+
+                t_next_set = self._t_last_set + self.inter_delay
+                if time.perf_counter() < t_next_set:
+                    yield t_next_set
+
+                t0 = time.perf_counter()
+
+                self.set_raw(raw_val_step)
+
+                self._t_last_set = time.perf_counter()
+
+                if self._t_last_set - t0 < self.post_delay:
+                    yield t0 + self.post_delay
+
+                self.cache._update_with(value=val_step, raw_value=raw_val_step)
+
+        except Exception as e:
+            e.args = e.args + (f"setting {self} to {value}",)
+            raise e
+
+    def _set_steps(
+        self, value: ParamDataType, transforms: _CompiledTransforms
+    ) -> Iterable[ParamDataType]:
+        """
+        The validated values to set the parameter to in order to set it to
+        the given, already validated, value.
+        """
+        if self._step is None and transforms.default_ramp:
+            return (value,)
+        return self._validated_ramp_values(value, transforms.validate)
+
+    def _validated_ramp_values(
+        self, value: ParamDataType, validate: Callable[[ParamDataType], None]
+    ) -> Iterator[ParamDataType]:
+        # In some cases intermediate sweep values must be used.
+        # Unless `self.step` is defined, get_ramp_values will return
+        # a list containing only `value`.
+        for val_step in self.get_ramp_values(value, step=self.step):
+            # even if the final value is valid we may be generating
+            # steps that are not so validate them too
+            validate(val_step)
+            yield val_step
+
     def get_ramp_values(
         self, value: float | Sized, step: float | None = None
     ) -> Sequence[float | Sized]:
@@ -0,0 +1,185 @@
+"""
+This module implements ramping parameters in the background. The ramps of
+the parameters of an instrument are performed by one :class:`RampScheduler`
+per instrument, which interleaves the steps of all of them in a worker
+thread. Several parameters therefore ramp concurrently, while the steps of
+each parameter still respect its ``inter_delay`` and ``post_delay``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .parameter_base import ParamDataType, ParameterBase
+
+
+class _Ramp:
+    __slots__ = ("future", "parameter", "steps")
+
+    def __init__(self, parameter: ParameterBase, steps: Iterator[float]):
+        self.parameter = parameter
+        self.steps = steps
+        self.future: Future[None] = Future()
+
+
+class RampScheduler:
+    """
+    Performs the ramps of the parameters of one instrument in a worker
+    thread.
+
+    A ramp is given as an iterator that sets the parameter one step at a
+    time and yields the ``time.perf_counter`` time at which it may
+    continue. The scheduler always continues the ramp that is due first,
+    such that the steps of ramps of different parameters are interleaved.
+    Ramps of the same parameter are performed one after the other in the
+    order in which they are submitted.
+
+    The worker thread is started when a ramp is submitted and exits once
+    there are no ramps left.
+
+    Args:
+        name: Name of the scheduler, used to name its worker thread.
+
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._condition = threading.Condition()
+        self._due: list[tuple[float, int, _Ramp]] = []
+        self._order = itertools.count()
+        # ramps waiting for the running ramp of the same parameter to finish
+        self._queued: dict[int, deque[_Ramp]] = {}
+        self._thread: threading.Thread | None = None
+
+    def submit(self, parameter: ParameterBase, steps: Iterator[float]) -> Future[None]:
+        """
+        Submit a ramp of the given parameter.
+
+        Args:
+            parameter: The parameter that is ramped.
+            steps: Iterator that performs the steps of the ramp, see the
+                class docstring.
+
+        Returns:
+            A future that is done when the ramp is done. It can be
+            cancelled until the ramp has started.
+
+        """
+        ramp = _Ramp(parameter, steps)
+        with self._condition:
+            queued = self._queued.get(id(parameter))
+            if queued is not None:
+                queued.append(ramp)
+            else:
+                self._queued[id(parameter)] = deque()
+                self._schedule(ramp, time.perf_counter())
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"qcodes_ramp_{self.name}", daemon=True
+                )
+                self._thread.start()
+        return ramp.future
+
+    def _schedule(self, ramp: _Ramp, due: float) -> None:
+        heapq.heappush(self._due, (due, next(self._order), ramp))
+        self._condition.notify()
+
+    def _next_due_ramp(self) -> _Ramp | None:
+        with self._condition:
+            while self._due:
+                due, _, ramp = self._due[0]
+                delay = due - time.perf_counter()
+                if delay <= 0:
+                    heapq.heappop(self._due)
+                    return ramp
+                self._condition.wait(delay)
+            self._thread = None
+            return None
+
+    def _run(self) -> None:
+        while (ramp := self._next_due_ramp()) is not None:
+            self._step(ramp)
+
+    def _step(self, ramp: _Ramp) -> None:
+        future = ramp.future
+        if not future.running() and not future.set_running_or_notify_cancel():
+            self._finish(ramp)
+            return
+        try:
+            due = next(ramp.steps)
+        except StopIteration:
+            future.set_result(None)
+            self._finish(ramp)
+        except Exception as e:
+            future.set_exception(e)
+            self._finish(ramp)
+        else:
+            with self._condition:
+                self._schedule(ramp, due)
+
+    def _finish(self, ramp: _Ramp) -> None:
+        with self._condition:
+            key = id(ramp.parameter)
+            queued = self._queued[key]
+            if queued:
+                self._schedule(queued.popleft(), time.perf_counter())
+            else:
+                del self._queued[key]
+
+
+_schedulers: WeakKeyDictionary[Any, RampScheduler] = WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def ramp_scheduler(parameter: ParameterBase) -> RampScheduler:
+    """
+    The ramp scheduler of the root instrument of the given parameter, or of
+    the parameter itself if it does not belong to an instrument.
+    """
+    owner: Any = parameter.root_instrument or parameter
+    with _schedulers_lock:
+        scheduler = _schedulers.get(owner)
+        if scheduler is None:
+            scheduler = RampScheduler(owner.full_name)
+            _schedulers[owner] = scheduler
+    return scheduler
+
+
+def ramp_parameters(
+    *param_values: tuple[ParameterBase, ParamDataType], timeout: float | None = None
+) -> None:
+    """
+    Ramp the given parameters to the given values concurrently with
+    :meth:`.ParameterBase.ramp_to` and wait until all of them are done.
+
+    Args:
+        *param_values: Each parameter together with the value to ramp it to.
+        timeout: Maximal time in seconds to wait for the ramps. None to
+            wait until they are done.
+
+    Raises:
+        TimeoutError: If the ramps are not done within ``timeout``. The
+            ramps that are not done carry on in the background.
+        Exception: The first exception raised while ramping in the order
+            of ``param_values``, once all ramps are done.
+
+    """
+    futures = [parameter.ramp_to(value) for parameter, value in param_values]
+    _, not_done = wait(futures, timeout=timeout)
+    if not_done:
+        raise TimeoutError(
+            f"Ramping {len(not_done)} of {len(futures)} parameters did not "
+            f"finish within {timeout} s."
+        )
+    for future in futures:
+        future.result()
@@ -11,6 +11,8 @@ import json
 import logging
 import os
 import pkgutil
+import threading
+import time
 import warnings
 from collections import deque
 from contextlib import suppress
@@ -36,6 +38,7 @@ import qcodes.instrument_drivers
 from qcodes import validators
 from qcodes.instrument.base import Instrument, InstrumentBase
 from qcodes.instrument.channel import ChannelTuple
+from qcodes.instrument.instrument_base import _snapshot_time_budget
 from qcodes.metadatable import Metadatable, MetadatableWithName
 from qcodes.monitor.monitor import Monitor
 from qcodes.parameters import (
@@ -126,6 +129,19 @@ class Station(Metadatable, DelegateAttributes):
         default: Is this station the default?
         update_snapshot: Immediately update the snapshot of each
             component as it is added to the Station.
+        parallel_snapshot: Snapshot the instruments of the station
+            concurrently, each instrument in its own thread, instead of one
+            after the other.
+        snapshot_timeout: The time in seconds that the snapshot of each
+            instrument may spend updating its parameters. Parameters that
+            are due for an update after the time is up are snapshotted from
+            their cache and listed under ``"stale_parameters"`` in the
+            snapshot of their instrument. With ``parallel_snapshot``, an
+            instrument whose snapshot is not complete in time, e.g. because
+            it is slow to respond, is listed under ``"stale_instruments"``
+            in the snapshot of the station. The snapshot still waits for
+            the query in progress of such an instrument to complete. If
+            None, which is the default, snapshots are not limited in time.
 
     """
 
@@ -150,10 +166,15 @@ class Station(Metadatable, DelegateAttributes):
         use_monitor: bool | None = None,
         default: bool = True,
         update_snapshot: bool = True,
+        parallel_snapshot: bool = False,
+        snapshot_timeout: float | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
 
+        self.parallel_snapshot = parallel_snapshot
+        self.snapshot_timeout = snapshot_timeout
+
         # when a new station is defined, store it in a class variable
         # so it becomes the globally accessible default station.
         # You can still have multiple stations defined, but to use
@@ -218,6 +239,7 @@ class Station(Metadatable, DelegateAttributes):
         }
 
         components_to_remove = []
+        instruments: dict[str, Instrument] = {}
 
         for name, itm in self.components.items():
             if isinstance(itm, Instrument):
@@ -225,7 +247,7 @@ class Station(Metadatable, DelegateAttributes):
                 # station object, hence this 'if' allows to avoid
                 # snapshotting instruments that are already closed
                 if Instrument.is_valid(itm):
-                    snap["instruments"][name] = itm.snapshot(update=update)
+                    instruments[name] = itm
                 else:
                     components_to_remove.append(name)
             elif isinstance(itm, (Parameter, ManualParameter)):
@@ -234,11 +256,81 @@ class Station(Metadatable, DelegateAttributes):
             else:
                 snap["components"][name] = itm.snapshot(update=update)
 
+        if self.parallel_snapshot and len(instruments) > 1:
+            snap["instruments"], stale_instruments = self._snapshot_in_parallel(
+                instruments, update
+            )
+            if stale_instruments:
+                snap["stale_instruments"] = stale_instruments
+        else:
+            for name, instrument in instruments.items():
+                with _snapshot_time_budget(self.snapshot_timeout):
+                    snap["instruments"][name] = instrument.snapshot(update=update)
+
         for c in components_to_remove:
             self.remove_component(c)
 
         return snap
 
+    def _snapshot_in_parallel(
+        self, instruments: dict[str, Instrument], update: bool | None
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Snapshot the given instruments in a thread per instrument. Returns
+        the snapshots and the names of the instruments whose snapshot did
+        not complete within the ``snapshot_timeout``.
+
+        After the ``snapshot_timeout`` the threads do not send any new
+        queries, but the queries in progress are waited for, such that no
+        thread communicates with an instrument after the snapshot returns.
+        The threads are daemon threads, such that an instrument that does
+        not respond does not keep the interpreter from exiting if the
+        snapshot is interrupted.
+        """
+        timeout = self.snapshot_timeout
+        snapshots: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+
+        def snapshot(name: str, instrument: Instrument) -> None:
+            try:
+                with _snapshot_time_budget(timeout):
+                    snapshots[name] = instrument.snapshot(update=update)
+            except Exception as e:
+                errors[name] = e
+
+        threads = {
+            name: threading.Thread(
+                target=snapshot,
+                args=(name, instrument),
+                name=f"Station snapshot {name}",
+                daemon=True,
+            )
+            for name, instrument in instruments.items()
+        }
+        for thread in threads.values():
+            thread.start()
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        stale_instruments = []
+        for name, thread in threads.items():
+            thread.join(
+                None if deadline is None else max(deadline - time.perf_counter(), 0)
+            )
+            if thread.is_alive():
+                log.warning(
+                    "Snapshot of %s did not complete within %s s, using cached "
+                    "values for the parameters that are not updated yet",
+                    name,
+                    timeout,
+                )
+                stale_instruments.append(name)
+        for thread in threads.values():
+            thread.join()
+
+        for name in threads:
+            if name in errors:
+                raise errors[name]
+        return {name: snapshots[name] for name in threads}, stale_instruments
+
     def add_component(
         self,
         component: MetadatableWithName,
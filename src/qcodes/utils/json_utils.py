@@ -1,10 +1,17 @@
+from __future__ import annotations
+
 import collections
 import json
 import numbers
-from typing import Any
+import operator
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class NumpyJSONEncoder(json.JSONEncoder):
     """
@@ -88,3 +95,101 @@ class NumpyJSONEncoder(json.JSONEncoder):
                     # we cannot convert the object to JSON, just take a string
                     s = str(o)
             return s
+
+
+class _SnapshotMemo:
+    """
+    The snapshot of an object as it was last created, together with its
+    JSON encoding once it has been encoded by :func:`dumps_snapshot`.
+    """
+
+    __slots__ = ("json", "state")
+
+    def __init__(self, state: dict[str, Any]):
+        self.state = state
+        self.json: str | None = None
+
+
+class _MemoizedSnapshot(dict[str, Any]):
+    """
+    A copy of a memoized snapshot. The copy refers back to the memo so that
+    the JSON encoding of the snapshot can be reused as long as the copy is
+    not modified.
+    """
+
+    __slots__ = ("_memo",)
+
+    def __init__(self, memo: _SnapshotMemo):
+        super().__init__(memo.state)
+        self._memo = memo
+
+
+def _is_immutable(value: Any) -> bool:
+    if value is None or isinstance(value, (str, numbers.Number)):
+        return True
+    if type(value) is tuple:
+        return all(map(_is_immutable, value))
+    if type(value) is list:
+        # such as the reprs of the validators which are created for the
+        # snapshot itself
+        return all(
+            item is None or isinstance(item, (str, numbers.Number)) for item in value
+        )
+    return False
+
+
+def _is_unmodified(snapshot: _MemoizedSnapshot) -> bool:
+    state = snapshot._memo.state
+    return snapshot.keys() == state.keys() and all(
+        map(operator.is_, snapshot.values(), state.values())
+    )
+
+
+_encoder = NumpyJSONEncoder()
+
+
+def _dumps_memoized(snapshot: _MemoizedSnapshot) -> str:
+    memo = snapshot._memo
+    unmodified = _is_unmodified(snapshot)
+    if unmodified and memo.json is not None:
+        return memo.json
+    encoded = _encoder.encode(snapshot)
+    # a value that can be modified in place may differ from its encoding by
+    # the next time the snapshot is reused
+    if unmodified and all(map(_is_immutable, snapshot.values())):
+        memo.json = encoded
+    return encoded
+
+
+def _dumps(obj: Any) -> str:
+    if type(obj) is _MemoizedSnapshot:
+        return _dumps_memoized(obj)
+    if (
+        type(obj) is dict
+        and any(type(value) in (dict, _MemoizedSnapshot) for value in obj.values())
+        and all(type(key) is str for key in obj)
+    ):
+        items = ", ".join(
+            f"{encode_basestring_ascii(key)}: {_dumps(value)}"
+            for key, value in obj.items()
+        )
+        return f"{{{items}}}"
+    return _encoder.encode(obj)
+
+
+def dumps_snapshot(snapshot: Mapping[Any, Any]) -> str:
+    """
+    Encode a snapshot as JSON with the :class:`NumpyJSONEncoder`. This is
+    equivalent to ``json.dumps(snapshot, cls=NumpyJSONEncoder)`` but reuses
+    the encoding of the snapshots of parameters that have not changed since
+    they were last encoded, which makes encoding repeated snapshots of a
+    station cheap.
+
+    Args:
+        snapshot: The snapshot to encode.
+
+    Returns:
+        The JSON encoded snapshot.
+
+    """
+    return _dumps(snapshot)
@@ -9,6 +9,7 @@ import math
 import typing
 from collections import abc
 from collections.abc import Hashable
+from functools import lru_cache
 from typing import Any, Generic, Literal, TypeVar, cast
 
 import numpy as np
@@ -63,6 +64,79 @@ def range_str(
 
 T = TypeVar("T")
 
+# Arrays are reduced in chunks of this many bytes, such that the maximum and
+# the minimum of a chunk are computed while the chunk is in the CPU cache
+_REDUCE_CHUNK_BYTES = 1 << 19
+# Sequences of numbers shorter than this are validated element by element,
+# since converting them to an array costs more than it saves
+_MIN_BULK_LENGTH = 64
+
+
+@lru_cache(maxsize=256)
+def _is_subdtype_of_any(dtype: np.dtype, valid_types: tuple[type, ...]) -> bool:
+    return any(np.issubdtype(dtype.type, valid_type) for valid_type in valid_types)
+
+
+def _out_of_bounds(
+    value: np.ndarray,
+    min_value: numbertypes | None,
+    max_value: numbertypes | None,
+) -> bool:
+    """
+    Whether any element of the array is smaller than ``min_value``, larger
+    than ``max_value`` or NaN. A bound of None is not checked.
+
+    The array is reduced in chunks, so that its maximum and minimum are found
+    in about one pass over the memory of the array, and it stops at the
+    first chunk out of bounds.
+    """
+    chunks: abc.Iterable[np.ndarray] = (value,)
+    step = max(_REDUCE_CHUNK_BYTES // value.itemsize, 1)
+    if value.size > step and (value.flags.c_contiguous or value.flags.f_contiguous):
+        flat = value.ravel(order="K")
+        chunks = (flat[start : start + step] for start in range(0, flat.size, step))
+    for chunk in chunks:
+        if max_value is not None and not (chunk.max() <= max_value):
+            return True
+        if min_value is not None and not (min_value <= chunk.min()):
+            return True
+    return False
+
+
+def _in_bounds_in_bulk(
+    values: abc.Sequence[Any],
+    validtypes: tuple[type, ...],
+    min_value: numbertypes,
+    max_value: numbertypes,
+) -> bool:
+    """
+    Whether all values are instances of ``validtypes`` between ``min_value``
+    and ``max_value``, checked with NumPy. False if the values cannot be
+    checked like this, including if they are not all valid.
+
+    Only values that are either all integers or all double precision floats
+    are checked, as NumPy converts a mix of both to floats, which may not
+    represent the integers exactly.
+    """
+    if len(values) < _MIN_BULK_LENGTH:
+        return False
+    value_types = set(map(type, values))
+    if not all(issubclass(value_type, validtypes) for value_type in value_types):
+        return False
+    if all(issubclass(value_type, (int, np.integer)) for value_type in value_types):
+        kinds = "biu"
+    elif all(issubclass(value_type, float) for value_type in value_types):
+        kinds = "f"
+    else:
+        return False
+    array = np.asarray(values)
+    # e.g. integers that do not fit into a numpy integer type
+    if array.dtype.kind not in kinds:
+        return False
+    # the extrema are compared as Python numbers, such that integers and
+    # floats are compared exactly as when validating element by element
+    return bool(min_value <= array.min().item() and array.max().item() <= max_value)
+
 
 class Validator(Generic[T]):
     """
@@ -105,6 +179,14 @@ class Validator(Generic[T]):
     def validate(self, value: T, context: str = "") -> None:
         raise NotImplementedError
 
+    def _validate_elements(self, values: abc.Sequence[T]) -> None:
+        """
+        Validate each of the values, as is done for the elements of
+        :class:`Lists` and :class:`Sequence`.
+        """
+        for value in values:
+            self.validate(value)
+
     @property
     def valid_values(self) -> tuple[T, ...]:
         return self._valid_values
@@ -301,6 +383,13 @@ class Numbers(Validator[numbertypes]):
                 f"{self._min_value} and {self._max_value} inclusive; {context}"
             )
 
+    def _validate_elements(self, values: abc.Sequence[numbertypes]) -> None:
+        # validate one by one to raise the error of the first invalid value
+        if type(self).validate is not Numbers.validate or not _in_bounds_in_bulk(
+            values, self.validtypes, self._min_value, self._max_value
+        ):
+            super()._validate_elements(values)
+
     is_numeric = True
 
     def __repr__(self) -> str:
@@ -375,6 +464,13 @@ class Ints(Validator[int | np.integer[Any] | bool]):
                 f"{self._min_value} and {self._max_value} inclusive; {context}"
             )
 
+    def _validate_elements(self, values: abc.Sequence[inttypes]) -> None:
+        # validate one by one to raise the error of the first invalid value
+        if type(self).validate is not Ints.validate or not _in_bounds_in_bulk(
+            values, self.validtypes, self._min_value, self._max_value
+        ):
+            super()._validate_elements(values)
+
     is_numeric = True
 
     def __repr__(self) -> str:
@@ -951,10 +1047,7 @@ class Arrays(Validator[np.ndarray]):
         if not isinstance(value, np.ndarray):
             raise TypeError(f"{value!r} is not a numpy array; {context}")
 
-        if not any(
-            np.issubdtype(value.dtype.type, valid_type)
-            for valid_type in self.valid_types
-        ):
+        if not _is_subdtype_of_any(value.dtype, tuple(self.valid_types)):
             raise TypeError(
                 f"type of {value} is not any of {self.valid_types}"
                 f" it is {value.dtype}; {context}"
@@ -967,21 +1060,20 @@ class Arrays(Validator[np.ndarray]):
                     f" it has shape {np.shape(value)}; {context}"
                 )
 
-        # Only check if max is not inf as it can be expensive for large arrays
-        if self._max_value != (float("inf")) and self._max_value is not None:
-            if not (np.max(value) <= self._max_value):
-                raise ValueError(
-                    f"{value!r} is invalid: all values must be between "
-                    f"{self._min_value} and {self._max_value} inclusive; {context}"
-                )
-
-        # Only check if min is not -inf as it can be expensive for large arrays
-        if self._min_value != (-float("inf")) and self._min_value is not None:
-            if not (self._min_value <= np.min(value)):
-                raise ValueError(
-                    f"{value!r} is invalid: all values must be between "
-                    f"{self._min_value} and {self._max_value} inclusive; {context}"
-                )
+        # Infinite limits are not checked as it can be expensive for large arrays
+        min_value = self._min_value
+        if min_value == -float("inf"):
+            min_value = None
+        max_value = self._max_value
+        if max_value == float("inf"):
+            max_value = None
+        if (min_value is not None or max_value is not None) and _out_of_bounds(
+            value, min_value, max_value
+        ):
+            raise ValueError(
+                f"{value!r} is invalid: all values must be between "
+                f"{self._min_value} and {self._max_value} inclusive; {context}"
+            )
 
     is_numeric = True
 
@@ -1043,8 +1135,7 @@ class Lists(Validator[list[T]]):
             raise TypeError(f"{value!r} is not a list; {context}")
         # Does not validate elements if not required to improve performance
         if not isinstance(self._elt_validator, Anything):
-            for elt in value:
-                self._elt_validator.validate(elt)
+            self._elt_validator._validate_elements(value)
 
     @property
     def elt_validator(self) -> Validator[Any]:
@@ -1104,8 +1195,7 @@ class Sequence(Validator[typing.Sequence[Any]]):
             raise ValueError(f"{value!r} is required to be sorted.")
         # Does not validate elements if not required to improve performance
         if not isinstance(self._elt_validator, Anything):
-            for elt in value:
-                self._elt_validator.validate(elt)
+            self._elt_validator._validate_elements(value)
 
     @property
     def elt_validator(self) -> Validator[Any]:
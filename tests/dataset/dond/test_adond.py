@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from qcodes.dataset import (
+    AdaptiveSweep,
+    BufferedSweep,
+    DataSetProtocol,
+    LinSweep,
+    RetraceSweep,
+    adond,
+    dond,
+)
+from qcodes.instrument import Instrument
+from qcodes.instrument_drivers.mock_instruments import MockBufferedSource
+from qcodes.parameters import Parameter, ParamRawDataType
+
+
+class SlowAsyncParameter(Parameter):
+    def __init__(self, *args, delay: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._delay = delay
+
+    def get_raw(self) -> ParamRawDataType:
+        raise RuntimeError("the blocking get should not be used")
+
+    async def async_get_raw(self) -> ParamRawDataType:
+        await asyncio.sleep(self._delay)
+        return 1.0
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["row_major", "snake"])
+async def test_adond_matches_dond(
+    _param_set, _param_set_2, _param, _param_2, order
+) -> None:
+    sweeps = (LinSweep(_param_set, 0, 1, 5), LinSweep(_param_set_2, -1, 1, 3))
+
+    ds_sync, _, _ = dond(*sweeps, _param, _param_2, do_plot=False)
+    ds_async, _, _ = await adond(*sweeps, _param, _param_2, do_plot=False, order=order)
+    assert isinstance(ds_sync, DataSetProtocol)
+    assert isinstance(ds_async, DataSetProtocol)
+
+    assert ds_async.description.shapes == ds_sync.description.shapes
+    sync_data = ds_sync.get_parameter_data()
+    async_data = ds_async.get_parameter_data()
+    assert async_data.keys() == sync_data.keys()
+    for name, tree in sync_data.items():
+        for param, values in tree.items():
+            np.testing.assert_array_equal(async_data[name][param], values)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.asyncio
+async def test_adond_awaits_instruments_concurrently(_param_set) -> None:
+    instruments = [Instrument(f"async_instrument_{i}") for i in range(4)]
+    try:
+        params = [
+            SlowAsyncParameter("signal", instrument=instrument, delay=0.05)
+            for instrument in instruments
+        ]
+        n_points = 4
+        t0 = time.perf_counter()
+        ds, _, _ = await adond(
+            LinSweep(_param_set, 0, 1, n_points), *params, do_plot=False
+        )
+        duration = time.perf_counter() - t0
+    finally:
+        for instrument in instruments:
+            instrument.close()
+
+    assert isinstance(ds, DataSetProtocol)
+    # sequentially this would take at least 4 * 4 * 0.05 s
+    assert duration < n_points * len(params) * 0.05
+    assert ds.number_of_results == n_points * len(params)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.asyncio
+async def test_adond_callable_and_break_condition(_param_set, _param) -> None:
+    calls = []
+    ds, _, _ = await adond(
+        LinSweep(_param_set, 0, 1, 10),
+        lambda: calls.append(1),
+        _param,
+        break_condition=lambda: len(calls) >= 3,
+        do_plot=False,
+    )
+    assert isinstance(ds, DataSetProtocol)
+    assert len(calls) == 3
+    assert ds.number_of_results == 3
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.asyncio
+async def test_adond_does_not_support_buffered_sweep() -> None:
+    source = MockBufferedSource("async_buffered_source")
+    try:
+        with pytest.raises(ValueError, match="BufferedSweep"):
+            await adond(
+                BufferedSweep(source.voltage, [0, 1], source),
+                source.current,
+                do_plot=False,
+            )
+    finally:
+        source.close()
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.asyncio
+async def test_adond_does_not_support_adaptive_sweep(_param_set, _param) -> None:
+    with pytest.raises(ValueError, match="AdaptiveSweep"):
+        await adond(AdaptiveSweep(_param_set, 0, 1, 5), _param, do_plot=False)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.asyncio
+async def test_adond_retrace_sweep(_param_set, _param_set_2, _param) -> None:
+    sweeps = (
+        LinSweep(_param_set, 0, 1, 2),
+        RetraceSweep(LinSweep(_param_set_2, -1, 1, 3)),
+    )
+    sync_datasets, _, _ = dond(*sweeps, _param, do_plot=False)
+    async_datasets, _, _ = await adond(*sweeps, _param, do_plot=False)
+    assert isinstance(sync_datasets, tuple)
+    assert isinstance(async_datasets, tuple)
+    assert len(async_datasets) == 2
+
+    for ds_sync, ds_async in zip(sync_datasets, async_datasets):
+        assert ds_async.name == ds_sync.name
+        sync_data = ds_sync.get_parameter_data()
+        async_data = ds_async.get_parameter_data()
+        for name, tree in sync_data.items():
+            for param, values in tree.items():
+                np.testing.assert_array_equal(async_data[name][param], values)
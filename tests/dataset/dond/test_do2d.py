@@ -456,3 +456,28 @@ def test_do2d_explicit_name(_param_set, _param_set_2, _param) -> None:
         measurement_name="my measurement",
     )
     assert data1[0].name == "my measurement"
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.parametrize("set_before_sweep", [True, False])
+def test_do2d_snake_order(_param_set, _param_set_2, set_before_sweep) -> None:
+    inner_values: list[float] = []
+    inner = Parameter("inner", set_cmd=inner_values.append, get_cmd=None)
+    signal = Parameter(
+        "signal", get_cmd=lambda: 10 * _param_set.cache() + inner.cache()
+    )
+    sweep = (_param_set, 0, 2, 3, 0, inner, 0, 3, 4, 0)
+
+    reference, _, _ = do2d(*sweep, signal, set_before_sweep=set_before_sweep)
+    inner_values.clear()
+    ds, _, _ = do2d(*sweep, signal, set_before_sweep=set_before_sweep, order="snake")
+
+    assert inner_values == [0, 1, 2, 3, 3, 2, 1, 0, 0, 1, 2, 3]
+    assert ds.description.shapes == reference.description.shapes
+    reference_data = reference.get_parameter_data()
+    for data in (ds.get_parameter_data(), ds.cache.data()):
+        for param, values in reference_data["signal"].items():
+            np.testing.assert_array_equal(data["signal"][param], values)
+
+    with pytest.raises(ValueError, match="Invalid sweep order"):
+        do2d(*sweep, signal, order="min_cost")  # type: ignore[arg-type]
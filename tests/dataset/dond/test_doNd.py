@@ -19,18 +19,23 @@ from typing_extensions import assert_type
 import qcodes as qc
 from qcodes import config, validators
 from qcodes.dataset import (
+    AdaptiveSweep,
     ArraySweep,
+    BufferedSweep,
     DataSetProtocol,
     LinSweep,
     LogSweep,
+    RetraceSweep,
     TogetherSweep,
     dond,
     new_experiment,
 )
 from qcodes.dataset.data_set import DataSet
 from qcodes.dataset.dond.do_nd import _Sweeper
+from qcodes.dataset.dond.sweeps import curvature_loss, distance_loss, gradient_loss
 from qcodes.instrument_drivers.mock_instruments import (
     ArraySetPointParam,
+    MockBufferedSource,
     Multi2DSetPointParam,
     Multi2DSetPointParam2Sizes,
     MultiSetPointParam,
@@ -1110,6 +1115,61 @@ def test_dond_together_sweep_sweeper(_param_set, _param_set_2, _param) -> None:
         assert output[1].delay == delay_2
 
 
+def test_sweeper_is_lazy() -> None:
+    params = [ManualParameter(name) for name in "abcd"]
+    sweeps = [LinSweep(param, 0, 1, 100) for param in params]
+
+    sweeper = _Sweeper(sweeps, [])
+
+    assert len(sweeper) == 100**4
+    assert sweeper.shape == (100, 100, 100, 100)
+
+    index = 1 * 100**3 + 2 * 100**2 + 3 * 100 + 4
+    events = sweeper[index]
+    setpoints = sweeps[0].get_setpoints()
+    assert [event.new_value for event in events] == [
+        setpoints[1],
+        setpoints[2],
+        setpoints[3],
+        setpoints[4],
+    ]
+    assert [event.should_set for event in events] == [False, False, False, True]
+
+    events = sweeper[-1]
+    assert all(event.new_value == 1 for event in events)
+    assert [event.should_set for event in sweeper[100**2]] == [
+        False,
+        True,
+        True,
+        True,
+    ]
+
+    with pytest.raises(IndexError):
+        sweeper[len(sweeper)]
+
+
+def test_sweeper_should_set_compares_values() -> None:
+    a = ManualParameter("a")
+    b = ManualParameter("b")
+    sweeper = _Sweeper([ArraySweep(a, [0, 1]), ArraySweep(b, [5, 5, 6, 5])], [])
+
+    should_set = [[event.should_set for event in events] for events in sweeper]
+    assert should_set == [
+        [True, True],
+        [False, False],
+        [False, True],
+        [False, True],
+        [True, False],
+        [False, False],
+        [False, True],
+        [False, True],
+    ]
+    assert sweeper.setpoints_dict == {
+        "a": [0, 0, 0, 0, 1, 1, 1, 1],
+        "b": [5, 5, 6, 5] * 2,
+    }
+
+
 @pytest.mark.usefixtures("plot_close", "experiment")
 def test_dond_together_sweep_sweeper_combined() -> None:
     a = ManualParameter("a", initial_value=0)
@@ -1852,3 +1912,487 @@ def test_dond_return_type(_param_set, _param) -> None:
     assert len(cbs) == 1
     assert len(cbs[0]) == 1
     assert cbs[0][0] is None
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipelined_matches_sequential(_param_set, _param_set_2) -> None:
+    counter = iter(range(10_000))
+    meas_1 = Parameter("meas_1", get_cmd=lambda: next(counter), set_cmd=False)
+    meas_2 = Parameter("meas_2", get_cmd=lambda: 2 * _param_set(), set_cmd=False)
+    sweeps = (
+        LinSweep(_param_set, 0, 1, 7),
+        LinSweep(_param_set_2, 0, 1, 11),
+    )
+
+    sequential, _, _ = dond(*sweeps, [meas_1], [meas_2], do_plot=False)
+    counter = iter(range(10_000))
+    pipelined, _, _ = dond(*sweeps, [meas_1], [meas_2], do_plot=False, pipelined=True)
+
+    for ds_seq, ds_pipe in zip(sequential, pipelined):
+        assert ds_pipe.completed
+        data_seq = ds_seq.get_parameter_data()
+        data_pipe = ds_pipe.get_parameter_data()
+        assert data_seq.keys() == data_pipe.keys()
+        for name, tree in data_seq.items():
+            for param, values in tree.items():
+                np.testing.assert_array_equal(data_pipe[name][param], values)
+    # results are stored in the order they were measured
+    np.testing.assert_array_equal(
+        pipelined[0].get_parameter_data()["meas_1"]["meas_1"],
+        np.arange(77).reshape(7, 11),
+    )
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipelined_break_condition(_param_set, _param) -> None:
+    calls = iter(range(10_000))
+
+    def break_condition() -> bool:
+        return next(calls) >= 4
+
+    ds, _, _ = dond(
+        LinSweep(_param_set, 0, 1, 20),
+        _param,
+        do_plot=False,
+        pipelined=True,
+        break_condition=break_condition,
+    )
+    assert isinstance(ds, DataSetProtocol)
+    assert len(ds.get_parameter_data()["simple_parameter"]["simple_parameter"]) == 5
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipelined_raises_storage_errors(_param_set, _param, mocker) -> None:
+    mocker.patch(
+        "qcodes.dataset.measurements.DataSaver._add_validated_results",
+        side_effect=RuntimeError("storage failed"),
+    )
+    with pytest.raises(RuntimeError, match="storage failed"):
+        dond(LinSweep(_param_set, 0, 1, 200), _param, do_plot=False, pipelined=True)
+
+
+@pytest.fixture(name="buffered_source")
+def _make_buffered_source():
+    instr = MockBufferedSource("buffered_source")
+    try:
+        yield instr
+    finally:
+        instr.close()
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_buffered_sweep(_param_set, buffered_source) -> None:
+    voltages = np.linspace(-1, 1, 11)
+    outer = [1.0, 2.0, 3.0]
+    ds, _, _ = dond(
+        ArraySweep(_param_set, outer),
+        BufferedSweep(buffered_source.voltage, voltages, buffered_source),
+        buffered_source.current,
+        do_plot=False,
+    )
+
+    assert buffered_source.buffered_sweep_count == len(outer)
+    assert buffered_source.voltage() == voltages[-1]
+    assert ds.description.shapes == {"buffered_source_current": (3, 11)}
+    data = ds.get_parameter_data()["buffered_source_current"]
+    np.testing.assert_allclose(
+        data["buffered_source_voltage"], np.tile(voltages, (3, 1))
+    )
+    np.testing.assert_array_equal(
+        data[_param_set.name], np.repeat(outer, 11).reshape(3, 11)
+    )
+    np.testing.assert_allclose(
+        data["buffered_source_current"], np.tile(voltages / 1e3, (3, 1))
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_buffered_sweep_snake_order(
+    _param_set, _param_set_2, buffered_source
+) -> None:
+    voltages = [0.0, 1.0]
+    ds_2d, _, _ = dond(
+        ArraySweep(_param_set, [1.0, 2.0]),
+        BufferedSweep(buffered_source.voltage, voltages, buffered_source),
+        buffered_source.current,
+        do_plot=False,
+        order="snake",
+    )
+    assert isinstance(ds_2d, DataSetProtocol)
+    assert ds_2d.description.shapes == {"buffered_source_current": (2, 2)}
+
+    # snaking the outer sweeps would hold back whole buffered sweeps
+    ds_3d, _, _ = dond(
+        ArraySweep(_param_set, [1.0, 2.0]),
+        ArraySweep(_param_set_2, [1.0, 2.0, 3.0]),
+        BufferedSweep(buffered_source.voltage, voltages, buffered_source),
+        buffered_source.current,
+        do_plot=False,
+        order="snake",
+    )
+    assert isinstance(ds_3d, DataSetProtocol)
+    assert ds_3d.description.shapes is None
+    data = ds_3d.get_parameter_data()["buffered_source_current"]
+    np.testing.assert_array_equal(
+        data[_param_set_2.name], np.repeat([1, 2, 3, 3, 2, 1], 2)
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_buffered_sweep_1d(buffered_source) -> None:
+    ds, _, _ = dond(
+        BufferedSweep(buffered_source.voltage, [0, 1, 2], buffered_source),
+        buffered_source.current,
+        do_plot=False,
+    )
+    assert buffered_source.buffered_sweep_count == 1
+    np.testing.assert_allclose(
+        ds.get_parameter_data()["buffered_source_current"]["buffered_source_current"],
+        [0, 1e-3, 2e-3],
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_buffered_sweep_must_be_innermost(_param_set, buffered_source) -> None:
+    with pytest.raises(ValueError, match="last \\(innermost\\) sweep"):
+        dond(
+            BufferedSweep(buffered_source.voltage, [0, 1], buffered_source),
+            LinSweep(_param_set, 0, 1, 2),
+            buffered_source.current,
+            do_plot=False,
+        )
+    with pytest.raises(ValueError, match="TogetherSweep"):
+        dond(
+            TogetherSweep(
+                BufferedSweep(buffered_source.voltage, [0, 1], buffered_source),
+                LinSweep(_param_set, 0, 1, 2),
+            ),
+            buffered_source.current,
+            do_plot=False,
+        )
+    assert buffered_source.buffered_sweep_count == 0
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_buffered_sweep_unsupported_param(_param, buffered_source) -> None:
+    with pytest.raises(ValueError, match="can only acquire"):
+        dond(
+            BufferedSweep(buffered_source.voltage, [0, 1], buffered_source),
+            _param,
+            do_plot=False,
+        )
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_use_threads(_param_set, _param, _param_complex) -> None:
+    ds_threaded, _, _ = dond(
+        LinSweep(_param_set, 0, 1, 10),
+        _param,
+        _param_complex,
+        use_threads=True,
+        do_plot=False,
+    )
+    ds_sequential, _, _ = dond(
+        LinSweep(_param_set, 0, 1, 10),
+        _param,
+        _param_complex,
+        use_threads=False,
+        do_plot=False,
+    )
+    threaded_data = ds_threaded.get_parameter_data()
+    sequential_data = ds_sequential.get_parameter_data()
+    assert threaded_data.keys() == sequential_data.keys()
+    for name, tree in sequential_data.items():
+        for param, values in tree.items():
+            np.testing.assert_array_equal(threaded_data[name][param], values)
+
+
+@pytest.fixture(name="lorentzian")
+def _make_lorentzian():
+    x = Parameter("x", set_cmd=None, get_cmd=None, initial_value=0)
+    y = Parameter("y", get_cmd=lambda: 1 / (1 + (x.cache.get() / 0.2) ** 2))
+    return x, y
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.parametrize("loss", (distance_loss, gradient_loss, curvature_loss))
+def test_dond_adaptive_sweep_samples_peak(lorentzian, loss) -> None:
+    x, y = lorentzian
+    ds, _, _ = dond(AdaptiveSweep(x, -10, 10, 40, loss=loss), y, do_plot=False)
+    assert isinstance(ds, DataSet)
+
+    setpoints = ds.get_parameter_data()["y"]["x"].ravel()
+    assert len(setpoints) == 40
+    assert len(np.unique(setpoints)) == 40
+    # an evenly spaced sweep would only put 4 points in this region
+    assert np.sum(np.abs(setpoints) < 2) >= 20
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_adaptive_sweep_with_outer_sweep(_param_set, lorentzian) -> None:
+    x, y = lorentzian
+    ds, _, _ = dond(
+        LinSweep(_param_set, 0, 1, 3),
+        AdaptiveSweep(x, -10, 10, 15, target=y),
+        y,
+        do_plot=False,
+    )
+    assert isinstance(ds, DataSet)
+    assert ds.description.shapes == {"y": (3, 15)}
+    data = ds.get_parameter_data()["y"]
+    np.testing.assert_array_equal(
+        data[_param_set.name], np.repeat([0, 0.5, 1], 15).reshape(3, 15)
+    )
+    # the adaptive sweep starts from scratch for every outer setpoint
+    for row in data["x"]:
+        np.testing.assert_array_equal(row, data["x"][0])
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_adaptive_sweep_loss_goal(lorentzian) -> None:
+    x, y = lorentzian
+    ds, _, _ = dond(AdaptiveSweep(x, -10, 10, 200, loss_goal=0.05), y, do_plot=False)
+    assert isinstance(ds, DataSet)
+    assert 3 < ds.number_of_results < 200
+    assert ds.description.shapes == {"y": (200,)}
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_adaptive_sweep_validation(_param_set, _param, lorentzian) -> None:
+    x, y = lorentzian
+    with pytest.raises(ValueError, match="last \\(innermost\\) sweep"):
+        dond(AdaptiveSweep(x, 0, 1, 5), LinSweep(_param_set, 0, 1, 2), y)
+    with pytest.raises(ValueError, match="not measured"):
+        dond(AdaptiveSweep(x, 0, 1, 5, target=y), _param)
+    with pytest.raises(ValueError, match="at least 2"):
+        AdaptiveSweep(x, 0, 1, 5, initial_points=1)
+
+
+def test_adaptive_losses() -> None:
+    x = np.array([0, 0.25, 0.5, 0.75, 1])
+    y = np.array([0, 0, 1, 0, 0.0])
+    for loss in (distance_loss, gradient_loss, curvature_loss):
+        losses = loss(x, y)
+        assert losses.shape == (4,)
+        assert losses[1] > losses[0]
+        assert losses[2] > losses[3]
+
+
+@pytest.fixture(name="grid_params")
+def _make_grid_params():
+    set_order: list[tuple[str, float]] = []
+
+    def make_setter(name):
+        def set_cmd(value):
+            set_order.append((name, value))
+
+        return set_cmd
+
+    a = Parameter("a", set_cmd=make_setter("a"), get_cmd=None, initial_value=0)
+    b = Parameter("b", set_cmd=make_setter("b"), get_cmd=None, initial_value=0)
+    c = Parameter("c", set_cmd=make_setter("c"), get_cmd=None, initial_value=0)
+    signal = Parameter(
+        "signal", get_cmd=lambda: 100 * a.cache() + 10 * b.cache() + c.cache()
+    )
+    set_order.clear()
+    return a, b, c, signal, set_order
+
+
+def _assert_same_data(ds: DataSetProtocol, reference: DataSetProtocol) -> None:
+    assert ds.description.shapes == reference.description.shapes
+    data = ds.get_parameter_data()
+    reference_data = reference.get_parameter_data()
+    cache_data = ds.cache.data()
+    for name, tree in reference_data.items():
+        for param, values in tree.items():
+            np.testing.assert_array_equal(data[name][param], values)
+            np.testing.assert_array_equal(cache_data[name][param], values)
+    assert ds.to_xarray_dataset().equals(reference.to_xarray_dataset())
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_dond_snake_order(grid_params, pipelined) -> None:
+    a, b, c, signal, set_order = grid_params
+    sweeps = (LinSweep(a, 0, 1, 2), LinSweep(b, 0, 2, 3), LinSweep(c, 0, 3, 4))
+
+    reference, _, _ = dond(*sweeps, signal, do_plot=False)
+    set_order.clear()
+    ds, _, _ = dond(*sweeps, signal, do_plot=False, order="snake", pipelined=pipelined)
+    assert isinstance(ds, DataSetProtocol)
+    assert isinstance(reference, DataSetProtocol)
+
+    _assert_same_data(ds, reference)
+    # the inner parameters are never set back to their start
+    forward, backward = [1, 2, 3], [2, 1, 0]
+    assert [value for name, value in set_order if name == "c"] == [
+        0,
+        *(forward + backward) * 3,
+    ]
+    # only the fastest parameter is snaked
+    assert [value for name, value in set_order if name == "b"] == [0, 1, 2, 0, 1, 2]
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_min_cost_order(grid_params, caplog: LogCaptureFixture) -> None:
+    a, b, _, signal, set_order = grid_params
+    b.step = 1
+    b.inter_delay = 0.001
+    sweeps = (LinSweep(a, 0, 3, 4), LinSweep(b, 0, 2, 3))
+
+    b(0)
+    set_order.clear()
+    with caplog.at_level(logging.INFO):
+        ds, _, _ = dond(*sweeps, signal, do_plot=False, order="min_cost")
+    assert isinstance(ds, DataSetProtocol)
+
+    # the ramped parameter is swept slowest
+    assert [value for name, value in set_order if name == "b"] == [0, 1, 2]
+    # the sweeps are reordered so the results are stored as measured
+    assert ds.description.shapes is None
+    data = ds.get_parameter_data()["signal"]
+    np.testing.assert_array_equal(data["b"], np.repeat([0, 1, 2], 4))
+    np.testing.assert_array_equal(data["a"], np.tile([0, 1, 2, 3], 3))
+    np.testing.assert_array_equal(data["signal"], 100 * data["a"] + 10 * data["b"])
+    assert "Sweeping b, a (slowest to fastest) in row major order" in caplog.text
+    assert "saving 0.012 s compared to sweeping a, b in row major order" in caplog.text
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_snake_order_break_condition(grid_params) -> None:
+    a, b, _, signal, _ = grid_params
+    ds, _, _ = dond(
+        LinSweep(a, 0, 1, 2),
+        LinSweep(b, 0, 3, 4),
+        signal,
+        do_plot=False,
+        order="snake",
+        break_condition=lambda: a.cache() == 1 and b.cache() == 2,
+    )
+    assert isinstance(ds, DataSetProtocol)
+    # the points of the backward line measured before the interruption
+    # are stored in the order of the setpoints
+    np.testing.assert_array_equal(
+        ds.get_parameter_data()["signal"]["signal"].ravel()[:6],
+        [0, 10, 20, 30, 120, 130],
+    )
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_many_groups_share_results(_param_set, _param_set_2, mocker) -> None:
+    n_groups = 12
+    signals = [
+        Parameter(f"signal_{i}", get_cmd=lambda i=i: i * _param_set.cache())
+        for i in range(n_groups)
+    ]
+    additional = ManualParameter("additional", initial_value=2)
+    add_result = mocker.spy(qc.dataset.measurements.DataSaver, "add_result")
+    datasets, _, _ = dond(
+        LinSweep(_param_set, 0, 1, 5),
+        LinSweep(_param_set_2, 0, 1, 3),
+        *([signal] for signal in signals),
+        additional_setpoints=(additional,),
+        do_plot=False,
+    )
+    assert isinstance(datasets, tuple)
+    # the results of plain parameters are added without add_result
+    add_result.assert_not_called()
+
+    assert len(datasets) == n_groups
+    for i, (ds, signal) in enumerate(zip(datasets, signals)):
+        assert ds.description.shapes == {signal.full_name: (5, 3, 1)}
+        data = ds.get_parameter_data()[signal.full_name]
+        np.testing.assert_array_equal(
+            data[signal.full_name], i * data[_param_set.full_name]
+        )
+        np.testing.assert_array_equal(data["additional"], 2)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_groups_validate_shared_results(_param_set, _param) -> None:
+    text = Parameter("text", get_cmd=lambda: "not a number")
+    with pytest.raises(ValueError, match='is of type "numeric"'):
+        dond(LinSweep(_param_set, 0, 1, 3), [_param], [text], do_plot=False)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_dond_retrace_sweep_into_datasets(grid_params, pipelined) -> None:
+    a, b, _, signal, set_order = grid_params
+    datasets, _, _ = dond(
+        LinSweep(a, 0, 1, 2),
+        RetraceSweep(LinSweep(b, 0, 2, 3)),
+        signal,
+        measurement_name="hysteresis",
+        do_plot=False,
+        pipelined=pipelined,
+    )
+    assert isinstance(datasets, tuple)
+    forward, backward = datasets
+    assert forward.name == "hysteresis"
+    assert backward.name == "retrace hysteresis"
+    assert forward.description.shapes == {"signal": (2, 3)}
+    assert backward.description.shapes == {"signal": (2, 3)}
+
+    forward_data = forward.get_parameter_data()["signal"]
+    backward_data = backward.get_parameter_data()["signal"]
+    np.testing.assert_array_equal(forward_data["b"].ravel(), [0, 1, 2] * 2)
+    np.testing.assert_array_equal(backward_data["b"].ravel(), [2, 1, 0] * 2)
+    np.testing.assert_array_equal(
+        backward_data["signal"].ravel(), [20, 10, 0, 120, 110, 100]
+    )
+    # the backward trace replaces the ramp back to the start
+    assert [value for name, value in set_order if name == "b"] == [
+        0,
+        *[1, 2, 1, 0] * 2,
+    ]
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_retrace_sweeps_into_dimension(grid_params) -> None:
+    a, b, _, signal, set_order = grid_params
+    ds, _, _ = dond(
+        RetraceSweep(LinSweep(a, 0, 1, 2), store="dimension"),
+        RetraceSweep(LinSweep(b, 0, 2, 3), store="dimension"),
+        signal,
+        do_plot=False,
+    )
+    assert isinstance(ds, DataSetProtocol)
+    assert ds.description.shapes == {"signal": (2, 2, 2, 3)}
+    assert [value for name, value in set_order if name == "a"] == [0, 1, 0]
+    assert [value for name, value in set_order if name == "b"] == [
+        0,
+        *[1, 2, 1, 0] * 4,
+    ]
+
+    # the backward traces are stored in the order of the forward traces
+    xr_ds = ds.to_xarray_dataset()
+    assert xr_ds.signal.dims == ("a_direction", "a", "b_direction", "b")
+    np.testing.assert_array_equal(xr_ds.b_direction, [0, 1])
+    expected = 100 * xr_ds.a + 10 * xr_ds.b
+    np.testing.assert_array_equal(xr_ds.signal, expected.broadcast_like(xr_ds.signal))
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_retrace_sweep_validation(grid_params, lorentzian) -> None:
+    a, b, _, signal, _ = grid_params
+    with pytest.raises(ValueError, match="Only one sweep of a dond"):
+        dond(
+            RetraceSweep(LinSweep(a, 0, 1, 2)),
+            RetraceSweep(LinSweep(b, 0, 1, 2)),
+            signal,
+            do_plot=False,
+        )
+    with pytest.raises(ValueError, match="only be swept in row major order"):
+        dond(
+            LinSweep(a, 0, 1, 2),
+            RetraceSweep(LinSweep(b, 0, 1, 2)),
+            signal,
+            do_plot=False,
+            order="snake",
+        )
+    x, _ = lorentzian
+    with pytest.raises(ValueError, match="an AdaptiveSweep cannot be retraced"):
+        RetraceSweep(AdaptiveSweep(x, -1, 1, 10))
+    with pytest.raises(ValueError, match="Invalid store"):
+        RetraceSweep(LinSweep(a, 0, 1, 2), store="both")  # type: ignore[arg-type]
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from qcodes.dataset import (
+    AdaptiveSweep,
+    DataSetProtocol,
+    LinSweep,
+    dond,
+    estimate_do1d,
+    estimate_do2d,
+    estimate_dond,
+)
+from qcodes.instrument import Instrument
+
+
+@pytest.fixture(name="slow_instruments")
+def _make_slow_instruments():
+    instruments = [Instrument(f"estimate_instrument_{i}") for i in range(2)]
+    for instrument, latency in zip(instruments, (0.002, 0.004)):
+        instrument.add_parameter(
+            "signal", get_cmd=lambda latency=latency: time.sleep(latency) or 1.0
+        )
+        instrument.add_parameter("gate", set_cmd=None, get_cmd=None, initial_value=0)
+    try:
+        yield instruments
+    finally:
+        for instrument in instruments:
+            instrument.close()
+
+
+def test_estimate_dond(experiment, slow_instruments) -> None:
+    first, second = slow_instruments
+    first.gate.step = 0.25
+    first.gate.inter_delay = 0.001
+    sweeps = (LinSweep(first.gate, 0, 1, 3), LinSweep(second.gate, 0, 1, 4, 0.001))
+    estimate = estimate_dond(*sweeps, first.signal, second.signal)
+    # no dataset is written
+    assert experiment.last_counter == 0
+
+    assert estimate.n_points == 12
+    # 4 steps of the ramp from 0 to 1 once and
+    # 3 passes and 2 returns of 0.001 s per setpoint of the inner sweep
+    assert estimate.set_time == pytest.approx(4 * 0.001 + (3 * 3 + 2) * 0.001)
+    assert estimate.get_latencies["estimate_instrument_0_signal"] >= 0.002
+    assert estimate.get_latencies["estimate_instrument_1_signal"] >= 0.004
+    assert estimate.measure_time == pytest.approx(
+        12 * sum(estimate.get_latencies.values())
+    )
+    assert estimate.total == estimate.set_time + estimate.measure_time
+    assert set(estimate.per_instrument) == {
+        "estimate_instrument_0",
+        "estimate_instrument_1",
+    }
+    assert sum(estimate.per_instrument.values()) == pytest.approx(estimate.total)
+    assert "estimate_instrument_1" in str(estimate)
+
+    t_start = time.perf_counter()
+    ds, _, _ = dond(*sweeps, first.signal, second.signal, do_plot=False)
+    duration = time.perf_counter() - t_start
+    assert isinstance(ds, DataSetProtocol)
+    assert ds.number_of_results == 24
+    assert estimate.total < duration
+
+    snake = estimate_dond(*sweeps, first.signal, second.signal, order="snake")
+    assert snake.set_time == pytest.approx(4 * 0.001 + 3 * 3 * 0.001)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_estimate_dond_use_threads(slow_instruments) -> None:
+    first, second = slow_instruments
+    estimate = estimate_dond(
+        LinSweep(first.gate, 0, 1, 10), first.signal, second.signal, use_threads=True
+    )
+    assert estimate.measure_time == pytest.approx(
+        10 * max(estimate.get_latencies.values())
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_estimate_dond_adaptive_sweep(slow_instruments) -> None:
+    first, second = slow_instruments
+    estimate = estimate_dond(
+        LinSweep(first.gate, 0, 1, 2),
+        AdaptiveSweep(second.gate, 0, 1, 5, delay=0.01),
+        second.signal,
+    )
+    assert estimate.n_points == 10
+    assert estimate.set_time == pytest.approx((2 * 4 + 1) * 0.01)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_estimate_do1d_do2d(slow_instruments) -> None:
+    first, second = slow_instruments
+    estimate_1d = estimate_do1d(first.gate, 0, 1, 5, 0.01, first.signal)
+    assert estimate_1d.n_points == 5
+    assert estimate_1d.set_time == pytest.approx(4 * 0.01)
+
+    estimate_2d = estimate_do2d(
+        first.gate, 0, 1, 2, 0, second.gate, 0, 1, 5, 0.01, first.signal
+    )
+    assert estimate_2d.n_points == 10
+    assert estimate_2d.set_time == pytest.approx((2 * 4 + 1) * 0.01)
+
+    with pytest.raises(ValueError, match="n_samples"):
+        estimate_do1d(first.gate, 0, 1, 5, 0.01, first.signal, n_samples=0)
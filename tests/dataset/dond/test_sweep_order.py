@@ -0,0 +1,145 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from qcodes.dataset.dond.sweep_order import (
+    _axis_set_times,
+    _choose_traversal,
+    _GridOrderBuffer,
+    _set_time,
+    _Traversal,
+    _traversal_set_time,
+)
+from qcodes.parameters import Parameter
+
+
+@pytest.mark.parametrize("lengths", [(4,), (3, 4), (2, 3, 4), (3, 1, 2, 3)])
+@pytest.mark.parametrize("nesting_order", [False, True])
+def test_snake_traversal_reverses_fastest_axis(lengths, nesting_order) -> None:
+    n_axes = len(lengths)
+    nesting = tuple(reversed(range(n_axes))) if nesting_order else tuple(range(n_axes))
+    traversal = _Traversal(nesting, snake=True)
+    row_major = _Traversal(nesting, snake=False)
+    n_steps = int(np.prod(lengths))
+    fastest = nesting[-1]
+    line_length = lengths[fastest]
+
+    points = [traversal.axis_indices(step, lengths) for step in range(n_steps)]
+    assert sorted(points) == list(itertools.product(*(range(n) for n in lengths)))
+    for step, point in enumerate(points):
+        line, index = divmod(step, line_length)
+        row_major_point = row_major.axis_indices(step, lengths)
+        if line % 2 == 1:
+            index = line_length - 1 - index
+        assert point[fastest] == index
+        # the slower axes are traversed as without snaking
+        assert all(
+            point[axis] == row_major_point[axis]
+            for axis in range(n_axes)
+            if axis != fastest
+        )
+
+
+def test_snake_traversal_holds_back_one_line() -> None:
+    lengths = (2, 3, 4)
+    traversal = _Traversal((0, 1, 2), snake=True)
+    stored: list[int] = []
+    buffer = _GridOrderBuffer(stored.append)
+    held_back = 0
+    for step in range(int(np.prod(lengths))):
+        grid_index = int(
+            np.ravel_multi_index(traversal.axis_indices(step, lengths), lengths)
+        )
+        buffer.add(grid_index, grid_index)
+        buffer.complete(grid_index)
+        held_back = max(held_back, step + 1 - len(stored))
+    assert stored == list(range(24))
+    assert held_back == lengths[-1] - 1
+
+
+def test_row_major_traversal() -> None:
+    lengths = (2, 3)
+    traversal = _Traversal.row_major(2)
+    assert traversal.is_row_major()
+    assert [traversal.axis_indices(step, lengths) for step in range(6)] == list(
+        itertools.product(range(2), range(3))
+    )
+
+
+def test_retraced_traversal() -> None:
+    lengths = (2, 2, 3)
+    traversal = _Traversal.row_major(3, retraced=frozenset({2}))
+    assert traversal.is_row_major()
+    assert [traversal.axis_indices(step, lengths)[2] for step in range(12)] == [
+        *[0, 1, 2, 2, 1, 0] * 2
+    ]
+
+    param = Parameter("param", set_cmd=None, get_cmd=None)
+    direction = Parameter("direction", set_cmd=None, get_cmd=None)
+    axis_set_times = [
+        (0.0, 0.0),
+        _axis_set_times([(direction, np.array([0, 1]), 0.0)]),
+        _axis_set_times([(param, np.linspace(0, 1, 3), 1.0)]),
+    ]
+    # four passes of two steps without any return to the start
+    assert _traversal_set_time(axis_set_times, lengths, traversal) == 8
+    assert _traversal_set_time(axis_set_times, lengths, _Traversal.row_major(3)) == 11
+
+
+def test_set_time() -> None:
+    param = Parameter("param", set_cmd=None, get_cmd=None)
+    assert _set_time(param, 0, 1, 0.5) == 0.5
+    assert _set_time(param, 1, 1, 0.5) == 0
+
+    param.step = 0.1
+    param.inter_delay = 0.2
+    param.post_delay = 0.01
+    assert _set_time(param, 0, 1, 0) == pytest.approx(10 * 0.2)
+    param.post_delay = 0.3
+    assert _set_time(param, 0, 1, 0.5) == pytest.approx(0.5 + 10 * 0.3)
+    assert _set_time(param, 1, 0, 0) == _set_time(param, 0, 1, 0)
+
+
+def test_choose_traversal() -> None:
+    slow = Parameter("slow", set_cmd=None, get_cmd=None, step=0.1, inter_delay=1)
+    fast = Parameter("fast", set_cmd=None, get_cmd=None)
+    setpoints = np.linspace(0, 1, 11)
+    axes = [[(fast, setpoints, 0.0)], [(slow, setpoints, 0.0)]]
+
+    row_major = _choose_traversal(axes, "row_major")
+    assert row_major.traversal == _Traversal((0, 1), False)
+    # 11 passes and 10 returns of 10 s for the slow parameter
+    assert row_major.set_time == pytest.approx(21 * 10)
+    assert row_major.set_time == row_major.row_major_set_time
+
+    snake = _choose_traversal(axes, "snake")
+    assert snake.traversal == _Traversal((0, 1), True)
+    assert snake.set_time == pytest.approx(11 * 10)
+
+    min_cost = _choose_traversal(axes, "min_cost")
+    assert min_cost.traversal.nesting == (1, 0)
+    assert min_cost.set_time == pytest.approx(10)
+
+    with pytest.raises(ValueError, match="Invalid sweep order"):
+        _choose_traversal(axes, "random")  # type: ignore[arg-type]
+
+
+def test_grid_order_buffer() -> None:
+    stored: list[str] = []
+    buffer = _GridOrderBuffer(stored.append)
+
+    buffer.add(0, "a")
+    buffer.complete(0)
+    buffer.add(2, "c")
+    buffer.complete(2)
+    buffer.add(1, "b1")
+    assert stored == ["a", "b1"]
+    buffer.add(1, "b2")
+    buffer.complete(1)
+    assert stored == ["a", "b1", "b2", "c"]
+
+    buffer.add(5, "f")
+    buffer.add(4, "e")
+    buffer.flush()
+    assert stored == ["a", "b1", "b2", "c", "e", "f"]
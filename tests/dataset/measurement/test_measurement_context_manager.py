@@ -24,7 +24,12 @@ from qcodes.dataset.experiment_container import new_experiment
 from qcodes.dataset.export_config import DataExportType
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.sqlite.connection import atomic_transaction
-from qcodes.parameters import ManualParameter, Parameter, expand_setpoints_helper
+from qcodes.parameters import (
+    ManualParameter,
+    Parameter,
+    ParameterWithSetpoints,
+    expand_setpoints_helper,
+)
 from qcodes.station import Station
 from tests.common import retry_until_does_not_throw
 
@@ -896,6 +901,38 @@ def test_datasaver_foul_input(bg_writing) -> None:
                 datasaver.add_result(("foul", ft))  # type: ignore[arg-type]
 
 
+@pytest.mark.usefixtures("experiment")
+def test_datasaver_add_packed_results(DAC, DMM, mocker) -> None:
+    meas = Measurement()
+    meas.register_parameter(DAC.ch1)
+    meas.register_parameter(DAC.ch2)
+    meas.register_parameter(DMM.v1, setpoints=(DAC.ch1, DAC.ch2))
+
+    params = (DAC.ch1, DMM.v2, DMM.v1)
+    index_map = (0, 2)
+    additional = ((DAC.ch2, 0.5),)
+    validate_deps = mocker.spy(
+        qc.dataset.measurements.DataSaver, "_validate_result_deps"
+    )
+    with meas.run() as datasaver:
+        for value in range(3):
+            datasaver._add_packed_results(
+                params, (value, 10, 2 * value), index_map, additional
+            )
+        # the dependencies are only validated for the first point
+        assert validate_deps.call_count == 1
+
+        with pytest.raises(ValueError, match='is of type "numeric"'):
+            datasaver._add_packed_results(params, ("a", 10, 0), index_map, additional)
+        with pytest.raises(ValueError, match="some required parameters are missing"):
+            datasaver._add_packed_results(params, (0, 10, 0), (2,))
+
+    data = datasaver.dataset.get_parameter_data()["dummy_dmm_v1"]
+    assert_array_equal(data["dummy_dac_ch1"], [0, 1, 2])
+    assert_array_equal(data["dummy_dac_ch2"], [0.5, 0.5, 0.5])
+    assert_array_equal(data["dummy_dmm_v1"], [0, 2, 4])
+
+
 @settings(max_examples=10, deadline=None)
 @given(N=hst.integers(min_value=2, max_value=500))
 @pytest.mark.usefixtures("empty_temp_db")
@@ -1181,6 +1218,51 @@ def test_datasaver_parameter_with_setpoints(
     )
 
 
+@pytest.mark.usefixtures("experiment")
+def test_datasaver_parameter_with_setpoints_reuses_setpoints(mocker) -> None:
+    n = 11
+    freq_axis = Parameter(
+        "freq_axis",
+        get_cmd=None,
+        set_cmd=None,
+        vals=vals.Arrays(shape=(n,)),
+        initial_value=np.linspace(0, 1, n),
+    )
+    trace = ParameterWithSetpoints(
+        "trace",
+        get_cmd=lambda: np.random.rand(n),
+        set_cmd=False,
+        vals=vals.Arrays(shape=(n,)),
+        setpoints=(freq_axis,),
+    )
+    meas = Measurement()
+    meas.register_parameter(trace)
+
+    get_spy = mocker.spy(freq_axis, "get")
+
+    with meas.run() as datasaver:
+        grids = []
+        for _ in range(3):
+            datasaver.add_result((trace, trace.get()))
+            grids.append(datasaver._setpoints_cache[trace][2][0])
+        # the manual setpoint parameter is only read once and
+        # the same grid is reused for all results
+        assert get_spy.call_count == 1
+        assert grids[0] is grids[1] is grids[2]
+        assert not grids[0].flags.writeable
+
+        freq_axis.set(np.linspace(1, 2, n))
+        datasaver.add_result((trace, trace.get()))
+        assert get_spy.call_count == 2
+        assert_allclose(datasaver._setpoints_cache[trace][2][0], np.linspace(1, 2, n))
+
+    data = datasaver.dataset.get_parameter_data()["trace"]["freq_axis"]
+    assert_allclose(
+        data,
+        np.stack([np.linspace(0, 1, n)] * 3 + [np.linspace(1, 2, n)]),
+    )
+
+
 @settings(
     max_examples=5,
     deadline=None,
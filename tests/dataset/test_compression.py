@@ -0,0 +1,144 @@
+import io
+
+import numpy as np
+import pytest
+
+from qcodes.dataset import DataSetType, Measurement, load_by_id
+from qcodes.dataset.descriptions.dependencies import InterDependencies_
+from qcodes.dataset.descriptions.param_spec import ParamSpecBase
+from qcodes.dataset.descriptions.rundescriber import RunDescriber
+from qcodes.dataset.descriptions.versioning import serialization as serial
+from qcodes.dataset.sqlite.compression import (
+    COMPRESSION_CODECS,
+    MAGIC,
+    compress_array,
+    decompress_array_bytes,
+    resolve_compression,
+)
+from qcodes.dataset.sqlite.connection import atomic_transaction
+from qcodes.dataset.sqlite.database import _adapt_array, _convert_array
+from qcodes.parameters import Parameter
+
+
+@pytest.mark.parametrize("codec", COMPRESSION_CODECS)
+@pytest.mark.parametrize(
+    "array",
+    (
+        np.linspace(0, 1, 1000),
+        np.arange(1000, dtype=np.int16).reshape(10, 100),
+        np.arange(10, dtype=np.uint8),
+        np.exp(1j * np.linspace(0, 1, 100)),
+        np.array(["a", "bc"]),
+        np.broadcast_to(np.arange(10.0), (5, 10)),
+    ),
+)
+def test_compress_roundtrip(codec, array) -> None:
+    blob = compress_array(array, codec)
+    assert blob.startswith(MAGIC)
+    loaded = _convert_array(blob)
+    np.testing.assert_array_equal(loaded, array)
+    assert loaded.dtype == array.dtype
+
+
+def test_uncompressed_blobs_are_unchanged() -> None:
+    blob = bytes(_adapt_array(np.arange(10)))
+    assert decompress_array_bytes(blob) == blob
+
+
+def test_compression_reduces_size() -> None:
+    array = np.repeat(np.linspace(0, 1, 100), 100)
+    uncompressed = len(_adapt_array(array))
+    assert len(compress_array(array, "zlib")) < uncompressed
+    assert len(compress_array(array, "zlib-shuffle")) < uncompressed / 3
+
+
+def test_unknown_codec_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown compression codec"):
+        compress_array(np.arange(3), "zstd")
+
+
+def test_compressed_blobs_fail_clearly_without_decompression() -> None:
+    # versions of QCoDeS without compression load the blob as a npy file
+    blob = compress_array(np.arange(10), "zlib")
+    with pytest.raises(ValueError, match="requires a newer version of QCoDeS"):
+        np.load(io.BytesIO(blob), allow_pickle=False)
+
+
+def test_unknown_codec_of_blob_raises() -> None:
+    with pytest.raises(ValueError, match="unknown codec 127"):
+        decompress_array_bytes(MAGIC + bytes((127,)) + b"data")
+
+
+def test_resolve_compression() -> None:
+    x = ParamSpecBase("x", "array")
+    y = ParamSpecBase("y", "array")
+    z = ParamSpecBase("z", "numeric")
+    interdeps = InterDependencies_(dependencies={y: (x,)}, standalones=(z,))
+
+    assert resolve_compression(None, interdeps) is None
+    assert resolve_compression("lzma", interdeps) == {"x": "lzma", "y": "lzma"}
+    assert resolve_compression({"y": "bz2"}, interdeps) == {"y": "bz2"}
+    with pytest.raises(ValueError, match="Only parameters"):
+        resolve_compression({"z": "zlib"}, interdeps)
+    with pytest.raises(ValueError, match="Unknown compression codec"):
+        resolve_compression({"y": "foo"}, interdeps)
+
+
+def test_rundescriber_compression_serialization() -> None:
+    x = ParamSpecBase("x", "array")
+    interdeps = InterDependencies_(standalones=(x,))
+    desc = RunDescriber(interdeps, compression={"x": "zlib"})
+
+    ser = serial.to_dict_for_storage(desc)
+    assert ser["compression"] == {"x": "zlib"}
+    assert serial.from_json_to_current(serial.to_json_for_storage(desc)) == desc
+
+    assert "compression" not in serial.to_dict_for_storage(RunDescriber(interdeps))
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("write_in_background", (True, False))
+def test_measurement_with_compression(write_in_background) -> None:
+    n = 500
+    freq = Parameter("freq", set_cmd=None, get_cmd=None)
+    trace = Parameter("trace", set_cmd=None, get_cmd=None)
+
+    meas = Measurement()
+    meas.register_parameter(freq, paramtype="array")
+    meas.register_parameter(trace, setpoints=(freq,), paramtype="array")
+    meas.set_compression("zlib-shuffle")
+
+    freqs = np.linspace(0, 1e9, n)
+    traces = [np.sin(freqs / 1e8 * i) for i in range(3)]
+    with meas.run(write_in_background=write_in_background) as datasaver:
+        for data in traces:
+            datasaver.add_result((freq, freqs), (trace, data))
+
+    ds = load_by_id(datasaver.run_id)
+    assert ds.description.compression == {
+        "freq": "zlib-shuffle",
+        "trace": "zlib-shuffle",
+    }
+
+    blobs = atomic_transaction(
+        ds.conn, f'SELECT CAST(trace AS BLOB) FROM "{ds.table_name}"'
+    ).fetchall()
+    assert all(bytes(blob).startswith(MAGIC) for (blob,) in blobs)
+
+    data = ds.get_parameter_data()["trace"]
+    np.testing.assert_array_equal(data["trace"], np.stack(traces))
+    np.testing.assert_array_equal(data["freq"], np.stack([freqs] * 3))
+
+    ds.cache.load_data_from_db()
+    np.testing.assert_array_equal(ds.cache.data()["trace"]["trace"], np.stack(traces))
+
+
+@pytest.mark.usefixtures("experiment")
+def test_compression_not_supported_in_memory() -> None:
+    trace = Parameter("trace", set_cmd=None, get_cmd=None)
+    meas = Measurement()
+    meas.register_parameter(trace, paramtype="array")
+    meas.set_compression("zlib")
+    with pytest.raises(ValueError, match="does not support compression"):
+        with meas.run(dataset_class=DataSetType.DataSetInMem):
+            pass
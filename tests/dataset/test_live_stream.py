@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from qcodes.dataset.data_set_protocol import DataSetType
+
+
+@pytest.mark.parametrize(
+    "dataset_class", (DataSetType.DataSet, DataSetType.DataSetInMem)
+)
+@pytest.mark.parametrize("write_in_background", (True, False))
+def test_live_stream(
+    meas_with_registered_param, DMM, DAC, dataset_class, write_in_background
+) -> None:
+    with meas_with_registered_param.run(
+        dataset_class=dataset_class,
+        write_in_background=write_in_background,
+        live_stream=True,
+    ) as datasaver:
+        stream = datasaver.dataset.live_stream(timeout=10)
+        for set_v in np.linspace(0, 25, 10):
+            DAC.ch1.set(set_v)
+            datasaver.add_result((DAC.ch1, set_v), (DMM.v1, DMM.v1()))
+
+    blocks = [block for flushed in stream for block in flushed]
+
+    assert len(blocks) == 10
+    np.testing.assert_array_equal(
+        [block["dummy_dac_ch1"] for block in blocks], np.linspace(0, 25, 10)
+    )
+    np.testing.assert_array_equal(
+        [block["dummy_dmm_v1"] for block in blocks],
+        datasaver.dataset.get_parameter_data()["dummy_dmm_v1"]["dummy_dmm_v1"],
+    )
+
+
+def test_live_stream_not_published(meas_with_registered_param) -> None:
+    with meas_with_registered_param.run() as datasaver:
+        with pytest.raises(RuntimeError, match="No live stream is published"):
+            datasaver.dataset.live_stream()
+
+
+def test_live_stream_closed_if_exit_actions_fail(meas_with_registered_param) -> None:
+    def fail() -> None:
+        raise RuntimeError("exit action failed")
+
+    meas_with_registered_param.add_after_run(fail, ())
+    with pytest.raises(RuntimeError, match="exit action failed"):
+        with meas_with_registered_param.run(live_stream=True) as datasaver:
+            pass
+
+    with pytest.raises(RuntimeError, match="No live stream is published"):
+        datasaver.dataset.live_stream()
@@ -0,0 +1,146 @@
+import json
+
+import pytest
+
+import qcodes as qc
+from qcodes.dataset import Measurement, load_by_id
+from qcodes.dataset.data_set import DataSet
+from qcodes.dataset.database_fix_functions import deduplicate_snapshots
+from qcodes.dataset.sqlite.connection import atomic_transaction
+from qcodes.dataset.sqlite.queries import get_metadata_from_run_id
+from qcodes.dataset.sqlite.snapshot_store import (
+    SNAPSHOTS_TABLE,
+    join_snapshot,
+    split_snapshot,
+)
+from qcodes.instrument_drivers.mock_instruments import DummyInstrument
+from qcodes.parameters import Parameter
+from qcodes.station import Station
+
+
+@pytest.fixture(name="station")
+def _make_station():
+    dac = DummyInstrument("dummy_dac", gates=["ch1", "ch2"])
+    dmm = DummyInstrument("dummy_dmm", gates=["v1", "v2"])
+    yield Station(dac, dmm)
+    dac.close()
+    dmm.close()
+
+
+def _measure(station: Station) -> int:
+    x = Parameter("x", set_cmd=None, get_cmd=None)
+    meas = Measurement(station=station)
+    meas.register_parameter(x)
+    with meas.run() as datasaver:
+        datasaver.add_result((x, 1))
+    return datasaver.run_id
+
+
+def _load(run_id: int) -> DataSet:
+    ds = load_by_id(run_id)
+    assert isinstance(ds, DataSet)
+    return ds
+
+
+def _count_fragments(conn) -> int:
+    return atomic_transaction(
+        conn, f"SELECT COUNT(*) FROM {SNAPSHOTS_TABLE}"
+    ).fetchone()[0]
+
+
+def test_split_and_join_snapshot() -> None:
+    instrument = {"__class__": "Instr", "parameters": {"p": {"__class__": "Par"}}}
+    snapshot = {"station": {"instruments": {"a": instrument}, "values": [1.5, None]}}
+    snapshot_raw = json.dumps(snapshot)
+
+    snapshot_hash, fragments = split_snapshot(snapshot_raw)
+    # the parameter, the instrument and the snapshot as a whole
+    assert len(fragments) == 3
+    assert join_snapshot(snapshot_hash, fragments) == snapshot_raw
+
+    other = {"station": {"instruments": {"a": instrument, "b": instrument}}}
+    _, other_fragments = split_snapshot(json.dumps(other))
+    assert len(other_fragments) == 3
+    assert len(fragments.keys() & other_fragments.keys()) == 2
+
+
+def test_split_snapshot_with_reference_key_raises() -> None:
+    with pytest.raises(ValueError, match="__snapshot_ref__"):
+        split_snapshot(json.dumps({"a": {"__snapshot_ref__": "0" * 64}}))
+
+
+@pytest.mark.parametrize(
+    "snapshot_raw",
+    [json.dumps({"a": {"__class__": "Instr"}}, indent=4), '{"a": 1e3}'],
+)
+def test_split_snapshot_that_does_not_round_trip_raises(snapshot_raw: str) -> None:
+    with pytest.raises(ValueError, match="json.dumps"):
+        split_snapshot(snapshot_raw)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_deduplicated_snapshots(station: Station) -> None:
+    qc.config.dataset.deduplicate_snapshots = True
+
+    first_id = _measure(station)
+    ds = _load(first_id)
+    assert ds.snapshot is not None
+    assert ds.snapshot["station"]["instruments"]["dummy_dac"]["name"] == "dummy_dac"
+    snapshot, snapshot_hash = atomic_transaction(
+        ds.conn, "SELECT snapshot, snapshot_hash FROM runs WHERE run_id = ?", first_id
+    ).fetchone()
+    assert snapshot is None
+    assert snapshot_hash is not None
+    assert "snapshot_hash" not in get_metadata_from_run_id(ds.conn, first_id)
+    n_fragments = _count_fragments(ds.conn)
+
+    station.dummy_dac.ch1.set(1.0)
+    second_id = _measure(station)
+    second_ds = _load(second_id)
+    assert second_ds.snapshot is not None
+    dac_snapshot = second_ds.snapshot["station"]["instruments"]["dummy_dac"]
+    assert dac_snapshot["parameters"]["ch1"]["value"] == 1.0
+    # only the changed parameter, its instrument and the snapshot as a whole
+    # are stored anew
+    assert _count_fragments(ds.conn) - n_fragments == 3
+
+    qc.config.dataset.deduplicate_snapshots = False
+    ds.add_snapshot(json.dumps({"a": 1}), overwrite=True)
+    assert _load(first_id).snapshot == {"a": 1}
+
+
+@pytest.mark.usefixtures("experiment")
+def test_deduplicate_snapshots_of_existing_runs(station: Station) -> None:
+    run_ids = [_measure(station) for _ in range(3)]
+    snapshots = [_load(run_id).snapshot_raw for run_id in run_ids]
+    conn = _load(run_ids[0]).conn
+
+    assert deduplicate_snapshots(conn) == {
+        "runs_inspected": 3,
+        "runs_deduplicated": 3,
+    }
+    assert [_load(run_id).snapshot_raw for run_id in run_ids] == snapshots
+    assert atomic_transaction(
+        conn, "SELECT COUNT(*) FROM runs WHERE snapshot IS NOT NULL"
+    ).fetchone() == (0,)
+
+    assert deduplicate_snapshots(conn, vacuum=False) == {
+        "runs_inspected": 0,
+        "runs_deduplicated": 0,
+    }
+
+
+@pytest.mark.usefixtures("experiment")
+def test_deduplicate_snapshots_keeps_snapshots_that_do_not_round_trip(
+    station: Station,
+) -> None:
+    run_id = _measure(station)
+    ds = _load(run_id)
+    snapshot_raw = json.dumps({"a": {"__class__": "Instr", "b": 1e3}}, indent=4)
+    ds.add_snapshot(snapshot_raw, overwrite=True)
+
+    assert deduplicate_snapshots(ds.conn, vacuum=False) == {
+        "runs_inspected": 1,
+        "runs_deduplicated": 0,
+    }
+    assert _load(run_id).snapshot_raw == snapshot_raw
@@ -3,6 +3,7 @@ import logging
 from numbers import Number
 from typing import Any
 
+import numpy as np
 import pytest
 from numpy import ndarray
 
@@ -207,3 +208,61 @@ def test_subscription_from_config_wrong_name(dataset) -> None:
     assert "test_subscriber" not in qcodes.config.subscription.subscribers
     with pytest.raises(RuntimeError):
         dataset.subscribe_from_config("test_subscriber")
+
+
+def test_batched_subscription(dataset) -> None:
+    xparam = ParamSpecBase(name="x", paramtype="numeric", label="x parameter", unit="V")
+    yparam = ParamSpecBase(
+        name="y", paramtype="numeric", label="y parameter", unit="Hz"
+    )
+    idps = InterDependencies_(dependencies={yparam: (xparam,)})
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    def batch_subscriber(columns, length, state) -> None:
+        state.append((length, columns))
+
+    sub_id = dataset.subscribe(
+        batch_subscriber, min_wait=0, min_count=5, state=[], batched=True
+    )
+
+    # no trigger is installed for batched subscribers
+    get_triggers_sql = "SELECT * FROM sqlite_master WHERE TYPE = 'trigger';"
+    triggers = atomic_transaction(dataset.conn, get_triggers_sql).fetchall()
+    assert len(triggers) == 0
+
+    for x in range(3):
+        dataset.add_results([{"x": x, "y": -(x**2)} for x in range(3 * x, 3 * x + 3)])
+
+    dataset.mark_completed()
+    state = dataset.subscribers[sub_id].state
+
+    assert [length for length, _ in state] == [6, 9]
+    np.testing.assert_array_equal(state[0][1]["x"], np.arange(6))
+    np.testing.assert_array_equal(state[0][1]["y"], -(np.arange(6) ** 2))
+    np.testing.assert_array_equal(state[1][1]["x"], np.arange(6, 9))
+
+    dataset.unsubscribe(sub_id)
+    assert len(dataset.subscribers) == 0
+
+
+def test_batched_subscription_array_values(dataset) -> None:
+    xparam = ParamSpecBase(name="x", paramtype="array")
+    yparam = ParamSpecBase(name="y", paramtype="array")
+    idps = InterDependencies_(dependencies={yparam: (xparam,)})
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    def batch_subscriber(columns, length, state) -> None:
+        state.append(columns)
+
+    sub_id = dataset.subscribe(batch_subscriber, state=[], batched=True)
+
+    dataset.add_results([{"x": np.arange(4), "y": np.ones(4)}])
+    dataset.add_results([{"x": np.arange(4), "y": np.zeros(4)}])
+    dataset.mark_completed()
+
+    state = dataset.subscribers[sub_id].state
+    assert len(state) == 2
+    assert state[0]["y"].shape == (1, 4)
+    np.testing.assert_array_equal(state[1]["y"], np.zeros((1, 4)))
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from qcodes.dataset import Measurement, load_by_id
+from qcodes.dataset.database_extract_runs import extract_runs_into_db
+from qcodes.dataset.descriptions.dependencies import InterDependencies_
+from qcodes.dataset.descriptions.param_spec import ParamSpecBase
+from qcodes.dataset.descriptions.rundescriber import RunDescriber
+from qcodes.dataset.descriptions.versioning import serialization as serial
+from qcodes.dataset.sqlite.connection import atomic_transaction
+from qcodes.dataset.sqlite.database import connect
+from qcodes.dataset.sqlite.typed_columns import mask_nan_values, nan_mask_column
+from qcodes.parameters import Parameter
+
+
+def test_mask_nan_values() -> None:
+    keys, values = mask_nan_values(
+        ["x", "y", "z"],
+        [[1.0, np.float32("nan"), "a"], [float("nan"), 2.0, "b"]],
+        ["x", "y"],
+    )
+    assert keys == ["x", "y", "z", "x:nan", "y:nan"]
+    assert values == [[1.0, None, "a", None, 1], [None, 2.0, "b", 1, None]]
+
+
+def test_rundescriber_typed_columns_serialization() -> None:
+    x = ParamSpecBase("x", "numeric")
+    interdeps = InterDependencies_(standalones=(x,))
+    desc = RunDescriber(interdeps, typed_columns=True)
+
+    assert serial.to_dict_for_storage(desc)["typed_columns"] is True
+    assert serial.from_json_to_current(serial.to_json_for_storage(desc)) == desc
+    assert desc != RunDescriber(interdeps)
+    assert "typed_columns" not in serial.to_dict_for_storage(RunDescriber(interdeps))
+
+
+def _measure(typed_columns: bool, write_in_background: bool = False) -> int:
+    x = Parameter("x", set_cmd=None, get_cmd=None)
+    y = Parameter("y", set_cmd=None, get_cmd=None)
+    label = Parameter("label", set_cmd=None, get_cmd=None)
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y, setpoints=(x,))
+    meas.register_parameter(label, setpoints=(x,), paramtype="text")
+
+    with meas.run(
+        typed_columns=typed_columns, write_in_background=write_in_background
+    ) as datasaver:
+        for i, value in enumerate([0.5, np.nan, 2, np.nan, -np.inf]):
+            datasaver.add_result((x, i), (y, value))
+            datasaver.add_result((x, i), (label, f"point {i}"))
+        datasaver.add_result((x, np.nan), (y, 1.0))
+    return datasaver.run_id
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("write_in_background", (True, False))
+def test_typed_columns_match_default_storage(write_in_background) -> None:
+    default = load_by_id(_measure(False))
+    typed = load_by_id(_measure(True, write_in_background))
+
+    assert typed.description.typed_columns
+    assert not default.description.typed_columns
+
+    typed_data = typed.get_parameter_data()
+    default_data = default.get_parameter_data()
+    assert typed_data.keys() == default_data.keys()
+    for name, tree in default_data.items():
+        for param, values in tree.items():
+            np.testing.assert_array_equal(typed_data[name][param], values)
+    assert len(typed_data["y"]["y"]) == 6
+    assert np.isnan(typed_data["y"]["y"]).sum() == 2
+
+    typed.cache.load_data_from_db()
+    np.testing.assert_array_equal(typed.cache.data()["y"]["y"], default_data["y"]["y"])
+
+    # callbacks select rows in a separate query
+    progress = []
+    typed_data = typed.get_parameter_data("y", callback=progress.append)
+    np.testing.assert_array_equal(typed_data["y"]["y"], default_data["y"]["y"])
+    assert progress[-1] == 100
+
+
+@pytest.mark.usefixtures("experiment")
+def test_typed_columns_schema() -> None:
+    ds = load_by_id(_measure(True))
+    columns = atomic_transaction(
+        ds.conn, f'PRAGMA table_info("{ds.table_name}")'
+    ).fetchall()
+    types = {column[1]: column[2] for column in columns}
+    assert types["x"] == "REAL"
+    assert types["y"] == "REAL"
+    assert types[nan_mask_column("y")] == "INTEGER"
+    assert types["label"] == "TEXT"
+
+    # NaN is stored as NULL with the mask set
+    rows = atomic_transaction(
+        ds.conn, f'SELECT y, "y:nan" FROM "{ds.table_name}" WHERE "y:nan" = 1'
+    ).fetchall()
+    assert [tuple(row) for row in rows] == [(None, 1), (None, 1)]
+
+
+@pytest.mark.usefixtures("experiment")
+def test_extract_run_with_typed_columns(tmp_path) -> None:
+    ds = load_by_id(_measure(True))
+    target_path = tmp_path / "target.db"
+    extract_runs_into_db(ds.path_to_db, target_path, ds.run_id)
+
+    target_conn = connect(target_path)
+    try:
+        extracted = load_by_id(1, conn=target_conn)
+        assert extracted.description.typed_columns
+        np.testing.assert_array_equal(
+            extracted.get_parameter_data()["y"]["y"],
+            ds.get_parameter_data()["y"]["y"],
+        )
+    finally:
+        target_conn.close()
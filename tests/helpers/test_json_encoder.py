@@ -1,5 +1,6 @@
 import json
 from collections import OrderedDict, UserDict
+from typing import Any
 
 import hypothesis.strategies as hst
 import numpy as np
@@ -7,8 +8,11 @@ import pytest
 import uncertainties  # type: ignore[import-untyped]
 from hypothesis import given
 
+from qcodes.parameters import Parameter
 from qcodes.utils import NumpyJSONEncoder
+from qcodes.utils.json_utils import dumps_snapshot
 from qcodes.utils.types import numpy_complex, numpy_floats, numpy_ints
+from qcodes.validators import Numbers
 
 
 def test_python_types() -> None:
@@ -186,3 +190,31 @@ def test_bytes_array(bytes_to_encode) -> None:
     # encoding bytes is the same as using the
     # default encode on the str value of the bytes array
     assert v == default_encoder.encode(str(value))
+
+
+def test_dumps_snapshot_reuses_encoded_parameters() -> None:
+    p = Parameter("p", set_cmd=None, get_cmd=None, initial_value=1.5, vals=Numbers())
+    q = Parameter("q", set_cmd=None, get_cmd=None)
+    q.set(np.arange(3))
+    snapshot: dict[str, Any] = {
+        "parameters": {"p": p.snapshot(), "q": q.snapshot()},
+        "x": [1j],
+    }
+    encoded = dumps_snapshot(snapshot)
+    assert encoded == json.dumps(snapshot, cls=NumpyJSONEncoder)
+    assert p._snapshot_memo is not None
+    assert p._snapshot_memo[2].json is not None
+    # values that can be modified in place are always encoded anew
+    assert q._snapshot_memo is not None
+    assert q._snapshot_memo[2].json is None
+
+    snapshot = {"parameters": {"p": p.snapshot(), "q": q.snapshot()}, "x": [1j]}
+    assert dumps_snapshot(snapshot) == encoded
+
+    p.cache.set(2.5)
+    snapshot["parameters"]["p"] = p.snapshot()
+    assert json.loads(dumps_snapshot(snapshot))["parameters"]["p"]["value"] == 2.5
+
+    modified = p.snapshot()
+    modified["value"] = 3.5
+    assert json.loads(dumps_snapshot(modified))["value"] == 3.5
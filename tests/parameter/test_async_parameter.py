@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+import pytest
+
+from qcodes.instrument import Instrument
+from qcodes.parameters import Parameter, ParamRawDataType
+
+
+class AsyncRawParameter(Parameter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.raw = 0.0
+        self.set_raw_values: list[float] = []
+
+    def get_raw(self) -> ParamRawDataType:
+        raise RuntimeError("the blocking get should not be used")
+
+    async def async_get_raw(self) -> ParamRawDataType:
+        await asyncio.sleep(0)
+        return self.raw
+
+    def set_raw(self, value: ParamRawDataType) -> None:
+        raise RuntimeError("the blocking set should not be used")
+
+    async def async_set_raw(self, value: ParamRawDataType) -> None:
+        await asyncio.sleep(0)
+        self.set_raw_values.append(value)
+        self.raw = value
+
+
+class RecordingInstrument(Instrument):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.commands: list[str] = []
+        self.native_commands: list[str] = []
+        self.add_parameter("volt", get_cmd="VOLT?", set_cmd="VOLT {}", get_parser=float)
+
+    def write_raw(self, cmd: str) -> None:
+        self.commands.append(cmd)
+
+    def ask_raw(self, cmd: str) -> str:
+        self.commands.append(cmd)
+        return "1.5"
+
+    async def async_write_raw(self, cmd: str) -> None:
+        self.native_commands.append(cmd)
+
+    async def async_ask_raw(self, cmd: str) -> str:
+        self.native_commands.append(cmd)
+        return "2.5"
+
+
+@pytest.fixture(name="recording_instrument")
+def _make_recording_instrument():
+    instr = RecordingInstrument("recording_instrument")
+    try:
+        yield instr
+    finally:
+        instr.close()
+
+
+@pytest.mark.asyncio
+async def test_async_get_set_falls_back_to_thread() -> None:
+    thread_ids = []
+
+    def get_cmd() -> int:
+        thread_ids.append(threading.get_ident())
+        return 3
+
+    param = Parameter("param", get_cmd=get_cmd, set_cmd=None, scale=2)
+    assert await param.async_get() == 1.5
+    assert thread_ids[0] != threading.get_ident()
+
+    manual = Parameter("manual", set_cmd=None, get_cmd=None)
+    await manual.async_set(4)
+    assert manual.cache.get() == 4
+    assert await manual.async_get() == 4
+
+
+@pytest.mark.asyncio
+async def test_async_raw_parameter_transforms_values() -> None:
+    param = AsyncRawParameter("param", scale=10, offset=1, step=0.5)
+    param.raw = 21.0
+    assert await param.async_get() == 2.0
+    assert param.cache.raw_value == 21.0
+
+    await param.async_set(3.0)
+    # ramping in steps from 2 to 3
+    assert param.set_raw_values == [26.0, 31.0]
+    assert param.cache.get(get_if_invalid=False) == 3.0
+
+
+@pytest.mark.asyncio
+async def test_async_raw_parameter_errors_have_context() -> None:
+    param = AsyncRawParameter("param", get_parser=float)
+    param.raw = "not a number"
+    with pytest.raises(ValueError) as exc_info:
+        await param.async_get()
+    assert "getting param" in exc_info.value.args[-1]
+
+
+@pytest.mark.asyncio
+async def test_str_cmd_uses_native_async_transport(recording_instrument) -> None:
+    assert await recording_instrument.volt.async_get() == 2.5
+    await recording_instrument.volt.async_set(0.25)
+    assert recording_instrument.native_commands == ["VOLT?", "VOLT 0.25"]
+    assert recording_instrument.commands == []
+
+    assert recording_instrument.volt() == 1.5
+    assert recording_instrument.commands == ["VOLT?"]
+
+
+@pytest.mark.asyncio
+async def test_instrument_async_ask_defaults_to_thread() -> None:
+    class BlockingInstrument(Instrument):
+        def ask_raw(self, cmd: str) -> str:
+            return f"{cmd}:{threading.get_ident()}"
+
+    instr = BlockingInstrument("blocking_instrument")
+    try:
+        answer = await instr.async_ask("IDN?")
+        cmd, thread_id = answer.split(":")
+        assert cmd == "IDN?"
+        assert int(thread_id) != threading.get_ident()
+    finally:
+        instr.close()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qcodes.dataset.threading import SequentialParamsCaller, ThreadPoolParamsCaller
+from qcodes.instrument import Instrument
+from qcodes.parameters import Parameter, get_coalesced
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class SCPIInstrument(Instrument):
+    query_separator: str | None = ";"
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.queries: list[str] = []
+        self.responses = {
+            "*IDN?": "QCoDeS,SCPI,1,0.1",
+            "VOLT?": "1.5",
+            "CURR?": "0.25",
+            "OUTP?": "1",
+        }
+        self.add_parameter("volt", get_cmd="VOLT?", get_parser=float)
+        self.add_parameter("curr", get_cmd="CURR?", get_parser=float, scale=0.5)
+        self.add_parameter("output", get_cmd="OUTP?", val_mapping={"off": 0, "on": 1})
+        self.add_parameter("manual", set_cmd=None, initial_value=3)
+
+    def ask_raw(self, cmd: str) -> str:
+        self.queries.append(cmd)
+        return ";".join(self.responses[query] for query in cmd.split(";"))
+
+
+@pytest.fixture(name="scpi_instrument")
+def _make_scpi_instrument() -> Generator[SCPIInstrument, None, None]:
+    instr = SCPIInstrument("scpi_instrument")
+    try:
+        yield instr
+    finally:
+        instr.close()
+
+
+def test_ask_many(scpi_instrument: SCPIInstrument) -> None:
+    assert scpi_instrument.ask_many(["VOLT?", "CURR?"]) == ["1.5", "0.25"]
+    assert scpi_instrument.queries == ["VOLT?;CURR?"]
+
+    scpi_instrument.query_separator = None
+    assert scpi_instrument.ask_many(["VOLT?", "CURR?"]) == ["1.5", "0.25"]
+    assert scpi_instrument.queries[1:] == ["VOLT?", "CURR?"]
+
+
+def test_ask_many_with_response_separator(scpi_instrument: SCPIInstrument) -> None:
+    scpi_instrument.response_separator = ","
+    with pytest.raises(ValueError, match="Expected 2 responses separated by ','"):
+        scpi_instrument.ask_many(["VOLT?", "CURR?"])
+
+
+def test_get_coalesced(scpi_instrument: SCPIInstrument) -> None:
+    params = (
+        scpi_instrument.volt,
+        scpi_instrument.manual,
+        scpi_instrument.curr,
+        scpi_instrument.output,
+    )
+    result = get_coalesced(*params)
+
+    assert result == (
+        (scpi_instrument.volt, 1.5),
+        (scpi_instrument.manual, 3),
+        (scpi_instrument.curr, 0.5),
+        (scpi_instrument.output, "on"),
+    )
+    assert scpi_instrument.queries == ["VOLT?;CURR?;OUTP?"]
+    assert scpi_instrument.curr.cache.get(get_if_invalid=False) == 0.5
+    assert scpi_instrument.curr.cache.raw_value == "0.25"
+
+
+def test_get_coalesced_requires_query_separator(
+    scpi_instrument: SCPIInstrument,
+) -> None:
+    scpi_instrument.query_separator = None
+    result = get_coalesced(scpi_instrument.volt, scpi_instrument.curr)
+
+    assert result == ((scpi_instrument.volt, 1.5), (scpi_instrument.curr, 0.5))
+    assert scpi_instrument.queries == ["VOLT?", "CURR?"]
+
+
+def test_get_coalesced_falls_back_to_single_queries(
+    scpi_instrument: SCPIInstrument, caplog: pytest.LogCaptureFixture
+) -> None:
+    scpi_instrument.response_separator = ","
+    with caplog.at_level(logging.WARNING):
+        result = get_coalesced(scpi_instrument.volt, scpi_instrument.curr)
+
+    assert result == ((scpi_instrument.volt, 1.5), (scpi_instrument.curr, 0.5))
+    assert scpi_instrument.queries == ["VOLT?;CURR?", "VOLT?", "CURR?"]
+    assert "Could not coalesce the queries" in caplog.text
+
+
+def test_get_coalesced_adds_parameter_to_errors(
+    scpi_instrument: SCPIInstrument,
+) -> None:
+    scpi_instrument.responses["CURR?"] = "not a number"
+    with pytest.raises(ValueError) as excinfo:
+        get_coalesced(scpi_instrument.volt, scpi_instrument.curr)
+    assert "getting scpi_instrument_curr" in excinfo.value.args
+
+
+def test_params_callers_coalesce_queries(scpi_instrument: SCPIInstrument) -> None:
+    other = Parameter("other", get_cmd=lambda: 7)
+    calls = []
+
+    with SequentialParamsCaller(
+        scpi_instrument.volt, scpi_instrument.curr, other
+    ) as call_params:
+        assert call_params() == [
+            (scpi_instrument.volt, 1.5),
+            (scpi_instrument.curr, 0.5),
+            (other, 7),
+        ]
+    assert scpi_instrument.queries == ["VOLT?;CURR?"]
+
+    # callables separate the parameters that are got together
+    with SequentialParamsCaller(
+        scpi_instrument.volt, lambda: calls.append(1), scpi_instrument.curr
+    ) as call_params:
+        call_params()
+    assert calls == [1]
+    assert scpi_instrument.queries[1:] == ["VOLT?", "CURR?"]
+
+    with ThreadPoolParamsCaller(
+        scpi_instrument.volt, other, scpi_instrument.output
+    ) as call_params:
+        assert sorted(call_params(), key=lambda pair: pair[0].full_name) == [
+            (other, 7),
+            (scpi_instrument.output, "on"),
+            (scpi_instrument.volt, 1.5),
+        ]
+    assert scpi_instrument.queries[3:] == ["VOLT?;OUTP?"]
+
+
+def test_snapshot_coalesces_queries(scpi_instrument: SCPIInstrument) -> None:
+    scpi_instrument.curr._snapshot_get = False
+    snapshot = scpi_instrument.snapshot(update=True)
+
+    assert snapshot["parameters"]["volt"]["value"] == 1.5
+    assert snapshot["parameters"]["output"]["value"] == "on"
+    assert scpi_instrument.queries[0] == "VOLT?;OUTP?"
+    assert "VOLT?" not in scpi_instrument.queries[1:]
+    assert "OUTP?" not in scpi_instrument.queries[1:]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Literal
 import pytest
 
 from qcodes.parameters import Parameter, ParameterBase
+from qcodes.validators import Numbers
 
 from .conftest import (
     GetSetRawParameter,
@@ -171,3 +172,63 @@ def test_gettable() -> None:
     assert mem.get() == 21
     assert p() == 21
     assert p.get_latest() == 21
+
+
+def test_transforms_follow_configuration_changes() -> None:
+    raw_values: list[Any] = []
+    p = Parameter(
+        "p", set_cmd=raw_values.append, get_cmd=lambda: raw_values[-1], scale=2
+    )
+    p(1)
+    assert raw_values == [2]
+    assert p() == 1
+
+    p.offset = 1
+    p(1)
+    assert raw_values[-1] == 3
+    assert p() == 1
+
+    p.scale = None
+    p.offset = None
+    p.set_parser = str
+    p.get_parser = float
+    p(1)
+    assert raw_values[-1] == "1"
+    assert p() == 1.0
+
+    p.set_parser = None
+    p.get_parser = None
+    p.val_mapping = {"on": 1, "off": 0}
+    p.inverse_val_mapping = {1: "on", 0: "off"}
+    p("off")
+    assert raw_values[-1] == 0
+    assert p() == "off"
+
+
+def test_validators_follow_configuration_changes() -> None:
+    p = Parameter("p", set_cmd=None, get_cmd=None)
+    p(10)
+    p.vals = Numbers(0, 5)
+    with pytest.raises(ValueError):
+        p(10)
+    with p.extra_validator(Numbers(0, 1)):
+        with pytest.raises(ValueError):
+            p(2)
+    p(2)
+    p.vals = None
+    p(10)
+    assert p() == 10
+
+
+def test_overridden_transforms_are_used() -> None:
+    class OffByOneParameter(Parameter):
+        def _from_raw_value_to_value(self, raw_value: Any) -> Any:
+            return super()._from_raw_value_to_value(raw_value) + 1
+
+        def _from_value_to_raw_value(self, value: Any) -> Any:
+            return super()._from_value_to_raw_value(value) - 1
+
+    p = OffByOneParameter("p", set_cmd=None, get_cmd=None, scale=2)
+    p(3)
+    assert p.raw_value == 5
+    assert p.get() == 3.5
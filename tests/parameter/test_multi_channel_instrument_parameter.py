@@ -1,12 +1,15 @@
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from qcodes.instrument import ChannelList, Instrument, InstrumentChannel
 from qcodes.instrument_drivers.mock_instruments import DummyChannelInstrument
+from qcodes.parameters import MultiChannelInstrumentParameter
+from qcodes.validators import Numbers
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Sequence
 
 
 @pytest.fixture
@@ -51,3 +54,103 @@ def test_set_multi_channel_instrument_parameter(
 
         with pytest.raises(TypeError):
             channel_parameter.set(object())
+
+
+class _SCPIChannel(InstrumentChannel):
+    def __init__(self, parent: "_SCPIInstrument", name: str, number: int):
+        super().__init__(parent, name)
+        self.add_parameter(
+            "volt",
+            get_cmd=f"VOLT{number}?",
+            get_parser=float,
+            set_cmd=f"VOLT{number} {{}}",
+            vals=Numbers(-1, 1),
+        )
+
+
+class _SCPIInstrument(Instrument):
+    query_separator = ";"
+
+    def __init__(self, name: str, multichan_paramclass: "type | None" = None):
+        super().__init__(name)
+        self.commands: list[str] = []
+        channels = ChannelList(
+            self, "channels", _SCPIChannel, multichan_paramclass=multichan_paramclass
+        )
+        for number in range(1, 4):
+            channels.append(_SCPIChannel(self, f"ch{number}", number))
+        self.add_submodule("channels", channels.to_channel_tuple())
+
+    def write_raw(self, cmd: str) -> None:
+        self.commands.append(cmd)
+
+    def ask_raw(self, cmd: str) -> str:
+        self.commands.append(cmd)
+        return ";".join(f"0.{query[4]}" for query in cmd.split(";"))
+
+
+class _CountingNumbers(Numbers):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def validate(self, value: Any, context: str = "") -> None:
+        self.calls += 1
+        super().validate(value, context)
+
+
+class _BulkVoltParameter(MultiChannelInstrumentParameter):
+    def set_channel_values(self, values: "Sequence[Any]") -> None:
+        instrument = self._channels[0].root_instrument
+        assert isinstance(instrument, _SCPIInstrument)
+        instrument.commands.append(f"VOLT:ALL {','.join(map(str, values))}")
+        for parameter, value in zip(self._channel_parameters, values):
+            parameter.cache.set(value)
+
+
+def test_get_multi_channel_parameter_coalesces_queries() -> None:
+    instrument = _SCPIInstrument("scpi_channels")
+    try:
+        assert instrument.channels.volt.get() == (0.1, 0.2, 0.3)
+        assert instrument.commands == ["VOLT1?;VOLT2?;VOLT3?"]
+        assert instrument.channels.ch2.volt.get_latest() == 0.2
+    finally:
+        instrument.close()
+
+
+def test_set_multi_channel_parameter_validates_each_value_once() -> None:
+    instrument = _SCPIInstrument("scpi_channels")
+    validators = [_CountingNumbers(-1, 1) for _ in instrument.channels]
+    for channel, validator in zip(instrument.channels, validators):
+        channel.volt.vals = validator
+    try:
+        instrument.channels.volt.set(0.5)
+        assert [validator.calls for validator in validators] == [1, 1, 1]
+        assert instrument.commands == ["VOLT1 0.5", "VOLT2 0.5", "VOLT3 0.5"]
+    finally:
+        instrument.close()
+
+
+def test_set_multi_channel_parameter_with_bulk_hook_validates_all_values() -> None:
+    instrument = _SCPIInstrument(
+        "scpi_channels", multichan_paramclass=_BulkVoltParameter
+    )
+    try:
+        with pytest.raises(TypeError):
+            instrument.channels.volt.set((0.5, 0.5, 2))
+        assert instrument.commands == []
+    finally:
+        instrument.close()
+
+
+def test_set_multi_channel_parameter_with_bulk_hook() -> None:
+    instrument = _SCPIInstrument(
+        "scpi_channels", multichan_paramclass=_BulkVoltParameter
+    )
+    try:
+        instrument.channels.volt.set(0.5)
+        instrument.channels[1:].volt.set((0.25, 0))
+        assert instrument.commands == ["VOLT:ALL 0.5,0.5,0.5", "VOLT:ALL 0.25,0"]
+        assert instrument.channels.ch3.volt.get_latest() == 0
+    finally:
+        instrument.close()
@@ -198,6 +198,35 @@ def test_max_val_age() -> None:
     assert timestamp >= start
 
 
+def test_timestamp_is_created_once_per_update() -> None:
+    local_parameter = Parameter("test_param", set_cmd=None, get_cmd=None)
+    local_parameter.set(1)
+    assert local_parameter.cache._timestamp is None  # type: ignore[attr-defined]
+
+    timestamp = local_parameter.cache.timestamp
+    assert timestamp is not None
+    assert local_parameter.cache.timestamp is timestamp
+    assert local_parameter.get_latest.get_timestamp() is timestamp
+    assert local_parameter.snapshot()["ts"] == timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+    local_parameter.set(2)
+    new_timestamp = local_parameter.cache.timestamp
+    assert new_timestamp is not None
+    assert new_timestamp >= timestamp
+
+
+def test_max_val_age_uses_monotonic_clock() -> None:
+    local_parameter = BetterGettableParam("test_param", set_cmd=None, max_val_age=1)
+    local_parameter.get()
+    assert local_parameter.cache.valid
+    # the cache expires based on the monotonic time of the last update
+    local_parameter.cache._monotonic_ns -= 2_000_000_000  # type: ignore[attr-defined]
+    assert not local_parameter.cache.valid
+    local_parameter.cache.get()
+    assert local_parameter._get_count == 2
+    assert local_parameter.cache.valid
+
+
 def test_no_get_max_val_age() -> None:
     """
     Test that cache.get on a parameter with max_val_age set and
@@ -1,4 +1,9 @@
+from __future__ import annotations
+
 import logging
+from concurrent.futures import wait
+from functools import partial
+from typing import TYPE_CHECKING
 
 import hypothesis.strategies as hst
 import numpy as np
@@ -6,11 +11,15 @@ import pytest
 from hypothesis import given, settings
 from pytest import LogCaptureFixture
 
-from qcodes.parameters import Parameter
+from qcodes.instrument import Instrument
+from qcodes.parameters import Parameter, ramp_parameters
 from qcodes.validators import Numbers
 
 from .conftest import MemoryParameter
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
 
 def test_step_ramp(caplog: LogCaptureFixture) -> None:
     p = MemoryParameter(name="test_step")
@@ -179,3 +188,84 @@ def test_stepping_from_invalid_starting_point() -> None:
         a.set(10)
     # afterwards the value should still be the same
     assert a.get() == -10
+
+
+@pytest.fixture(name="set_log")
+def _make_set_log() -> list[tuple[str, float]]:
+    return []
+
+
+@pytest.fixture(name="ramp_instrument")
+def _make_ramp_instrument(
+    set_log: list[tuple[str, float]],
+) -> Generator[Instrument, None, None]:
+    instr = Instrument("ramp_instrument")
+    for name in ("a", "b"):
+        instr.add_parameter(
+            name,
+            get_cmd=None,
+            set_cmd=partial(_log_set, set_log, name),
+            initial_value=0,
+            step=1,
+            inter_delay=0.005,
+        )
+    set_log.clear()
+    try:
+        yield instr
+    finally:
+        instr.close()
+
+
+def _log_set(log: list[tuple[str, float]], name: str, value: float) -> None:
+    log.append((name, value))
+
+
+def test_ramp_to(ramp_instrument: Instrument, set_log: list[tuple[str, float]]) -> None:
+    futures = [ramp_instrument.a.ramp_to(3), ramp_instrument.b.ramp_to(-2)]
+    wait(futures, timeout=5)
+
+    assert all(future.result() is None for future in futures)
+    assert ramp_instrument.a.get() == 3
+    assert ramp_instrument.b.get() == -2
+    assert [value for name, value in set_log if name == "a"] == [1, 2, 3]
+    assert [value for name, value in set_log if name == "b"] == [-1, -2]
+    # the steps of both parameters are interleaved
+    assert set_log.index(("b", -1)) < set_log.index(("a", 3))
+
+
+def test_ramps_of_a_parameter_are_queued(
+    ramp_instrument: Instrument, set_log: list[tuple[str, float]]
+) -> None:
+    ramp_instrument.a.ramp_to(2)
+    ramp_instrument.a.ramp_to(0).result(timeout=5)
+
+    assert set_log == [("a", 1), ("a", 2), ("a", 1), ("a", 0)]
+
+
+def test_ramp_to_errors() -> None:
+    p = MemoryParameter(name="p", vals=Numbers(0, 10), initial_value=0, step=1)
+    with pytest.raises(ValueError, match="setting p to 11"):
+        p.ramp_to(11)
+
+    def fail(value: float) -> None:
+        if value > 1:
+            raise RuntimeError("boom")
+
+    q = Parameter("q", set_cmd=fail, get_cmd=None, initial_value=0, step=1)
+    future = q.ramp_to(3)
+    with pytest.raises(RuntimeError, match="boom") as excinfo:
+        future.result(timeout=5)
+    assert "setting q to 3" in excinfo.value.args
+    assert q.get_latest() == 1
+
+
+def test_ramp_parameters(ramp_instrument: Instrument) -> None:
+    p = MemoryParameter(name="p", initial_value=0, step=0.5)
+    ramp_parameters((ramp_instrument.a, 2), (p, 1))
+
+    assert ramp_instrument.a.get_latest() == 2
+    assert p.set_values == [0, 0.5, 1]
+
+    ramp_instrument.b.inter_delay = 0.2
+    with pytest.raises(TimeoutError):
+        ramp_parameters((ramp_instrument.b, 2), timeout=0.1)
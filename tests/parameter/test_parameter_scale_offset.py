@@ -215,3 +215,42 @@ def test_setting_numpy_array_valued_param_if_scale_and_offset_are_not_none() ->
     param(values)
 
     assert isinstance(param.raw_value, np.ndarray)
+
+
+def test_scale_and_offset_of_array_values_are_broadcast() -> None:
+    raw = np.arange(12, dtype=float).reshape(3, 4)
+    param = Parameter(
+        name="test_param",
+        set_cmd=None,
+        get_cmd=lambda: raw,
+        scale=[1, 2, 4, 8],
+        offset=(0.5, 0.5, 1, 1),
+    )
+
+    values = param()
+    assert isinstance(values, np.ndarray)
+    np.testing.assert_allclose(values, (raw - [0.5, 0.5, 1, 1]) / [1, 2, 4, 8])
+    # the raw value is not modified in place
+    np.testing.assert_array_equal(raw, np.arange(12).reshape(3, 4))
+
+    settable = Parameter(
+        name="test_settable", set_cmd=None, scale=[1, 2, 4, 8], offset=1
+    )
+    settable(values)
+    assert isinstance(settable.raw_value, np.ndarray)
+    np.testing.assert_allclose(settable.raw_value, values * [1, 2, 4, 8] + 1)
+
+
+def test_scale_and_offset_of_integer_array_values() -> None:
+    raw = np.array([3, 5, 7])
+    param = Parameter(
+        name="test_param", set_cmd=None, get_cmd=lambda: raw, scale=2, offset=1
+    )
+
+    values = param()
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values, [1, 2, 3])
+
+    param(np.array([1, 2]))
+    assert param.raw_value.dtype == np.int64
+    np.testing.assert_array_equal(param.raw_value, [3, 5])
@@ -11,14 +11,14 @@ def test_number_of_validations() -> None:
     p = Parameter("p", set_cmd=None, initial_value=0, vals=BookkeepingValidator())
     # in the set wrapper the final value is validated
     # and then subsequently each step is validated.
-    # in this case there is one step so the final value
-    # is validated twice.
+    # without a step the final value is the only step
+    # so it is only validated once.
     assert isinstance(p.vals, BookkeepingValidator)
-    assert p.vals.values_validated == [0, 0]
+    assert p.vals.values_validated == [0]
 
     p.step = 1
     p.set(10)
-    assert p.vals.values_validated == [0, 0, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert p.vals.values_validated == [0, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
 
 def test_number_of_validations_for_set_cache() -> None:
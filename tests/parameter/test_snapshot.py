@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from typing_extensions import ParamSpec
 
 from qcodes.parameters import Parameter
+from qcodes.validators import PermissiveMultiples
 
 from .conftest import NOT_PASSED
 
@@ -363,3 +364,45 @@ def test_snapshot_value() -> None:
     assert "value" not in snap
     assert "raw_value" not in snap
     assert "ts" in snap
+
+
+def test_snapshot_is_reused_while_parameter_is_unchanged() -> None:
+    p = Parameter("p", set_cmd=None, get_cmd=None, label="Voltage", unit="V")
+    p(1.5)
+    snap = p.snapshot()
+    assert p.snapshot() == snap
+    assert p._snapshot_memo is not None
+    memo = p._snapshot_memo
+    p.snapshot()
+    assert p._snapshot_memo is memo
+
+    p.label = "Current"
+    assert p.snapshot()["label"] == "Current"
+    assert p._snapshot_memo is not memo
+
+    p.cache.set(2.5)
+    snap = p.snapshot()
+    assert snap["value"] == 2.5
+    assert snap["ts"] == p.cache.timestamp.strftime("%Y-%m-%d %H:%M:%S")  # type: ignore[union-attr]
+
+    validator = PermissiveMultiples(0.5)
+    p.vals = validator
+    assert p.snapshot()["vals"] == repr(validator)
+    validator.divisor = 0.25
+    assert "Multiples of 0.25" in p.snapshot()["vals"]
+
+
+def test_snapshot_is_not_reused_when_parameter_is_got() -> None:
+    values = iter(range(3))
+    p = Parameter("p", get_cmd=lambda: next(values), set_cmd=False)
+    assert p.snapshot(update=True)["value"] == 0
+    assert p.snapshot(update=True)["value"] == 1
+    assert p.snapshot(update=None)["value"] == 1
+    assert p.snapshot(update=False)["value"] == 1
+
+
+def test_modified_snapshot_does_not_change_memo() -> None:
+    p = Parameter("p", set_cmd=None, get_cmd=None, initial_value=1)
+    snap = p.snapshot()
+    snap["value"] = 2
+    assert p.snapshot()["value"] == 1
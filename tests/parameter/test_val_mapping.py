@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 import qcodes.validators as vals
@@ -62,6 +63,52 @@ def test_val_mapping_basic() -> None:
     assert p.get_latest() == "on"
 
 
+def test_val_mapping_of_arrays() -> None:
+    mem = ParameterMemory()
+
+    p = Parameter(
+        "p",
+        set_cmd=mem.set,
+        get_cmd=mem.get,
+        val_mapping={"off": 0, "on": 1, "auto": 5},
+    )
+    # the Enum validator of the val_mapping only accepts single values
+    p.remove_validator()
+
+    p(np.array(["on", "auto", "off", "on"]))
+    np.testing.assert_array_equal(mem.get(), [1, 5, 0, 1])
+
+    mem.set(np.array([[5, 0], [1, 1]]))
+    np.testing.assert_array_equal(p(), [["auto", "off"], ["on", "on"]])
+
+    # values that are not in the lookup table are mapped element by element
+    mem.set(np.array(["0", "5"]))
+    np.testing.assert_array_equal(p(), ["off", "auto"])
+
+    mem.set(np.array([1, 2]))
+    with pytest.raises(KeyError, match="'2' not in val_mapping"):
+        p()
+
+
+def test_val_mapping_of_arrays_with_mixed_types() -> None:
+    mem = ParameterMemory()
+
+    p = Parameter(
+        "p",
+        set_cmd=mem.set,
+        get_cmd=mem.get,
+        val_mapping={True: 1, False: 0, "unknown": "?"},
+    )
+    p.remove_validator()
+
+    mem.set(np.array([1, 0, 1]))
+    result = p()
+    assert result.tolist() == [True, False, True]
+
+    p(np.array([False, True]))
+    assert mem.get().tolist() == [0, 1]
+
+
 def test_val_mapping_with_parsers() -> None:
     # We store value external to cache
     # to allow testing of interaction with cache
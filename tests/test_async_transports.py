@@ -0,0 +1,132 @@
+import asyncio
+import socketserver
+import threading
+
+import pytest
+
+from qcodes.instrument import IPInstrument
+from tests.test_visa import MockVisa
+
+
+class _EchoHandler(socketserver.StreamRequestHandler):
+    """
+    Answer every query ending in ``?`` with ``<query>:<connection count>``
+    and record all other commands.
+    """
+
+    def handle(self) -> None:
+        server: _EchoServer = self.server  # type: ignore[assignment]
+        server.connections += 1
+        connection = server.connections
+        try:
+            for line in self.rfile:
+                cmd = line.decode().strip()
+                server.commands.append(cmd)
+                if cmd.endswith("?"):
+                    self.wfile.write(f"{cmd}:{connection}\n".encode())
+        except ConnectionResetError:
+            pass
+
+
+class _EchoServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _EchoHandler)
+        self.connections = 0
+        self.commands: list[str] = []
+
+
+@pytest.fixture(name="echo_server")
+def _make_echo_server():
+    server = _EchoServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(name="ip_instrument")
+def _make_ip_instrument(echo_server):
+    host, port = echo_server.server_address
+    instr = IPInstrument(
+        "ip_instrument", address=host, port=port, write_confirmation=False
+    )
+    try:
+        yield instr
+    finally:
+        instr.close()
+
+
+@pytest.mark.asyncio
+async def test_ip_instrument_async_ask(ip_instrument, echo_server) -> None:
+    answers = await asyncio.gather(
+        *(ip_instrument.async_ask(f"CH{i}?") for i in range(5))
+    )
+    assert [answer.strip() for answer in answers] == [f"CH{i}?:1" for i in range(5)]
+    await ip_instrument.async_write("OUTP ON")
+
+    # the synchronous interface keeps working on the same connection
+    assert ip_instrument.ask("SYNC?").strip() == "SYNC?:1"
+    assert ip_instrument._socket is not None
+    assert ip_instrument._socket.gettimeout() == ip_instrument._timeout
+    assert echo_server.connections == 1
+    assert "OUTP ON" in echo_server.commands
+
+
+@pytest.mark.asyncio
+async def test_ip_instrument_async_and_threaded_ask(ip_instrument) -> None:
+    n_queries = 50
+    thread_answers: list[str] = []
+
+    def ask_in_thread() -> None:
+        for i in range(n_queries):
+            thread_answers.append(ip_instrument.ask(f"T{i}?").strip())
+
+    thread = threading.Thread(target=ask_in_thread)
+    thread.start()
+    answers = [
+        (await ip_instrument.async_ask(f"A{i}?")).strip() for i in range(n_queries)
+    ]
+    await asyncio.to_thread(thread.join)
+
+    assert answers == [f"A{i}?:1" for i in range(n_queries)]
+    assert thread_answers == [f"T{i}?:1" for i in range(n_queries)]
+
+
+@pytest.mark.asyncio
+async def test_ip_instrument_async_ask_timeout(ip_instrument, echo_server) -> None:
+    ip_instrument.set_timeout(0.1)
+    # commands without a question mark are not answered
+    with pytest.raises(TimeoutError):
+        await ip_instrument.async_ask("SILENT")
+    # the connection is opened again for the next query
+    assert (await ip_instrument.async_ask("NEXT?")).strip() == "NEXT?:2"
+    assert ip_instrument.ask("SYNC?").strip() == "SYNC?:2"
+    assert echo_server.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_visa_async_socket(echo_server, monkeypatch) -> None:
+    host, port = echo_server.server_address
+    instr = MockVisa("async_visa", f"TCPIP0::{host}::{port}::SOCKET", async_socket=True)
+    try:
+        instr.visa_handle.write_termination = "\n"
+        instr.visa_handle.read_termination = "\n"
+        monkeypatch.setattr(instr, "_get_visa_timeout", lambda: 1.0)
+        answers = await asyncio.gather(*(instr.async_ask(f"M{i}?") for i in range(3)))
+        assert answers == [f"M{i}?:1" for i in range(3)]
+        await instr.async_write("OUTP OFF")
+        assert await instr.async_ask("LAST?") == "LAST?:1"
+        assert echo_server.commands[-2:] == ["OUTP OFF", "LAST?"]
+    finally:
+        instr.close()
+
+
+def test_visa_async_socket_requires_socket_resource() -> None:
+    with pytest.raises(ValueError, match="TCPIP SOCKET"):
+        MockVisa("async_visa", "GPIB::1::INSTR", async_socket=True)
@@ -1,8 +1,11 @@
 import json
 import os
 import tempfile
+import threading
+import time
 import warnings
 from contextlib import contextmanager
+from functools import partial
 from io import StringIO
 from pathlib import Path
 
@@ -202,6 +205,90 @@ def test_snapshot() -> None:
     assert component_snapshot == snapshot["components"]["component"]
 
 
+class SlowInstrument(Instrument):
+    def __init__(self, name: str, n_params: int = 2, get_time: float = 0.0):
+        super().__init__(name)
+        self.get_threads: set[int] = set()
+        self.release = threading.Event()
+        self.release.set()
+        self.barrier: threading.Barrier | None = None
+        for i in range(n_params):
+            self.add_parameter(f"p{i}", get_cmd=partial(self._get, i, get_time))
+
+    def _get(self, value: int, get_time: float) -> int:
+        self.get_threads.add(threading.get_ident())
+        if self.barrier is not None:
+            self.barrier.wait()
+        time.sleep(get_time)
+        self.release.wait()
+        return value
+
+    def get_idn(self) -> dict[str, str | None]:
+        return {"vendor": None, "model": None, "serial": None, "firmware": None}
+
+
+def test_parallel_snapshot() -> None:
+    slow_1 = SlowInstrument("slow_1")
+    slow_2 = SlowInstrument("slow_2")
+    station = Station(slow_1, slow_2, parallel_snapshot=True)
+    slow_1.get_threads.clear()
+    slow_2.get_threads.clear()
+    # the gets of the two instruments wait for each other, which only
+    # completes if the instruments are snapshotted concurrently
+    slow_1.barrier = slow_2.barrier = threading.Barrier(2, timeout=10)
+
+    snapshot = station.snapshot(update=True)
+
+    assert list(snapshot["instruments"]) == ["slow_1", "slow_2"]
+    assert "stale_instruments" not in snapshot
+    assert snapshot["instruments"]["slow_2"]["parameters"]["p1"]["value"] == 1
+    # each instrument is snapshotted in its own thread
+    assert len(slow_1.get_threads) == 1
+    assert len(slow_2.get_threads) == 1
+    assert threading.get_ident() not in slow_1.get_threads | slow_2.get_threads
+
+
+def test_snapshot_timeout_marks_parameters_stale() -> None:
+    slow = SlowInstrument("slow", n_params=3, get_time=0.2)
+    station = Station(slow, snapshot_timeout=0.3)
+    slow.p2.cache.set(5)
+
+    snapshot = station.snapshot(update=True)
+
+    slow_snapshot = snapshot["instruments"]["slow"]
+    assert slow_snapshot["stale_parameters"] == ["p2"]
+    assert slow_snapshot["parameters"]["p1"]["value"] == 1
+    # the stale parameter is snapshotted from its cache
+    assert slow_snapshot["parameters"]["p2"]["value"] == 5
+
+    # without updates the time budget is not used
+    assert "stale_parameters" not in slow.snapshot(update=False)
+
+
+def test_parallel_snapshot_timeout_uses_cached_values() -> None:
+    responsive = SlowInstrument("responsive")
+    slow = SlowInstrument("slow", get_time=0.5)
+    station = Station(responsive, slow, parallel_snapshot=True, snapshot_timeout=0.2)
+    slow.p0.cache.set(7)
+    slow.p1.cache.set(8)
+    slow.get_threads.clear()
+
+    snapshot = station.snapshot(update=True)
+
+    assert snapshot["stale_instruments"] == ["slow"]
+    slow_snapshot = snapshot["instruments"]["slow"]
+    # the query in progress at the timeout is completed, the parameters
+    # after it are snapshotted from their cache
+    assert slow_snapshot["parameters"]["p0"]["value"] == 0
+    assert slow_snapshot["parameters"]["p1"]["value"] == 8
+    assert slow_snapshot["stale_parameters"] == ["p1"]
+    assert snapshot["instruments"]["responsive"]["parameters"]["p1"]["value"] == 1
+    # the snapshot thread is done when the snapshot returns
+    assert not any(
+        thread.name == "Station snapshot slow" for thread in threading.enumerate()
+    )
+
+
 def test_station_after_instrument_is_closed() -> None:
     """
     Test that station is aware of the fact that its components could be
@@ -9,7 +9,11 @@ from typing import Any
 
 import pytest
 
-from qcodes.dataset.threading import ThreadPoolParamsCaller, call_params_threaded
+from qcodes.dataset.threading import (
+    InstrumentWorkersParamsCaller,
+    ThreadPoolParamsCaller,
+    call_params_threaded,
+)
 from qcodes.instrument_drivers.mock_instruments import DummyInstrument
 from qcodes.parameters import Parameter, ParamRawDataType
 
@@ -104,3 +108,52 @@ def test_thread_pool_params_caller(dummy_1, dummy_2) -> None:
         assert {
             frozenset(value) for value in params_per_thread_id.values()
         } == expected_params_per_thread
+
+
+def test_instrument_workers_params_caller(dummy_1, dummy_2) -> None:
+    params = (
+        dummy_1.voltage_1,
+        dummy_1.voltage_2,
+        dummy_2.voltage_1,
+        dummy_2.voltage_2,
+    )
+
+    with InstrumentWorkersParamsCaller(*params) as caller:
+        output1 = caller()
+        output2 = caller()
+
+    # results are grouped per instrument in a fixed order
+    assert [param for param, _ in output1] == list(params)
+    assert [param for param, _ in output2] == list(params)
+
+    thread_ids = {param: thread_id for param, thread_id in output1}
+    assert thread_ids[dummy_1.voltage_1] == thread_ids[dummy_1.voltage_2]
+    assert thread_ids[dummy_2.voltage_1] == thread_ids[dummy_2.voltage_2]
+    assert thread_ids[dummy_1.voltage_1] != thread_ids[dummy_2.voltage_1]
+    # the same worker thread is reused for every call
+    assert dict(output2) == thread_ids
+
+    statistics = caller.timing_statistics
+    assert set(statistics) == {"dummy_1", "dummy_2"}
+    for stats in statistics.values():
+        assert stats.count == 2
+        assert 0.2 <= stats.total
+        assert 0.1 <= stats.min <= stats.mean <= stats.max
+        assert stats.last >= 0.1
+
+
+def test_instrument_workers_params_caller_raises(dummy_1, dummy_2) -> None:
+    def failing_get() -> None:
+        raise RuntimeError("failed to get")
+
+    dummy_2.add_parameter("failing", get_cmd=failing_get)
+
+    with InstrumentWorkersParamsCaller(dummy_1.voltage_1, dummy_2.failing) as caller:
+        with pytest.raises(RuntimeError, match="failed to get"):
+            caller()
+        # the caller can still be used after a failure
+        with pytest.raises(RuntimeError, match="failed to get"):
+            caller()
+
+    with pytest.raises(RuntimeError, match="context manager"):
+        caller()
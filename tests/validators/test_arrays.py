@@ -242,3 +242,35 @@ def test_repr() -> None:
         r"at 0x[a-fA-F0-9]*>, 2\)>",
         str(c),
     )
+
+
+def test_min_max_of_large_arrays() -> None:
+    a = Arrays(min_value=-1, max_value=1)
+    # larger than one chunk of the reduction
+    value = np.zeros(1_000_000)
+    a.validate(value)
+    a.validate(value.reshape(1000, 1000).T)
+    a.validate(value[::3])
+
+    for invalid in (2.0, -2.0, np.nan):
+        value[-1] = invalid
+        with pytest.raises(ValueError, match="all values must be between"):
+            a.validate(value)
+        with pytest.raises(ValueError, match="all values must be between"):
+            a.validate(value.reshape(1000, 1000).T)
+        with pytest.raises(ValueError, match="all values must be between"):
+            a.validate(value[::3])
+        value[-1] = 0
+
+    Arrays(max_value=1).validate(np.full(10, -np.inf))
+    with pytest.raises(ValueError):
+        Arrays(min_value=0).validate(np.full(10, -np.inf))
+
+
+def test_valid_types_can_be_changed() -> None:
+    a = Arrays()
+    a.validate(np.arange(3))
+    a.valid_types = (np.floating,)
+    with pytest.raises(TypeError):
+        a.validate(np.arange(3))
+    a.validate(np.arange(3.0))
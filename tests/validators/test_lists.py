@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from qcodes.validators import Ints, Lists
+from qcodes.validators import Ints, Lists, Numbers
 
 if TYPE_CHECKING:
     import numpy as np
@@ -32,3 +32,22 @@ def test_valid_values() -> None:
     val = Lists(Ints(max_value=10))
     for vval in val.valid_values:
         val.validate(vval)
+
+
+def test_elt_vals_of_long_lists_are_compared_exactly() -> None:
+    floats: list[Any] = [1.0] * 70
+    ints: list[Any] = [1] * 70
+
+    # a mix of ints and floats is converted to floats by NumPy, which do not
+    # represent 2**53 + 1 exactly
+    numbers = Lists(Numbers(0, 2**53))
+    with pytest.raises(ValueError, match="9007199254740993 is invalid"):
+        numbers.validate([*floats, 2**53 + 1])
+    with pytest.raises(ValueError, match="9007199254740993 is invalid"):
+        numbers.validate([*ints, 2**53 + 1])
+
+    # 2**53 + 3 rounds up to the float 2**53 + 4
+    float_numbers = Lists(Numbers(0, 2**53 + 3))
+    with pytest.raises(ValueError, match="9007199254740996.0 is invalid"):
+        float_numbers.validate([*floats, 2.0**53 + 4])
+    float_numbers.validate([*floats, 2.0**53 + 2])
@@ -1,6 +1,9 @@
+from typing import Any
+
+import numpy as np
 import pytest
 
-from qcodes.validators import Ints, Sequence
+from qcodes.validators import Ints, Numbers, PermissiveInts, Sequence
 
 
 def test_type() -> None:
@@ -61,3 +64,32 @@ def test_sorted() -> None:
     v4 = [1, 7, 2]
     with pytest.raises(ValueError, match="is required to be sorted"):
         sequence_validator.validate(v4)
+
+
+def test_elt_vals_of_long_sequences() -> None:
+    numbers = Sequence(Numbers(-1, 1))
+    values: list[Any] = [0.5, -1, True, np.float32(0.25), np.int8(1)] * 10
+    numbers.validate(values)
+    numbers.validate(tuple(values))
+
+    for invalid, error, match in (
+        (2, ValueError, "2 is invalid: must be between"),
+        (np.nan, ValueError, "nan is invalid: must be between"),
+        ("a", TypeError, "'a' is not an int or float"),
+        (1j, TypeError, "1j is not an int or float"),
+        (np.array(0.5), TypeError, "is not an int or float"),
+    ):
+        with pytest.raises(error, match=match):
+            numbers.validate([*values, invalid, *values])
+
+    ints = Sequence(Ints(0, 2**64))
+    ints.validate([1, 2**63, 2**64, np.uint64(5)] * 10)
+    with pytest.raises(ValueError, match="18446744073709551617 is invalid"):
+        ints.validate([1, 2**63, 2**64 + 1, np.uint64(5)] * 10)
+    with pytest.raises(TypeError, match="0.5 is not an int"):
+        ints.validate([1] * 20 + [0.5])
+
+    permissive_ints = Sequence(PermissiveInts(0, 2))
+    permissive_ints.validate([0, 1.0, 2] * 10)
+    with pytest.raises(TypeError, match="0.5 is not an int"):
+        permissive_ints.validate([0, 1.0, 2] * 10 + [0.5])